@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the tech radar updater
+Replays recorded API payloads through a local stub and times the pipeline on synthetic trend sets
+"""
+
+import argparse
+import json
+import pathlib
+import random
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import requests
+
+from model_registry import ModelRegistry
+from parallel_scoring import ParallelScorer, categorize_chunk, sentiment_chunk
+from streaming_pipeline import StreamingRadarPipeline
+from trend_table import TrendTable
+from update_tech_radar_ai_fixed import AITechRadarUpdaterFixed
+from quantized_similarity import QUANTIZATION_MODES, QuantizedMatrix, SimilarityKernel, similarity_drift
+from vector_index import ExactIndex, make_index, recall_at_k
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+FIXTURES_DIR = ROOT / "data" / "fixtures"
+GITHUB_FIXTURE = FIXTURES_DIR / "github_search.json"
+STACKOVERFLOW_FIXTURE = FIXTURES_DIR / "stackoverflow_tags.json"
+
+# Backend combinations to compare; each entry is a config override
+BACKENDS = {
+    "keywords": {
+        "model_backends": {"torch": False},
+        "embedding_backend": "none",
+    },
+    "hashed": {
+        "model_backends": {"torch": False},
+        "embedding_backend": "hashed",
+    },
+    "hashed-embeddings": {
+        "model_backends": {"torch": False},
+        "embedding_backend": "hashed",
+        "categorization_method": "embeddings",
+    },
+    "minilm": {
+        "model_backends": {},
+        "embedding_backend": "minilm",
+    },
+    "minilm-embeddings": {
+        "model_backends": {},
+        "embedding_backend": "minilm",
+        "categorization_method": "embeddings",
+    },
+}
+
+# Interest index settings compared against exact search
+INDEX_VARIANTS = {
+    "ivf nprobe=4": ("ivf", {"nprobe": 4}),
+    "ivf nprobe=8": ("ivf", {"nprobe": 8}),
+    "ivf nprobe=16": ("ivf", {"nprobe": 16}),
+    "hnsw ef=64": ("hnsw", {"ef": 64}),
+}
+
+# Backends a combination needs before it is worth timing
+REQUIRED_BACKENDS = {
+    "keywords": [],
+    "hashed": [],
+    "hashed-embeddings": [],
+    "minilm": ["sentence_transformer"],
+    "minilm-embeddings": ["sentence_transformer"],
+}
+
+
+def load_fixtures() -> Dict[str, Dict]:
+    """Load the recorded GitHub and Stack Exchange payloads"""
+    return {
+        "github": json.loads(GITHUB_FIXTURE.read_text()),
+        "stackoverflow": json.loads(STACKOVERFLOW_FIXTURE.read_text()),
+    }
+
+
+def record_fixtures():
+    """Refresh the fixtures from the live APIs"""
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    github = requests.get(
+        "https://api.github.com/search/repositories",
+        params={"q": "created:>2024-01-01 stars:>100", "sort": "stars", "order": "desc", "per_page": 100},
+        timeout=30
+    )
+    github.raise_for_status()
+    GITHUB_FIXTURE.write_text(json.dumps(github.json(), indent=2))
+
+    tags = requests.get(
+        "https://api.stackexchange.com/2.3/tags",
+        params={"order": "desc", "sort": "popular", "site": "stackoverflow", "pagesize": 100},
+        timeout=30
+    )
+    tags.raise_for_status()
+    STACKOVERFLOW_FIXTURE.write_text(json.dumps(tags.json(), indent=2))
+    print(f"📼 Recorded fixtures to {FIXTURES_DIR}")
+
+
+class FixtureServer:
+    """Local stub that serves the fixtures with GitHub and Stack Exchange pagination"""
+
+    def __init__(self, fixtures: Dict[str, Dict], latency_ms: int = 0):
+        self.fixtures = fixtures
+        self.latency = latency_ms / 1000
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.make_handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    def page_items(self, items: List[Dict], page: int, size: int, key: str) -> List[Dict]:
+        """Cycle through the recorded items so any page number returns data"""
+        result = []
+        for offset in range((page - 1) * size, page * size):
+            item = dict(items[offset % len(items)])
+            if offset >= len(items):
+                item[key] = f"{item[key]}-{offset // len(items)}"
+                if "full_name" in item:
+                    item["full_name"] = f"{item['full_name']}-{offset // len(items)}"
+            result.append(item)
+        return result
+
+    def make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                parsed = urllib.parse.urlparse(self.path)
+                params = dict(urllib.parse.parse_qsl(parsed.query))
+                page = int(params.get("page", 1))
+                time.sleep(stub.latency)
+
+                if parsed.path.endswith("/search/repositories"):
+                    items = stub.fixtures["github"]["items"]
+                    size = int(params.get("per_page", 30))
+                    body = {"total_count": len(items), "items": stub.page_items(items, page, size, "name")}
+                elif parsed.path.endswith("/tags"):
+                    items = stub.fixtures["stackoverflow"]["items"]
+                    size = int(params.get("pagesize", 30))
+                    body = {"items": stub.page_items(items, page, size, "name"), "has_more": True}
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def synthetic_trends(fixtures: Dict[str, Dict], count: int, seed: int = 42) -> List[Dict]:
+    """Generate trend records shaped like fetched trends, built from fixture vocabulary"""
+    rng = random.Random(seed)
+    repos = fixtures["github"]["items"]
+    tags = fixtures["stackoverflow"]["items"]
+    words = sorted({word for repo in repos for word in (repo.get("description") or "").split()})
+
+    trends = []
+    for index in range(count):
+        if index % 5 == 4:
+            tag = tags[index % len(tags)]
+            name = f"{tag['name']}-{index}"
+            trends.append({
+                "name": name,
+                "count": rng.randint(1000, 2_000_000),
+                "description": f"Popular {name} technology with {tag['count']} questions",
+                "source": "stackoverflow"
+            })
+            continue
+
+        repo = repos[index % len(repos)]
+        description = " ".join(rng.sample(words, min(len(words), rng.randint(6, 14))))
+        trends.append({
+            "name": f"{repo['name']}-{index}",
+            "description": description,
+            "language": repo.get("language") or "Python",
+            "stars": rng.randint(100, 50_000),
+            "forks": rng.randint(0, 5_000),
+            "url": f"{repo['html_url']}-{index}",
+            "created_at": repo["created_at"],
+            "updated_at": repo["updated_at"],
+            "topics": rng.sample(repo.get("topics", []), len(repo.get("topics", []))),
+            "full_name": f"{repo['full_name']}-{index}",
+            "source": "github"
+        })
+    return trends
+
+
+def make_updater(backend: str, workdir: pathlib.Path) -> AITechRadarUpdaterFixed:
+    """Updater configured for one backend combination, writing only into workdir"""
+    updater = AITechRadarUpdaterFixed()
+    overrides = BACKENDS[backend]
+    updater.config.update({key: value for key, value in overrides.items() if key != "model_backends"})
+    updater.models = ModelRegistry(overrides["model_backends"])
+    updater.embedding_cache = None
+    updater.metrics.enabled = False
+    updater.tech_data_path = workdir / "tech_trends_ai_fixed.json"
+    updater.tech_table_path = workdir / "tech_trends_ai_fixed.table"
+    updater.tech_jsonl_path = workdir / "tech_trends_ai_fixed.jsonl"
+    return updater
+
+
+def backend_available(updater: AITechRadarUpdaterFixed, backend: str) -> bool:
+    return all(updater.models.has(name) for name in REQUIRED_BACKENDS[backend])
+
+
+def timed(func: Callable) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench_fetch(fixtures: Dict[str, Dict], workdir: pathlib.Path, latency_ms: int) -> Dict:
+    """Time fetch_all_trends against the stub server"""
+    with FixtureServer(fixtures, latency_ms) as stub:
+        updater = make_updater("keywords", workdir)
+        updater.config["http_cache"] = {"enabled": False}
+        for source in ("github", "stackoverflow"):
+            updater.config["sources"].setdefault(source, {})["api_url"] = stub.url
+        trends = []
+        seconds = timed(lambda: trends.extend(updater.fetch_all_trends()))
+    return {"stage": "fetch_all_trends", "backend": "stub", "size": len(trends), "seconds": round(seconds, 4)}
+
+
+def bench_pipeline(fixtures: Dict[str, Dict], sizes: List[int], backends: List[str],
+                   workdir: pathlib.Path, per_item_limit: int) -> List[Dict]:
+    """Time enhancement, radar generation and snapshot saving per size and backend"""
+    results = []
+    for backend in backends:
+        updater = make_updater(backend, workdir)
+        if not backend_available(updater, backend):
+            print(f"⏭️  Skipping {backend}: required backends unavailable")
+            results.append({"stage": "all", "backend": backend, "skipped": True})
+            continue
+
+        for size in sizes:
+            trends = synthetic_trends(fixtures, size)
+            print(f"🏁 {backend} x {size}")
+
+            if size <= per_item_limit:
+                seconds = timed(lambda: [updater.enhance_trend_with_ai(trend) for trend in trends])
+                results.append({"stage": "enhance_trend_with_ai", "backend": backend,
+                                "size": size, "seconds": round(seconds, 4)})
+
+            enhanced = []
+            seconds = timed(lambda: enhanced.extend(updater.enhance_trends_with_ai(trends, incremental=False)))
+            results.append({"stage": "enhance_trends_with_ai", "backend": backend,
+                            "size": size, "seconds": round(seconds, 4)})
+
+            seconds = timed(lambda: updater.generate_enhanced_radar(list(enhanced)))
+            results.append({"stage": "generate_enhanced_radar", "backend": backend,
+                            "size": size, "seconds": round(seconds, 4)})
+
+            seconds = timed(lambda: updater.save_enhanced_tech_data(enhanced))
+            results.append({"stage": "save_enhanced_tech_data", "backend": backend,
+                            "size": size, "seconds": round(seconds, 4)})
+    return results
+
+
+def bench_scoring_pool(fixtures: Dict[str, Dict], sizes: List[int], processes: int,
+                       workdir: pathlib.Path) -> List[Dict]:
+    """Keyword categorization and sentiment in-process vs across the scoring pool, to set min_batch"""
+    results = []
+    updater = make_updater("keywords", workdir)
+    pool = ParallelScorer(updater.config, processes=processes, min_batch=0)
+    if not pool.worth_it(max(sizes, default=0)):
+        print("⏭️  Skipping scoring pool: one process, nothing to compare")
+        return [{"stage": "scoring_pool", "backend": "pool", "skipped": True}]
+
+    # Worker start-up is paid once per run, so it is reported apart from the per-batch times
+    seconds = timed(lambda: pool.map(categorize_chunk, ["warm up"] * pool.processes))
+    results.append({"stage": "scoring_pool:startup", "backend": f"pool x{pool.processes}",
+                    "size": 0, "seconds": round(seconds, 4)})
+
+    crossover = None
+    try:
+        for size in sizes:
+            texts = [updater.keyword_text(trend) for trend in synthetic_trends(fixtures, size)]
+            in_process = timed(lambda: (updater.categorize_texts(texts), updater.keyword_sentiment_batch(texts)))
+            pooled = timed(lambda: (pool.map(categorize_chunk, texts), pool.map(sentiment_chunk, texts, False)))
+            results.append({"stage": "scoring_pool:in_process", "backend": "keywords",
+                            "size": size, "seconds": round(in_process, 4)})
+            results.append({"stage": "scoring_pool:pool", "backend": f"pool x{pool.processes}",
+                            "size": size, "seconds": round(pooled, 4)})
+            if crossover is None and pooled < in_process:
+                crossover = size
+    finally:
+        pool.close()
+
+    if crossover is None:
+        print(f"🧮 Scoring pool: never faster than in-process up to {max(sizes)} items - leave it disabled")
+    else:
+        print(f"🧮 Scoring pool: faster from {crossover} items - a measured parallel_scoring.min_batch")
+    return results
+
+
+def run_batch(updater: AITechRadarUpdaterFixed):
+    """The list-at-every-step pipeline of run(), minus the change check"""
+    enhanced = updater.enhance_trends_with_ai(updater.fetch_all_trends())
+    updater.update_readme_tech_radar(updater.generate_enhanced_radar(enhanced))
+    updater.save_enhanced_tech_data(enhanced)
+
+
+def run_columnar(updater: AITechRadarUpdaterFixed):
+    """The columnar pipeline of run(): scores are written into the table batch by batch"""
+    table = TrendTable.from_records(
+        updater.fetch_all_trends(), exclude=updater.SCORE_FIELDS + updater.OPTIONAL_SCORE_FIELDS
+    )
+    updater.score_trend_table(table)
+    updater.update_readme_tech_radar(updater.generate_enhanced_radar(table))
+    updater.save_enhanced_tech_data(table)
+
+
+def bench_streaming(fixtures: Dict[str, Dict], sizes: List[int], workdir: pathlib.Path) -> List[Dict]:
+    """Wall time and peak traced memory of the batch, columnar and streaming pipelines as fetch limits grow"""
+    results = []
+    with FixtureServer(fixtures) as stub:
+        for size in sizes:
+            for mode in ("batch", "columnar", "stream"):
+                updater = make_updater("keywords", workdir)
+                updater.config["http_cache"] = {"enabled": False}
+                updater.config["incremental_scoring"] = False
+                updater.config["sources"]["github"].update({"api_url": stub.url, "max_repos": size})
+                updater.config["sources"]["stackoverflow"].update({"api_url": stub.url, "max_tags": size})
+                updater.history = None
+                updater.radar_path = workdir / "radar.md"
+                for path in workdir.glob("tech_trends_ai_fixed*"):
+                    if path.is_dir():
+                        shutil.rmtree(path)
+                    else:
+                        path.unlink()
+                print(f"🏁 {mode} x {size}")
+
+                if mode == "stream":
+                    updater.snapshot_format = "jsonl"
+                    run = StreamingRadarPipeline(updater).run
+                elif mode == "columnar":
+                    updater.snapshot_format = "columnar"
+                    run = lambda: run_columnar(updater)
+                else:
+                    run = lambda: run_batch(updater)
+                tracemalloc.start()
+                seconds = timed(run)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                results.append({"stage": f"pipeline:{mode}", "backend": "stub", "size": size,
+                                "seconds": round(seconds, 4), "peak_mb": round(peak / 2 ** 20, 1)})
+    return results
+
+
+def clustered_vectors(count: int, dim: int, rng: np.random.RandomState, centers: np.ndarray) -> np.ndarray:
+    """Unit vectors scattered around shared centers, shaped like sentence embeddings"""
+    vectors = centers[rng.randint(len(centers), size=count)] + 0.5 * rng.randn(count, dim)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def bench_index(sizes: List[int], queries: int = 2000, dim: int = 384, k: int = 10) -> List[Dict]:
+    """Build time, query latency and recall@k of each interest index against exact search"""
+    results = []
+    rng = np.random.RandomState(7)
+    centers = rng.randn(64, dim)
+    query_vectors = clustered_vectors(queries, dim, rng, centers)
+
+    for size in sizes:
+        interests = clustered_vectors(size, dim, rng, centers)
+        exact = ExactIndex()
+        exact.build(interests)
+        for name, (kind, params) in INDEX_VARIANTS.items():
+            index = make_index(kind, params)
+            if index.kind != kind:
+                results.append({"stage": "interest_index", "backend": name, "skipped": True})
+                continue
+            build_seconds = timed(lambda: index.build(interests))
+            check = recall_at_k(index, exact, query_vectors, k)
+            print(f"🔎 {name} x {size}: recall@{k} {check['recall']}, "
+                  f"{check['index_seconds']}s vs exact {check['exact_seconds']}s")
+            results.append({"stage": "interest_index", "backend": name, "size": size,
+                            "seconds": check["index_seconds"], "exact_seconds": check["exact_seconds"],
+                            "build_seconds": round(build_seconds, 4), "recall": check["recall"]})
+    return results
+
+
+def benchmark_embeddings(fixtures: Dict[str, Dict], size: int, interests: int) -> Dict[str, np.ndarray]:
+    """MiniLM embeddings of synthetic trends and interests, or clustered vectors without the model"""
+    updater = make_updater("minilm", pathlib.Path(tempfile.gettempdir()))
+    if updater.ai_available() and updater.models.has("sentence_transformer"):
+        trends = synthetic_trends(fixtures, size + interests)
+        texts = [f"{trend['name']} {trend.get('description', '')}" for trend in trends]
+        vectors = updater.encode_texts(texts)
+        return {"source": "minilm", "queries": vectors[:size], "reference": vectors[size:]}
+
+    rng = np.random.RandomState(11)
+    centers = rng.randn(64, 384)
+    return {
+        "source": "synthetic",
+        "queries": clustered_vectors(size, 384, rng, centers),
+        "reference": clustered_vectors(interests, 384, rng, centers),
+    }
+
+
+def bench_quantization(fixtures: Dict[str, Dict], size: int = 2000, interests: int = 10000) -> List[Dict]:
+    """Kernel latency, memory and score drift of each storage precision against float32"""
+    results = []
+    data = benchmark_embeddings(fixtures, size, interests)
+    for mode in QUANTIZATION_MODES:
+        kernel = SimilarityKernel(QuantizedMatrix.from_float(data["reference"], mode))
+        kernel.max_scores(data["queries"])
+        seconds = timed(lambda: kernel.max_scores(data["queries"]))
+        drift = similarity_drift(data["reference"], data["queries"], mode)
+        print(f"🧮 {mode} ({data['source']}): {drift['bytes']} bytes, max error {drift['max_abs_error']}, "
+              f"top-1 agreement {drift['top1_agreement']}")
+        results.append({"stage": "quantized_similarity", "backend": mode, "size": interests,
+                        "seconds": round(seconds, 4), "embeddings": data["source"], **drift})
+    return results
+
+
+def fixture_trends(updater: AITechRadarUpdaterFixed, fixtures: Dict[str, Dict]) -> List[Dict]:
+    return (updater.build_github_trends(fixtures["github"]["items"])
+            + updater.build_stackoverflow_trends(fixtures["stackoverflow"]["items"]))
+
+
+def rank_correlation(first: np.ndarray, second: np.ndarray) -> float:
+    """Spearman correlation, ties broken by position"""
+    first_ranks = np.argsort(np.argsort(first)).astype(np.float64)
+    second_ranks = np.argsort(np.argsort(second)).astype(np.float64)
+    return float(np.corrcoef(first_ranks, second_ranks)[0, 1])
+
+
+def bench_embedding_quality(fixtures: Dict[str, Dict], workdir: pathlib.Path, k: int = 10) -> List[Dict]:
+    """Cold-start latency of each embedding backend, and how closely hashed ranking tracks MiniLM's"""
+    scored = {}
+    results = []
+    for backend in ("hashed-embeddings", "minilm-embeddings"):
+        # A fresh updater per backend, so model loading and IDF fitting count towards the time
+        updater = make_updater(backend, workdir)
+        start = time.perf_counter()
+        if not backend_available(updater, backend):
+            print(f"⏭️  Skipping {backend} quality: required backends unavailable")
+            results.append({"stage": "relevance_quality", "backend": backend, "skipped": True})
+            continue
+        trends = fixture_trends(updater, fixtures)
+        relevance = np.array(updater.calculate_relevance_batch(trends))
+        categories = [category for category, _ in updater.ai_categorize_batch(trends)]
+        seconds = time.perf_counter() - start
+        scored[backend] = (relevance, categories)
+        results.append({"stage": "relevance_quality", "backend": backend, "size": len(trends),
+                        "seconds": round(seconds, 4)})
+
+    if len(scored) == 2:
+        (hashed, hashed_categories), (minilm, minilm_categories) = scored.values()
+        top_hashed = set(np.argsort(-hashed, kind="stable")[:k])
+        top_minilm = set(np.argsort(-minilm, kind="stable")[:k])
+        quality = {
+            "spearman": round(rank_correlation(hashed, minilm), 4),
+            f"top{k}_overlap": round(len(top_hashed & top_minilm) / k, 4),
+            "category_agreement": round(float(np.mean([
+                first == second for first, second in zip(hashed_categories, minilm_categories)
+            ])), 4),
+        }
+        results[0].update(quality)
+        print(f"📐 hashed vs MiniLM on {len(hashed)} fixture trends: spearman {quality['spearman']}, "
+              f"top-{k} overlap {quality[f'top{k}_overlap']}, category agreement {quality['category_agreement']}")
+    return results
+
+
+def compare(results: List[Dict], baseline: Optional[List[Dict]], threshold: float) -> List[Dict]:
+    """Attach the ratio against a previous report and flag regressions"""
+    previous = {
+        (row["stage"], row["backend"], row.get("size")): row["seconds"]
+        for row in baseline or [] if "seconds" in row
+    }
+    for row in results:
+        old = previous.get((row["stage"], row["backend"], row.get("size")))
+        if old and "seconds" in row:
+            row["baseline_seconds"] = old
+            row["ratio"] = round(row["seconds"] / old, 3) if old > 0 else None
+            row["regression"] = bool(row["ratio"] and row["ratio"] > threshold)
+    return results
+
+
+def write_report(results: List[Dict], output_dir: pathlib.Path):
+    """Write report.json and a Markdown comparison table"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "report.json").write_text(json.dumps({
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results
+    }, indent=2))
+
+    lines = [
+        "| Stage | Backend | Size | Seconds | Baseline | Ratio | Recall | Peak MB |",
+        "|---|---|---|---|---|---|---|---|",
+    ]
+    for row in results:
+        if row.get("skipped"):
+            lines.append(f"| {row['stage']} | {row['backend']} | - | skipped | - | - | - | - |")
+            continue
+        flag = " ⚠️" if row.get("regression") else ""
+        lines.append(
+            f"| {row['stage']} | {row['backend']} | {row['size']} | {row['seconds']:.4f} | "
+            f"{row.get('baseline_seconds', '-')} | {row.get('ratio', '-')}{flag} | {row.get('recall', '-')} | "
+            f"{row.get('peak_mb', '-')} |"
+        )
+    (output_dir / "report.md").write_text("\n".join(lines) + "\n")
+    print(f"📝 Benchmark report written to {output_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline tech radar benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS))
+    parser.add_argument("--per-item-limit", type=int, default=1000,
+                        help="largest size for which enhance_trend_with_ai is timed item by item")
+    parser.add_argument("--index-sizes", type=int, nargs="*", default=[1000, 10000],
+                        help="interest counts for the index recall and latency check")
+    parser.add_argument("--min-recall", type=float, default=0.9,
+                        help="fail when an interest index's recall@10 against exact search drops below this")
+    parser.add_argument("--stream-sizes", type=int, nargs="*", default=[1000, 10000],
+                        help="fetch limits for the batch vs columnar vs streaming memory comparison")
+    parser.add_argument("--pool-sizes", type=int, nargs="*", default=[1000, 5000, 20000, 50000],
+                        help="batch sizes for the in-process vs scoring pool comparison")
+    parser.add_argument("--pool-processes", type=int, default=0,
+                        help="scoring pool size to measure (default: one per CPU)")
+    parser.add_argument("--stub-latency-ms", type=int, default=50)
+    parser.add_argument("--output", type=pathlib.Path, default=ROOT / "data" / "benchmarks")
+    parser.add_argument("--regression-threshold", type=float, default=1.2)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--record", action="store_true", help="refresh fixtures from the live APIs first")
+    parser.add_argument("--recall-only", action="store_true",
+                        help="only check the interest indexes' recall against exact search, without a report")
+    args = parser.parse_args()
+
+    if args.recall_only:
+        results = bench_index(args.index_sizes, queries=256)
+        low_recall = [row for row in results if row.get("recall") is not None and row["recall"] < args.min_recall]
+        for row in low_recall:
+            print(f"⚠️  Low recall: {row['backend']} x {row['size']} recall@10 {row['recall']}")
+        if low_recall:
+            raise SystemExit(1)
+        return
+
+    if args.record:
+        record_fixtures()
+
+    fixtures = load_fixtures()
+    report_path = args.output / "report.json"
+    baseline = json.loads(report_path.read_text())["results"] if report_path.exists() else None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = pathlib.Path(tmp)
+        results = [bench_fetch(fixtures, workdir, args.stub_latency_ms)]
+        results += bench_pipeline(fixtures, args.sizes, args.backends, workdir, args.per_item_limit)
+        results += bench_streaming(fixtures, args.stream_sizes, workdir)
+        results += bench_scoring_pool(fixtures, args.pool_sizes, args.pool_processes, workdir)
+        results += bench_embedding_quality(fixtures, workdir)
+    results += bench_index(args.index_sizes)
+    results += bench_quantization(fixtures)
+
+    results = compare(results, baseline, args.regression_threshold)
+    write_report(results, args.output)
+
+    regressions = [row for row in results if row.get("regression")]
+    for row in regressions:
+        print(f"⚠️  Regression: {row['stage']} [{row['backend']}, {row['size']}] "
+              f"{row['baseline_seconds']}s -> {row['seconds']}s")
+    low_recall = [row for row in results if row.get("recall") is not None and row["recall"] < args.min_recall]
+    for row in low_recall:
+        print(f"⚠️  Low recall: {row['backend']} x {row['size']} recall@10 {row['recall']}")
+    # Wrong answers always fail the run; slowdowns only with --fail-on-regression
+    if low_recall or (regressions and args.fail_on_regression):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Persistent embedding cache for the tech radar
+Stores float16 vectors keyed by (model name, text hash) with LRU eviction
+"""
+
+import hashlib
+import json
+import pathlib
+from typing import Callable, Dict, List
+
+import numpy as np
+
+
+class EmbeddingCache:
+    def __init__(self, cache_dir: pathlib.Path, max_entries: int = 20000):
+        self.cache_dir = cache_dir
+        self.index_path = cache_dir / "index.json"
+        self.vectors_path = cache_dir / "vectors.npy"
+        self.max_entries = max_entries
+
+        # key -> {"row": int, "last_used": int}
+        self.index: Dict[str, Dict] = {}
+        self.vectors = None
+        self.pending: Dict[str, np.ndarray] = {}
+        self.clock = 0
+        self.hits = 0
+        self.misses = 0
+
+        self.load()
+
+    def load(self):
+        """Load the index and memory-map the stored vectors"""
+        if not self.index_path.exists() or not self.vectors_path.exists():
+            return
+
+        try:
+            data = json.loads(self.index_path.read_text())
+            self.index = data.get("entries", {})
+            self.clock = data.get("clock", 0)
+            self.vectors = np.load(self.vectors_path, mmap_mode='r')
+        except Exception as e:
+            print(f"⚠️  Embedding cache unreadable, starting fresh: {e}")
+            self.index = {}
+            self.vectors = None
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> str:
+        """Build the cache key for a text embedded by a given model"""
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        return f"{model_name}:{digest}"
+
+    def get(self, key: str):
+        """Return the cached vector for a key, or None"""
+        if key in self.pending:
+            return self.pending[key]
+        entry = self.index.get(key)
+        if entry is None or self.vectors is None:
+            return None
+        return self.vectors[entry["row"]]
+
+    def encode(self, texts: List[str], model_name: str,
+               encoder: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """Return normalized embeddings, encoding only texts not seen before"""
+        self.clock += 1
+        keys = [self.make_key(model_name, text) for text in texts]
+        rows = [None] * len(texts)
+        missing = {}
+
+        for position, key in enumerate(keys):
+            vector = self.get(key)
+            if vector is None:
+                missing.setdefault(key, []).append(position)
+                continue
+            self.hits += 1
+            rows[position] = np.asarray(vector, dtype=np.float32)
+            if key in self.index:
+                self.index[key]["last_used"] = self.clock
+
+        if missing:
+            # Hits and misses both count positions, so hit_rate is per looked-up text
+            self.misses += sum(len(positions) for positions in missing.values())
+            missing_keys = list(missing)
+            missing_texts = [texts[missing[key][0]] for key in missing_keys]
+            encoded = np.asarray(encoder(missing_texts), dtype=np.float32)
+            for key, vector in zip(missing_keys, encoded):
+                stored = vector.astype(np.float16)
+                self.pending[key] = stored
+                # Returned at stored precision, so a text scores the same on its first run as on later ones
+                for position in missing[key]:
+                    rows[position] = stored.astype(np.float32)
+
+        if not rows:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack(rows).astype(np.float32)
+
+    def save(self):
+        """Merge new vectors, evict least recently used entries and write to disk"""
+        if not self.pending:
+            if self.index:
+                self.write_index()
+            return
+
+        entries = []
+        for key, entry in self.index.items():
+            entries.append((entry["last_used"], key, self.vectors[entry["row"]]))
+        for key, vector in self.pending.items():
+            entries.append((self.clock, key, vector))
+
+        # Keep the most recently used entries within the size bound
+        entries.sort(key=lambda entry: entry[0], reverse=True)
+        entries = entries[:self.max_entries]
+
+        matrix = np.vstack([entry[2] for entry in entries]).astype(np.float16)
+        self.index = {
+            key: {"row": row, "last_used": last_used}
+            for row, (last_used, key, _) in enumerate(entries)
+        }
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.vectors_path.with_name("vectors.tmp.npy")
+        np.save(tmp_path, matrix)
+        self.vectors = None
+        tmp_path.replace(self.vectors_path)
+        self.write_index()
+
+        self.vectors = np.load(self.vectors_path, mmap_mode='r')
+        self.pending = {}
+
+    def write_index(self):
+        """Write the key index alongside the vector file"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path.write_text(json.dumps({"clock": self.clock, "entries": self.index}))
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.index) + len(self.pending),
+        }
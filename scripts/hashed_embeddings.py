@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Hashed-feature TF-IDF embeddings for the tech radar
+A NumPy-only text vectorizer: word, word-bigram and character n-gram features hashed into a fixed space,
+scored with sparse dot products, so relevance and categorization work without torch
+"""
+
+import hashlib
+import json
+import re
+import zlib
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+# Features of this many distinct words are kept between batches
+WORD_CACHE_SIZE = 200000
+
+# Query rows expanded per sparse product, bounding the temporary pair arrays
+QUERY_CHUNK = 2048
+
+
+class SparseRows:
+    """Row-compressed sparse matrix: row i holds indices/data[indptr[i]:indptr[i + 1]]"""
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, data: np.ndarray):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self._postings = None
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def row_ids(self) -> np.ndarray:
+        return np.repeat(np.arange(len(self)), np.diff(self.indptr))
+
+    def slice(self, start: int, end: int) -> "SparseRows":
+        low, high = self.indptr[start], self.indptr[end]
+        return SparseRows(self.indptr[start:end + 1] - low, self.indices[low:high], self.data[low:high])
+
+    def postings(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Entries sorted by feature: the column view used when this matrix is the reference side"""
+        if self._postings is None:
+            order = np.argsort(self.indices, kind="stable")
+            self._postings = (self.indices[order], self.row_ids()[order], self.data[order])
+        return self._postings
+
+    def dot(self, reference: "SparseRows") -> np.ndarray:
+        """Dense (rows, reference rows) inner products, touching only features the two sides share"""
+        features, ref_rows, ref_values = reference.postings()
+        out = np.zeros((len(self), len(reference)), dtype=np.float32)
+        for start in range(0, len(self), QUERY_CHUNK):
+            chunk = self.slice(start, min(start + QUERY_CHUNK, len(self)))
+            # Each query entry matches the run of reference entries with the same feature
+            first = np.searchsorted(features, chunk.indices, side="left")
+            counts = np.searchsorted(features, chunk.indices, side="right") - first
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            run_starts = np.repeat(first - (np.cumsum(counts) - counts), counts)
+            positions = run_starts + np.arange(total)
+            pairs = np.repeat(chunk.row_ids(), counts) * len(reference) + ref_rows[positions]
+            weights = np.repeat(chunk.data, counts) * ref_values[positions]
+            block = np.bincount(pairs, weights=weights, minlength=len(chunk) * len(reference))
+            out[start:start + len(chunk)] = block.reshape(len(chunk), len(reference))
+        return out
+
+
+class HashedEmbedder:
+    def __init__(self, bits: int = 18, word_ngrams: int = 2, char_ngrams: Tuple[int, int] = (3, 5),
+                 dense_dim: int = 256):
+        self.n_features = 1 << bits
+        self.word_ngrams = word_ngrams
+        self.char_ngrams = char_ngrams
+        self.dense_dim = dense_dim
+        self.word_features: Dict[str, np.ndarray] = {}
+        # Reference matrices (interests, category exemplars) by content hash
+        self.references: Dict[str, SparseRows] = {}
+        # Plain term frequency until fit() sees a corpus
+        self.set_idf(np.ones(self.n_features, dtype=np.float32))
+
+    def set_idf(self, idf: np.ndarray):
+        self.idf = idf
+        self.references = {}
+        # Identity of the feature space and IDF, used wherever a model name keys stored vectors
+        settings = json.dumps([self.n_features, self.word_ngrams, list(self.char_ngrams), self.dense_dim])
+        digest = hashlib.sha1(settings.encode("utf-8") + idf.tobytes()).hexdigest()[:12]
+        self.model_name = f"hashed-tfidf-{digest}"
+
+    def hash(self, feature: str) -> int:
+        return zlib.crc32(feature.encode("utf-8")) & (self.n_features - 1)
+
+    def features_of_word(self, word: str) -> np.ndarray:
+        """The word itself plus its character n-grams, with boundary markers, hashed once per word"""
+        cached = self.word_features.get(word)
+        if cached is not None:
+            return cached
+        marked = f"<{word}>"
+        low, high = self.char_ngrams
+        grams = [f"w:{word}"]
+        for n in range(low, high + 1):
+            grams.extend(f"c:{marked[start:start + n]}" for start in range(len(marked) - n + 1))
+        features = np.array([self.hash(gram) for gram in grams], dtype=np.int64)
+        if len(self.word_features) >= WORD_CACHE_SIZE:
+            self.word_features.clear()
+        self.word_features[word] = features
+        return features
+
+    def text_features(self, text: str) -> np.ndarray:
+        words = TOKEN_PATTERN.findall(text.lower())
+        parts = [self.features_of_word(word) for word in words]
+        for n in range(2, self.word_ngrams + 1):
+            grams = [" ".join(words[start:start + n]) for start in range(len(words) - n + 1)]
+            parts.append(np.array([self.hash(f"n:{gram}") for gram in grams], dtype=np.int64))
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+    def fit(self, corpus: Iterable[str]):
+        """Smoothed IDF over a background corpus"""
+        document_frequency = np.zeros(self.n_features, dtype=np.float32)
+        documents = 0
+        for text in corpus:
+            document_frequency[np.unique(self.text_features(text))] += 1
+            documents += 1
+        self.set_idf((np.log((1 + documents) / (1 + document_frequency)) + 1).astype(np.float32))
+
+    def transform(self, texts: List[str]) -> SparseRows:
+        """L2-normalized sublinear TF-IDF rows"""
+        per_text = [self.text_features(text) for text in texts]
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), [len(features) for features in per_text])
+        features = np.concatenate(per_text) if per_text else np.zeros(0, dtype=np.int64)
+        # One sort over (row, feature) keys counts every text's terms at once, already in CSR order
+        keys, counts = np.unique(rows * self.n_features + features, return_counts=True)
+        rows, indices = np.divmod(keys, self.n_features)
+        weights = (1 + np.log(counts)).astype(np.float32) * self.idf[indices]
+        norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=len(texts)))
+        data = np.divide(weights, norms[rows], out=weights, where=norms[rows] > 0).astype(np.float32)
+        indptr = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(texts)), out=indptr[1:])
+        return SparseRows(indptr, indices, data)
+
+    def reference(self, texts: List[str]) -> SparseRows:
+        """Transformed reference texts, kept with their postings for later batches"""
+        key = hashlib.sha1(json.dumps(texts).encode("utf-8")).hexdigest()
+        if key not in self.references:
+            if len(self.references) >= 8:
+                self.references.clear()
+            self.references[key] = self.transform(texts)
+        return self.references[key]
+
+    def similarity(self, texts: List[str], reference_texts: List[str]) -> np.ndarray:
+        """Cosine similarity of every text to every reference text, shape (texts, references)"""
+        return self.transform(texts).dot(self.reference(reference_texts))
+
+    def encode_dense(self, texts: List[str]) -> np.ndarray:
+        """Normalized dense vectors for clustering and kernels: features folded into dense_dim signed buckets"""
+        rows = self.transform(texts)
+        buckets = rows.indices % self.dense_dim
+        # A spare hash bit picks the sign, so colliding features cancel rather than add up on average
+        signs = np.where((rows.indices // self.dense_dim) & 1, -1.0, 1.0).astype(np.float32)
+        dense = np.zeros((len(rows), self.dense_dim), dtype=np.float32)
+        np.add.at(dense, (rows.row_ids(), buckets), rows.data * signs)
+        norms = np.linalg.norm(dense, axis=1, keepdims=True)
+        return np.divide(dense, norms, out=dense, where=norms > 0)
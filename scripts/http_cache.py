@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Conditional-request HTTP cache for the tech radar fetchers
+Keeps response bodies with their validators so unchanged payloads come back as 304s
+"""
+
+import hashlib
+import json
+import pathlib
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode, urlparse
+
+
+class HTTPCache:
+    def __init__(self, cache_dir: pathlib.Path):
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+
+        # host -> {"remaining": int, "reset": float}
+        self.rate_limits: Dict[str, Dict] = {}
+
+        self.requests = 0
+        self.not_modified = 0
+        self.served_from_cache = 0
+        self.bytes_downloaded = 0
+        self.bytes_saved = 0
+
+    @staticmethod
+    def make_key(url: str, params: Dict) -> str:
+        """Stable key for a URL and its query parameters"""
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha1(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+    def entry_path(self, key: str) -> pathlib.Path:
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, key: str) -> Optional[Dict]:
+        """Return the cached entry for a key, or None"""
+        path = self.entry_path(key)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except Exception:
+            return None
+
+    def store(self, key: str, entry: Dict):
+        """Write an entry to disk"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.entry_path(key).write_text(json.dumps(entry))
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """Validators to send with a request for a cached payload"""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def must_wait(self, url: str, entry: Optional[Dict]) -> float:
+        """Seconds to hold off because of rate limits or a Stack Exchange backoff"""
+        now = time.time()
+        wait = 0.0
+        if entry and entry.get("backoff_until", 0) > now:
+            wait = entry["backoff_until"] - now
+
+        limit = self.rate_limits.get(urlparse(url).netloc)
+        if limit and limit["remaining"] <= 0 and limit["reset"] > now:
+            wait = max(wait, limit["reset"] - now)
+        return wait
+
+    def record_rate_limit(self, url: str, headers):
+        """Remember X-RateLimit-* headers for the response's host"""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        with self.lock:
+            self.rate_limits[urlparse(url).netloc] = {
+                "remaining": int(remaining),
+                "reset": float(reset)
+            }
+
+    def get_json(self, session, url: str, params: Dict, timeout: float) -> Tuple[Dict, bool, int]:
+        """GET through the cache, returning (body, not_modified, bytes downloaded)"""
+        key = self.make_key(url, params)
+        entry = self.load(key)
+
+        wait = self.must_wait(url, entry)
+        if wait > 0:
+            if entry is not None:
+                # Rate limited or backing off: the cached payload is the best answer
+                with self.lock:
+                    self.served_from_cache += 1
+                    self.bytes_saved += len(json.dumps(entry["body"]))
+                return entry["body"], True, 0
+            raise RuntimeError(f"rate limited for {wait:.0f}s and no cached response for {url}")
+
+        response = session.get(url, params=params, timeout=timeout,
+                               headers=self.conditional_headers(entry))
+        self.record_rate_limit(url, response.headers)
+
+        with self.lock:
+            self.requests += 1
+
+        if response.status_code == 304 and entry is not None:
+            with self.lock:
+                self.not_modified += 1
+                self.bytes_saved += entry.get("size", 0)
+            return entry["body"], True, 0
+
+        response.raise_for_status()
+        body = response.json()
+        size = len(response.content)
+
+        new_entry = {
+            "url": url,
+            "params": params,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "size": size,
+            "fetched_at": time.time(),
+            "body": body
+        }
+        if isinstance(body, dict) and body.get("backoff"):
+            new_entry["backoff_until"] = time.time() + float(body["backoff"])
+        self.store(key, new_entry)
+
+        with self.lock:
+            self.bytes_downloaded += size
+
+        # Identical bytes without validators still count as unchanged
+        not_modified = entry is not None and entry.get("body") == body
+        return body, not_modified, size
+
+    def stats(self) -> Dict:
+        """Request counters and bytes saved by conditional requests"""
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "served_from_cache": self.served_from_cache,
+            "bytes_downloaded": self.bytes_downloaded,
+            "bytes_saved": self.bytes_saved,
+        }
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+JSONL snapshots for the streaming tech radar
+Trends are written one line at a time with running insights, and read back lazily line by line
+"""
+
+import json
+import os
+import pathlib
+from collections import Counter
+from typing import Dict, Iterator
+
+
+def meta_path(path: pathlib.Path) -> pathlib.Path:
+    """Sidecar holding the snapshot's run metadata and insights"""
+    return path.with_suffix(".meta.json")
+
+
+class JsonlTrends:
+    """Re-iterable view over a JSONL snapshot that parses one trend per line as callers iterate"""
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+
+    def __iter__(self) -> Iterator[Dict]:
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def load_snapshot(path: pathlib.Path) -> Dict:
+    """Metadata of a JSONL snapshot with its trends as a lazy iterable, or an empty dict"""
+    if not path.exists() or not meta_path(path).exists():
+        return {}
+    return {**json.loads(meta_path(path).read_text()), "trends": JsonlTrends(path)}
+
+
+class JsonlSnapshotWriter:
+    """Appends trends to a temp file and replaces the snapshot only on commit"""
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self.tmp_path = path.with_name(f".{path.name}.tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.tmp_path, "w", encoding="utf-8")
+
+        # Running insights, so no trend has to be kept after it is written
+        self.count = 0
+        self.sentiment_total = 0.0
+        self.relevance_total = 0.0
+        self.categories = Counter()
+
+    def write(self, trend: Dict):
+        self.file.write(json.dumps(trend, default=str) + "\n")
+        self.count += 1
+        self.sentiment_total += trend.get("sentiment_score", 0)
+        self.relevance_total += trend.get("relevance_score", 0.5)
+        self.categories[trend.get("ai_category", "assess")] += 1
+
+    def insights(self) -> Dict:
+        count = max(self.count, 1)
+        return {
+            "avg_sentiment": self.sentiment_total / count,
+            "avg_relevance": self.relevance_total / count,
+            "categories_distribution": dict(self.categories)
+        }
+
+    def commit(self, metadata: Dict):
+        """Publish the trends, then the sidecar describing them"""
+        self.file.close()
+        os.replace(self.tmp_path, self.path)
+        meta = {**metadata, "total_trends": self.count, "insights": self.insights()}
+        tmp_meta = meta_path(self.tmp_path)
+        tmp_meta.write_text(json.dumps(meta, indent=2, default=str))
+        os.replace(tmp_meta, meta_path(self.path))
+
+    def abort(self):
+        """Drop the partial snapshot, leaving the previous one in place"""
+        self.file.close()
+        self.tmp_path.unlink(missing_ok=True)
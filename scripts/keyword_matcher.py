@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Compiled multi-pattern keyword matcher for the tech radar
+All keyword groups share one alternation regex, so each text is scanned once
+"""
+
+import re
+from typing import Dict, List
+
+import numpy as np
+
+
+class KeywordMatcher:
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.groups = list(groups.keys())
+
+        # keyword -> indexes of every group that lists it
+        self.keyword_groups: Dict[str, List[int]] = {}
+        for index, group in enumerate(self.groups):
+            for keyword in groups[group]:
+                self.keyword_groups.setdefault(keyword.lower(), []).append(index)
+
+        # Longest keywords first so "production-ready" wins over "production"
+        keywords = sorted(self.keyword_groups, key=len, reverse=True)
+        alternation = "|".join(re.escape(keyword) for keyword in keywords)
+        # Word boundaries that also work for keywords such as "c++" and "next.js"
+        self.pattern = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)") if keywords else None
+
+    def matched_keywords(self, text: str) -> set:
+        """Distinct keywords found in a text"""
+        if self.pattern is None:
+            return set()
+        return set(self.pattern.findall(text.lower()))
+
+    def count_matrix(self, texts: List[str]) -> np.ndarray:
+        """Distinct keyword hits per group for a batch of texts, shape (texts, groups)"""
+        counts = np.zeros((len(texts), len(self.groups)), dtype=np.int32)
+        for row, text in enumerate(texts):
+            for keyword in self.matched_keywords(text):
+                for index in self.keyword_groups[keyword]:
+                    counts[row, index] += 1
+        return counts
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Distinct keyword hits per group for a single text"""
+        row = self.count_matrix([text])[0]
+        return {group: int(count) for group, count in zip(self.groups, row)}
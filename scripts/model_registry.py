@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Lazy model registry for the tech radar
+Each AI backend is imported and loaded the first time a pipeline stage asks for it
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+DEFAULT_BACKENDS = {
+    "torch": True,
+    "sentence_transformer": True,
+    "sentiment": True,
+}
+
+
+def load_torch():
+    import torch
+    print(f"✅ PyTorch version: {torch.__version__}")
+    return torch
+
+
+def load_sentence_transformer():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+
+def load_sentiment():
+    import nltk
+    try:
+        nltk.data.find('sentiment/vader_lexicon.zip')
+    except LookupError:
+        # Only hit the network when the lexicon is not installed yet
+        nltk.download('vader_lexicon', quiet=True)
+    from nltk.sentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+
+LOADERS = {
+    "torch": load_torch,
+    "sentence_transformer": load_sentence_transformer,
+    "sentiment": load_sentiment,
+}
+
+# The AI stack is only tried once torch itself imports; VADER is plain NLTK and loads on its own
+REQUIRES_TORCH = {"sentence_transformer"}
+
+
+class ModelRegistry:
+    def __init__(self, backends: Optional[Dict[str, bool]] = None):
+        self.enabled = dict(DEFAULT_BACKENDS)
+        self.enabled.update(backends or {})
+
+        self.models: Dict[str, Any] = {}
+        self.failed: Dict[str, str] = {}
+        self.load_times: Dict[str, float] = {}
+
+    def get(self, name: str) -> Optional[Any]:
+        """Return a loaded backend, loading it on first use"""
+        if name in self.models:
+            return self.models[name]
+        if name in self.failed or not self.enabled.get(name, False):
+            return None
+        if name in REQUIRES_TORCH and self.get("torch") is None:
+            self.failed[name] = "torch unavailable"
+            return None
+
+        start = time.perf_counter()
+        try:
+            self.models[name] = LOADERS[name]()
+            print(f"✅ {name} loaded successfully")
+        except Exception as e:
+            self.failed[name] = str(e)
+            print(f"⚠️ {name} failed: {e}")
+        finally:
+            self.load_times[name] = time.perf_counter() - start
+
+        return self.models.get(name)
+
+    def has(self, name: str) -> bool:
+        """Check whether a backend is usable, loading it if needed"""
+        return self.get(name) is not None
+
+    def loaded_models(self) -> List[str]:
+        """Names of backends that have been loaded so far"""
+        return list(self.models.keys())
+
+    def report(self) -> Dict[str, Dict]:
+        """Per-backend load status and time in seconds"""
+        return {
+            name: {
+                "loaded": name in self.models,
+                "seconds": round(seconds, 3),
+                "error": self.failed.get(name),
+            }
+            for name, seconds in self.load_times.items()
+        }
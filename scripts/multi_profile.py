@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Multi-profile tech radar generation
+Fetches and embeds the shared trend corpus once, then scores every profile in one stacked pass
+"""
+
+import pathlib
+from typing import Dict, List
+
+from update_tech_radar_ai_fixed import AITechRadarUpdaterFixed
+
+
+class MultiProfileRadar:
+    def __init__(self, config_paths: List[pathlib.Path]):
+        # The default config drives fetching; each profile config drives its own scoring and outputs
+        self.base = AITechRadarUpdaterFixed()
+        self.profiles = [self.make_profile(pathlib.Path(path)) for path in config_paths]
+
+    def make_profile(self, config_path: pathlib.Path) -> AITechRadarUpdaterFixed:
+        """Profile updater sharing the base updater's models, caches and metrics"""
+        profile = AITechRadarUpdaterFixed(config_path)
+        profile.models = self.base.models
+        profile.embedding_cache = self.base.embedding_cache
+        profile.metrics = self.base.metrics
+        profile.history = self.base.history
+        # Topics depend only on the shared trend embeddings, so every profile assigns from one set of centroids
+        profile._topic_clusterer = self.base.get_topic_clusterer()
+
+        # Profiles without explicit outputs write next to each other under data/profiles
+        output_config = profile.config.get('output', {})
+        profile_dir = self.base.root / "data" / "profiles" / config_path.stem
+        if 'snapshot_path' not in output_config:
+            profile.tech_data_path = profile_dir / "tech_trends_ai_fixed.json"
+            profile.tech_table_path = profile.tech_data_path.with_suffix('.table')
+            profile.tech_jsonl_path = profile.tech_data_path.with_suffix('.jsonl')
+        if 'readme_path' not in output_config and profile.radar_path is None:
+            profile.radar_path = profile_dir / "radar.md"
+        return profile
+
+    def profiles_to_update(self, trends: List[Dict]) -> List[AITechRadarUpdaterFixed]:
+        """Profiles whose own snapshot is old enough and differs enough from the fetched trends"""
+        new_names = {trend['name'] for trend in trends}
+        due = []
+        for profile in self.profiles:
+            name = profile.config_path.stem
+            old_data = profile.load_previous_snapshot()
+            if not old_data:
+                print(f"📊 [{name}] No previous data found - initial update needed")
+            else:
+                print(f"📊 [{name}] Checking for changes")
+                if profile.recently_updated(old_data):
+                    continue
+                old_names = {trend['name'] for trend in old_data.get('trends', [])}
+                if not profile.changes_warrant_update(old_names, new_names):
+                    continue
+            due.append(profile)
+        return due
+
+    def run(self):
+        """Fetch once, score all profiles together, write one radar and snapshot per profile
+
+        Each profile reuses the scores in its own snapshot the way run() does, so only trends that are new,
+        changed, or scored under different settings for some profile go through the shared scoring pass.
+        """
+        print(f"🚀 Starting multi-profile tech radar update for {len(self.profiles)} profiles...")
+        trends = self.base.fetch_all_trends()
+        print(f"📈 Found {len(trends)} unique tech trends")
+        self.base.record_history(trends)
+        self.base.attach_history_features(trends)
+
+        profiles = self.profiles_to_update(trends)
+        if not profiles:
+            print("🎯 No meaningful changes detected - every profile radar is up to date!")
+            self.base.flush_metrics()
+            return
+
+        # Scores a trend arrives with are never trusted; each profile starts from the fetched fields
+        score_fields = self.base.SCORE_FIELDS + self.base.OPTIONAL_SCORE_FIELDS
+        fingerprints = [self.base.trend_fingerprint(trend) for trend in trends]
+        outputs = []
+        stale = set()
+        for profile in profiles:
+            previous = profile.load_reusable_scores()
+            scored = []
+            to_score = []
+            for index, trend in enumerate(trends):
+                enhanced = {field: value for field, value in trend.items() if field not in score_fields}
+                enhanced['fingerprint'] = fingerprints[index]
+                old_trend = previous.get(profile.trend_key(trend))
+                if old_trend is not None and old_trend['fingerprint'] == fingerprints[index]:
+                    enhanced.update({field: old_trend[field] for field in score_fields if field in old_trend})
+                else:
+                    to_score.append(index)
+                scored.append(enhanced)
+            profile.scoring_stats = {"reused": len(trends) - len(to_score), "recomputed": len(to_score)}
+            print(f"♻️  [{profile.config_path.stem}] Incremental scoring: {len(trends) - len(to_score)} reused, "
+                  f"{len(to_score)} recomputed")
+            outputs.append((profile, scored, to_score))
+            stale.update(to_score)
+
+        # Sentiment, relevance and topics do not depend on the profile, so each stale trend is scored once
+        rows = sorted(stale)
+        stale_trends = [{field: value for field, value in trends[index].items() if field not in score_fields}
+                        for index in rows]
+        with self.base.metrics.stage("sentiment", len(rows)):
+            descriptions = [f"{trend.get('name', '')} {trend.get('description', '')}" for trend in stale_trends]
+            sentiments = dict(zip(rows, self.base.analyze_sentiment_batch(descriptions)))
+
+        with self.base.metrics.stage("relevance", len(rows) * len(profiles)):
+            relevance = self.base.calculate_relevance_profiles(
+                stale_trends, [profile.get_all_interests() for profile in profiles]
+            ) if rows else None
+        positions = {index: position for position, index in enumerate(rows)}
+
+        # New and changed trends take their nearest topic, then move the centroids once for the whole run
+        with self.base.metrics.stage("cluster", len(rows)):
+            self.base.assign_topics(stale_trends)
+        with self.base.metrics.stage("cluster_fit", len(rows)):
+            self.base.fit_topics(stale_trends)
+
+        for column, (profile, scored, to_score) in enumerate(outputs):
+            name = profile.config_path.stem
+            rescored = [scored[index] for index in to_score]
+            with self.base.metrics.stage(f"categorize:{name}", len(rescored)):
+                keyword_results = profile.categorize_batch(rescored)
+                use_embeddings = profile.config.get('categorization_method', 'keywords') == 'embeddings'
+                ai_results = profile.ai_categorize_batch(rescored) if use_embeddings and rescored else None
+
+            for position, index in enumerate(to_score):
+                enhanced = scored[index]
+                category, domains = keyword_results[position]
+                enhanced['ai_category'] = category
+                enhanced['domains'] = domains
+                if ai_results is not None:
+                    enhanced['ai_category'], margin = ai_results[position]
+                    if margin is not None:
+                        enhanced['category_margin'] = margin
+                enhanced['sentiment_score'] = sentiments[index]
+                enhanced['relevance_score'] = float(relevance[positions[index], column])
+                if 'topic' in stale_trends[positions[index]]:
+                    enhanced['topic'] = stale_trends[positions[index]]['topic']
+
+            with self.base.metrics.stage(f"radar:{name}", len(scored)):
+                profile.update_readme_tech_radar(profile.generate_enhanced_radar(scored))
+            with self.base.metrics.stage(f"snapshot:{name}", len(scored)):
+                profile.save_enhanced_tech_data(scored)
+
+        self.base.save_embedding_cache()
+        self.base.save_topic_clusters()
+        self.base.flush_metrics()
+        print("🎉 Multi-profile tech radar update completed!")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Process-pool scoring for the tech radar's CPU-bound, non-embedding stages
+Shards keyword categorization and sentiment across workers that each load their models once
+"""
+
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+# Per-process state, set up once by init_worker
+_scorer = None
+_matcher = None
+_sentiment_analyzer = None
+
+
+def init_worker(config: Dict):
+    """Build the keyword engine once per worker process from the parent's in-memory config"""
+    global _scorer, _matcher
+    from update_tech_radar_ai_fixed import AITechRadarUpdaterFixed
+
+    # No updater instance: workers never read config files, caches or history
+    _scorer = AITechRadarUpdaterFixed
+    _matcher = _scorer.build_keyword_matcher(config)
+
+
+def get_sentiment_analyzer():
+    """VADER, loaded on a worker's first sentiment chunk"""
+    global _sentiment_analyzer
+    if _sentiment_analyzer is None:
+        from model_registry import load_sentiment
+        _sentiment_analyzer = load_sentiment()
+    return _sentiment_analyzer
+
+
+def categorize_chunk(texts: List[str]) -> List:
+    """Keyword categories and domains for one chunk of keyword texts, isolating per-item failures"""
+    try:
+        return _scorer.keyword_categories(_matcher, texts)
+    except Exception:
+        results = []
+        for text in texts:
+            try:
+                results.append(_scorer.keyword_categories(_matcher, [text])[0])
+            except Exception as e:
+                print(f"Error in categorization: {e}")
+                results.append(("assess", []))
+        return results
+
+
+def sentiment_chunk(texts: List[str], use_vader: bool) -> List[float]:
+    """Sentiment for one chunk, with the same per-item fallback as the in-process path"""
+    if not use_vader:
+        return _scorer.keyword_sentiments(_matcher, texts)
+
+    analyzer = get_sentiment_analyzer()
+    scores = []
+    for text in texts:
+        try:
+            scores.append(analyzer.polarity_scores(text)['compound'])
+        except Exception as e:
+            print(f"Error in sentiment analysis: {e}")
+            scores.append(0.0)
+    return scores
+
+
+class ParallelScorer:
+    def __init__(self, config: Dict, processes: int = 0, min_batch: int = 2000,
+                 chunks_per_process: int = 4, start_method: str = "spawn"):
+        self.config = config
+        self.processes = processes or os.cpu_count() or 1
+        self.min_batch = min_batch
+        self.chunks_per_process = chunks_per_process
+        self.start_method = start_method
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def worth_it(self, size: int) -> bool:
+        """Small batches or a single core are faster in-process than through the pool"""
+        return self.processes > 1 and size >= self.min_batch
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        """Start the pool on first use and keep it warm for later batches"""
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=init_worker,
+                initargs=(self.config,)
+            )
+        return self.executor
+
+    def chunks(self, items: List) -> List[List]:
+        size = math.ceil(len(items) / (self.processes * self.chunks_per_process))
+        return [items[start:start + size] for start in range(0, len(items), size)]
+
+    def map(self, func: Callable, items: List, *args) -> List:
+        """Apply a chunk function across the pool, returning results in input order"""
+        chunks = self.chunks(items)
+        extra = [[arg] * len(chunks) for arg in args]
+        results = []
+        for chunk_result in self.get_executor().map(func, chunks, *extra):
+            results.extend(chunk_result)
+        return results
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
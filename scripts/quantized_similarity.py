@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Quantized embedding storage and similarity kernel for the tech radar
+Reference vectors are kept as int8 (per-row scale) or float16 and scored in chunks through reused buffers
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+QUANTIZATION_MODES = ("none", "float16", "int8")
+
+
+class QuantizedMatrix:
+    """Row-major matrix stored as int8 codes with one float32 scale per row, or as float16"""
+
+    def __init__(self, data: np.ndarray, scales: Optional[np.ndarray], mode: str):
+        self.data = data
+        self.scales = scales
+        self.mode = mode
+
+    @classmethod
+    def from_float(cls, matrix: np.ndarray, mode: str = "int8") -> "QuantizedMatrix":
+        if mode not in QUANTIZATION_MODES:
+            raise ValueError(f"unknown quantization mode: {mode}")
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if mode == "none":
+            return cls(np.ascontiguousarray(matrix), None, mode)
+        if mode == "float16":
+            return cls(matrix.astype(np.float16), None, mode)
+
+        # Symmetric per-row scaling keeps each vector's direction within one int8 step per component
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.rint(matrix / scales[:, None]).astype(np.int8)
+        return cls(codes, scales.astype(np.float32), mode)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def dim(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes + (self.scales.nbytes if self.scales is not None else 0)
+
+    def dequantize_into(self, start: int, end: int, out: np.ndarray) -> np.ndarray:
+        """Write rows [start, end) as float32 into a preallocated buffer"""
+        view = out[:end - start]
+        if self.scales is None:
+            view[...] = self.data[start:end]
+        else:
+            np.multiply(self.data[start:end], self.scales[start:end, None], out=view)
+        return view
+
+
+class SimilarityKernel:
+    """Inner products of query batches against quantized references, reusing its buffers between calls"""
+
+    def __init__(self, reference: QuantizedMatrix, chunk_rows: int = 4096):
+        self.reference = reference
+        self.chunk_rows = min(chunk_rows, max(len(reference), 1))
+        self.chunk = np.empty((self.chunk_rows, reference.dim), dtype=np.float32)
+        # Output buffers keyed by query count, grown only when a larger batch arrives
+        self.buffers: Dict[str, np.ndarray] = {}
+
+    def buffer(self, name: str, shape) -> np.ndarray:
+        current = self.buffers.get(name)
+        if current is None or current.shape[0] < shape[0]:
+            current = np.empty(shape, dtype=np.float32)
+            self.buffers[name] = current
+        return current[:shape[0]]
+
+    def scores(self, queries: np.ndarray) -> np.ndarray:
+        """Full (queries, references) score matrix; valid until the next call"""
+        queries = np.asarray(queries, dtype=np.float32)
+        out = self.buffer("scores", (len(queries), len(self.reference)))
+        for start in range(0, len(self.reference), self.chunk_rows):
+            end = min(start + self.chunk_rows, len(self.reference))
+            chunk = self.reference.dequantize_into(start, end, self.chunk)
+            np.matmul(queries, chunk.T, out=out[:, start:end])
+        return out
+
+    def max_scores(self, queries: np.ndarray) -> np.ndarray:
+        """Best score per query without holding the full score matrix"""
+        queries = np.asarray(queries, dtype=np.float32)
+        best = np.full(len(queries), -np.inf, dtype=np.float32)
+        partial = self.buffer("partial", (len(queries), self.chunk_rows))
+        for start in range(0, len(self.reference), self.chunk_rows):
+            end = min(start + self.chunk_rows, len(self.reference))
+            chunk = self.reference.dequantize_into(start, end, self.chunk)
+            block = partial[:, :end - start]
+            np.matmul(queries, chunk.T, out=block)
+            np.maximum(best, block.max(axis=1), out=best)
+        return best
+
+
+def similarity_drift(reference: np.ndarray, queries: np.ndarray, mode: str) -> Dict:
+    """Score error and top-1 agreement of a quantized reference against float32"""
+    exact = np.asarray(queries, dtype=np.float32) @ np.asarray(reference, dtype=np.float32).T
+    quantized = QuantizedMatrix.from_float(reference, mode)
+    approx = SimilarityKernel(quantized).scores(queries)
+    error = np.abs(approx - exact)
+    return {
+        "mode": mode,
+        "max_abs_error": round(float(error.max()), 5),
+        "mean_abs_error": round(float(error.mean()), 6),
+        "top1_agreement": round(float(np.mean(approx.argmax(axis=1) == exact.argmax(axis=1))), 4),
+        "bytes": quantized.nbytes,
+        "float32_bytes": int(np.asarray(reference, dtype=np.float32).nbytes),
+    }
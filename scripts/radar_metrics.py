@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Per-stage instrumentation for the tech radar pipeline
+Records wall time, item counts, cache hits, HTTP bytes and peak RSS to a JSONL file
+"""
+
+import json
+import pathlib
+import resource
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class StageMetrics:
+    def __init__(self, metrics_path: pathlib.Path, enabled: bool = True,
+                 counters: Optional[Callable[[], Dict[str, int]]] = None):
+        self.metrics_path = metrics_path
+        self.enabled = enabled
+        self.counters = counters or (lambda: {})
+        self.run_id = uuid.uuid4().hex[:12]
+        self.records: List[Dict] = []
+
+    @contextmanager
+    def stage(self, name: str, items: int = 0):
+        """Time a pipeline stage; callers may add fields to the yielded record"""
+        record = {"stage": name, "items": items}
+        before = self.counters()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = round(time.perf_counter() - start, 4)
+            after = self.counters()
+            for key, value in after.items():
+                record[key] = value - before.get(key, 0)
+            record["peak_rss_mb"] = peak_rss_mb()
+            self.records.append(record)
+
+    def record(self, name: str, seconds: float, **fields):
+        """Add a stage that was timed elsewhere, such as a concurrent fetch"""
+        record = {"stage": name, "seconds": round(seconds, 4)}
+        record.update(fields)
+        record["peak_rss_mb"] = peak_rss_mb()
+        self.records.append(record)
+
+    def collapse(self, since: int):
+        """Merge records added since an index into one per stage, e.g. the per-batch stages of a stream"""
+        merged = {}
+        for record in self.records[since:]:
+            current = merged.get(record["stage"])
+            if current is None:
+                merged[record["stage"]] = dict(record)
+                continue
+            for key, value in record.items():
+                if key == "peak_rss_mb":
+                    current[key] = max(current.get(key, 0), value)
+                elif key != "stage" and isinstance(value, (int, float)) and not isinstance(value, bool):
+                    current[key] = round(current.get(key, 0) + value, 4)
+        self.records[since:] = list(merged.values())
+
+    def flush(self):
+        """Append this run's stage records to the JSONL metrics file"""
+        if not self.enabled or not self.records:
+            return
+
+        timestamp = datetime.now().isoformat()
+        self.metrics_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.metrics_path, "a") as f:
+            for record in self.records:
+                f.write(json.dumps({"run_id": self.run_id, "timestamp": timestamp, **record}) + "\n")
+        self.records = []
+
+    def summary(self) -> str:
+        """One line per recorded stage for console output"""
+        return "\n".join(
+            f"   - {record['stage']}: {record['seconds']:.3f}s ({record.get('items', 0)} items)"
+            for record in self.records
+        )
+
+
+def profile_call(func: Callable, mode: str, output_dir: pathlib.Path):
+    """Run func under cProfile or pyinstrument and save the capture"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if mode == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            print("⚠️  pyinstrument not installed - falling back to cProfile")
+        else:
+            profiler = Profiler()
+            profiler.start()
+            try:
+                return func()
+            finally:
+                profiler.stop()
+                output_path = output_dir / "profile.html"
+                output_path.write_text(profiler.output_html())
+                print(f"🔬 Profile saved to {output_path}")
+
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        output_path = output_dir / "profile.pstats"
+        profiler.dump_stats(str(output_path))
+        print(f"🔬 Profile saved to {output_path}")
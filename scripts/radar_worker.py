@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Warm, long-lived tech radar worker
+Loads models once and serves scoring, radar updates and README refreshes over local HTTP
+"""
+
+import json
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+from update_readme import update_now_next
+
+
+def validate_trends(trends) -> List[Dict]:
+    """Reject a scoring request up front, so one bad trend never fails the batch it would join"""
+    if not isinstance(trends, list):
+        raise ValueError("trends must be a list")
+    for index, trend in enumerate(trends):
+        if not isinstance(trend, dict):
+            raise ValueError(f"trend {index} must be an object")
+        if not isinstance(trend.get("name"), str):
+            raise ValueError(f"trend {index} needs a string name")
+        for field in ("description", "language"):
+            if not isinstance(trend.get(field, ""), (str, type(None))):
+                raise ValueError(f"trend {index} has a non-string {field}")
+        if not isinstance(trend.get("topics", []), list):
+            raise ValueError(f"trend {index} has non-list topics")
+    return trends
+
+
+class RadarWorker:
+    def __init__(self, updater, batch_window_ms: int = 20, max_batch: int = 256, cache_flush_batches: int = 10):
+        self.updater = updater
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch = max_batch
+        # New embeddings are written out every few batches, so a long-lived worker neither holds them all
+        # in memory nor loses them when it is killed
+        self.cache_flush_batches = cache_flush_batches
+        self.batches_since_flush = 0
+
+        self.requests: "queue.Queue" = queue.Queue()
+        # Scoring batches, full updates and README writes share the updater, so they never overlap
+        self.updater_lock = threading.Lock()
+        self.metrics_lock = threading.Lock()
+        self.started_at = time.time()
+        self.metrics = {
+            "score_requests": 0,
+            "scored_items": 0,
+            "batches": 0,
+            "max_batch_items": 0,
+            "score_seconds": 0.0,
+            "updates": 0,
+            "readme_refreshes": 0,
+            "errors": 0,
+        }
+
+        self.batcher = threading.Thread(target=self.batch_loop, daemon=True)
+
+    def warm_up(self):
+        """Load every backend the scoring path needs before serving requests"""
+        start = time.perf_counter()
+        self.updater.get_keyword_matcher()
+        self.updater.models.get('sentiment')
+        backend = self.updater.embedding_backend()
+        if backend == 'minilm':
+            self.updater.get_interest_matrix()
+            self.updater.get_category_prototypes()
+        elif backend == 'hashed':
+            embedder = self.updater.get_hashed_embedder()
+            embedder.reference(self.updater.get_all_interests())
+            embedder.reference(self.updater.category_prototype_phrases()[1])
+        print(f"🔥 Worker warmed up in {time.perf_counter() - start:.2f}s")
+
+    def score(self, trends: List[Dict]) -> List[Dict]:
+        """Validate and queue trends for scoring, then wait for the batched result"""
+        validate_trends(trends)
+        future = Future()
+        self.requests.put((trends, future))
+        return future.result()
+
+    def score_batch(self, batch: List[Dict]) -> List[Dict]:
+        with self.updater_lock:
+            scored = self.updater.enhance_trends_with_ai(batch, incremental=False)
+            self.updater.metrics.flush()
+            self.batches_since_flush += 1
+            if self.batches_since_flush >= self.cache_flush_batches:
+                self.flush_embedding_cache()
+        return scored
+
+    def flush_embedding_cache(self):
+        """Write embeddings computed since the last flush; callers hold the updater lock"""
+        self.batches_since_flush = 0
+        cache = self.updater.embedding_cache
+        if cache is not None and cache.pending:
+            self.updater.save_embedding_cache()
+
+    def batch_loop(self):
+        """Merge concurrent scoring requests into batches and score them together"""
+        while True:
+            pending = [self.requests.get()]
+            size = len(pending[0][0])
+            deadline = time.monotonic() + self.batch_window
+            while size < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending.append(item)
+                size += len(item[0])
+
+            batch = [trend for trends, _ in pending for trend in trends]
+            start = time.perf_counter()
+            try:
+                scored = self.score_batch(batch)
+            except Exception:
+                # Score each request on its own, so a failure reaches only the caller that caused it
+                for trends, future in pending:
+                    try:
+                        future.set_result(self.score_batch(trends))
+                    except Exception as e:
+                        with self.metrics_lock:
+                            self.metrics["errors"] += 1
+                        future.set_exception(e)
+                continue
+
+            with self.metrics_lock:
+                self.metrics["batches"] += 1
+                self.metrics["score_requests"] += len(pending)
+                self.metrics["scored_items"] += len(batch)
+                self.metrics["max_batch_items"] = max(self.metrics["max_batch_items"], len(batch))
+                self.metrics["score_seconds"] += time.perf_counter() - start
+
+            offset = 0
+            for trends, future in pending:
+                future.set_result(scored[offset:offset + len(trends)])
+                offset += len(trends)
+
+    def run_update(self) -> Dict:
+        """Run a full radar update with the warm models"""
+        with self.updater_lock:
+            self.updater.fetched_trends = None
+            self.updater.run()
+        with self.metrics_lock:
+            self.metrics["updates"] += 1
+        return {"status": "ok", "scoring_stats": self.updater.scoring_stats}
+
+    def refresh_readme(self) -> Dict:
+        """Refresh the Now/Next section of the README"""
+        with self.updater_lock:
+            update_now_next(self.updater.root)
+        with self.metrics_lock:
+            self.metrics["readme_refreshes"] += 1
+        return {"status": "ok"}
+
+    def health(self) -> Dict:
+        return {
+            "status": "ok",
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "models": self.updater.models.loaded_models(),
+        }
+
+    def get_metrics(self) -> Dict:
+        with self.metrics_lock:
+            metrics = dict(self.metrics)
+        metrics["avg_batch_items"] = metrics["scored_items"] / metrics["batches"] if metrics["batches"] else 0.0
+        metrics["model_load_times"] = self.updater.models.report()
+        if self.updater.embedding_cache is not None:
+            metrics["embedding_cache"] = self.updater.embedding_cache.stats()
+        return metrics
+
+    def make_handler(self):
+        worker = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def send_json(self, status: int, body: Dict):
+                payload = json.dumps(body, default=str).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def read_json(self) -> Dict:
+                length = int(self.headers.get("Content-Length", 0))
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def do_GET(self):
+                if self.path == "/health":
+                    self.send_json(200, worker.health())
+                elif self.path == "/metrics":
+                    self.send_json(200, worker.get_metrics())
+                else:
+                    self.send_json(404, {"error": "not found"})
+
+            def do_POST(self):
+                try:
+                    if self.path == "/score":
+                        try:
+                            body = self.read_json()
+                            if not isinstance(body, dict) or not isinstance(body.get("texts", []), list):
+                                raise ValueError("expected an object with a trends or texts list")
+                            trends = validate_trends(body.get("trends") or [
+                                {"name": "", "description": text} for text in body.get("texts", [])
+                            ])
+                        except ValueError as e:
+                            self.send_json(400, {"error": str(e)})
+                            return
+                        self.send_json(200, {"trends": worker.score(trends)})
+                    elif self.path == "/update":
+                        self.send_json(200, worker.run_update())
+                    elif self.path == "/readme":
+                        self.send_json(200, worker.refresh_readme())
+                    else:
+                        self.send_json(404, {"error": "not found"})
+                except Exception as e:
+                    with worker.metrics_lock:
+                        worker.metrics["errors"] += 1
+                    self.send_json(500, {"error": str(e)})
+
+        return Handler
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8765):
+        """Warm up, then serve requests until interrupted or terminated"""
+        self.warm_up()
+        self.batcher.start()
+        server = ThreadingHTTPServer((host, port), self.make_handler())
+        print(f"🛰️  Radar worker listening on http://{host}:{server.server_port}")
+
+        # Service managers stop the worker with SIGTERM; shut down as cleanly as on Ctrl-C
+        def terminate(signum, frame):
+            raise KeyboardInterrupt
+        signal.signal(signal.SIGTERM, terminate)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("👋 Radar worker stopped")
+        finally:
+            server.server_close()
+            # Waits for an in-flight batch, so the cache is not saved while it is being filled
+            with self.updater_lock:
+                self.updater.save_embedding_cache()
+            self.updater.close_scoring_pool()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Marker-delimited README sections
+Parses every <!-- NAME:START --> ... <!-- NAME:END --> block in one pass, re-renders only sections whose
+inputs changed, and writes the file atomically only when its bytes differ
+"""
+
+import hashlib
+import json
+import os
+import pathlib
+import re
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# The START marker carries a hash of the inputs the block was rendered from
+SECTION_PATTERN = re.compile(
+    r"<!-- (?P<name>[A-Z0-9_]+):START(?: hash=(?P<hash>[0-9a-f]+))? -->\n?"
+    r"(?P<body>.*?)"
+    r"<!-- (?P=name):END -->",
+    re.S
+)
+
+
+def inputs_hash(inputs: Any) -> str:
+    """Short stable hash of a section's JSON-serializable inputs"""
+    content = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+
+
+def render_block(name: str, digest: str, body: str) -> str:
+    return f"<!-- {name}:START hash={digest} -->\n{body.rstrip()}\n<!-- {name}:END -->"
+
+
+def write_if_changed(path: pathlib.Path, content: str) -> bool:
+    """Atomically replace a file, skipping the write entirely when nothing changed"""
+    if path.exists() and path.read_text() == content:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+class ReadmeRenderer:
+    def __init__(self, readme_path: pathlib.Path):
+        self.readme_path = readme_path
+        # Whether the last update changed the file on disk
+        self.written = False
+
+    def update(self, sections: Dict[str, Tuple[Any, Callable[[Any], str]]],
+               legacy_patterns: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Update sections given as name -> (inputs, render); returns unchanged/rendered/inserted per section"""
+        content = self.readme_path.read_text()
+        existing = {match.group("name"): match for match in SECTION_PATTERN.finditer(content)}
+        legacy_patterns = legacy_patterns or {}
+
+        outcomes = {}
+        replacements = {}
+        for name, (inputs, render) in sections.items():
+            digest = inputs_hash(inputs)
+            match = existing.get(name)
+            if match is not None and match.group("hash") == digest:
+                # Same inputs as the rendered block: no template work at all
+                outcomes[name] = "unchanged"
+                continue
+
+            block = render_block(name, digest, render(inputs))
+            if match is not None:
+                replacements[name] = block
+                outcomes[name] = "rendered"
+                continue
+
+            # First run: adopt an unmarked legacy section, otherwise append the block
+            legacy = legacy_patterns.get(name)
+            legacy_match = re.search(legacy, content, re.S | re.M) if legacy else None
+            if legacy_match:
+                content = content[:legacy_match.start()] + block + "\n\n" + content[legacy_match.end():]
+            else:
+                content = content.rstrip("\n") + "\n\n" + block + "\n"
+            outcomes[name] = "inserted"
+
+        if "inserted" in outcomes.values():
+            # Inserting shifted offsets, so rescan before splicing the other blocks
+            existing = {match.group("name"): match for match in SECTION_PATTERN.finditer(content)}
+
+        # One pass over the blocks in document order
+        pieces = []
+        position = 0
+        for name, match in sorted(existing.items(), key=lambda item: item[1].start()):
+            if name in replacements:
+                pieces.append(content[position:match.start()])
+                pieces.append(replacements[name])
+                position = match.end()
+        pieces.append(content[position:])
+
+        self.written = write_if_changed(self.readme_path, "".join(pieces))
+        return outcomes
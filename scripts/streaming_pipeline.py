@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Streaming mode for the tech radar
+Fetch pages flow through normalize -> dedupe as generators and are spooled unscored to disk; once the change
+check passes, the spool flows through micro-batched scoring, the snapshot is written as JSONL and the radar
+keeps only bounded top-k heaps per category
+"""
+
+import heapq
+import json
+import random
+from collections import Counter, defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, Set
+
+from jsonl_snapshot import JsonlSnapshotWriter, JsonlTrends
+from trend_dedupe import StreamingDeduplicator, TrendDeduplicator
+
+
+class RadarAccumulator:
+    """Best trends per category by (ranking, sentiment), holding at most heap_size small records each"""
+
+    # Everything generate_enhanced_radar reads from a trend
+    FIELDS = ("name", "language", "ai_category", "relevance_score", "sentiment_score", "momentum", "topic")
+
+    def __init__(self, ranking: Callable[[Dict], float], heap_size: int = 64):
+        self.ranking = ranking
+        self.heap_size = heap_size
+        self.heaps: Dict[str, List] = defaultdict(list)
+        self.seen = 0
+
+    def push(self, trend: Dict):
+        # Earlier trends win ties, matching the stable sort of the batch radar
+        key = (self.ranking(trend), trend.get("sentiment_score", 0), -self.seen)
+        self.seen += 1
+        heap = self.heaps[trend.get("ai_category", "assess")]
+        if len(heap) >= self.heap_size and key <= heap[0][0]:
+            return
+        entry = (key, {field: trend[field] for field in self.FIELDS if field in trend})
+        if len(heap) < self.heap_size:
+            heapq.heappush(heap, entry)
+        else:
+            heapq.heapreplace(heap, entry)
+
+    def candidates(self) -> List[Dict]:
+        """Every kept trend, best first"""
+        entries = [entry for heap in self.heaps.values() for entry in heap]
+        entries.sort(key=lambda entry: entry[0], reverse=True)
+        return [trend for _, trend in entries]
+
+
+class TopicSample:
+    """Uniform reservoir sample of streamed new or changed trends, the fit set for the run's single centroid update"""
+
+    def __init__(self, size: int = 4096, seed: int = 0):
+        self.size = size
+        self.rng = random.Random(seed)
+        self.trends: List[Dict] = []
+        self.seen = 0
+
+    def add(self, trend: Dict):
+        self.seen += 1
+        if len(self.trends) < self.size:
+            index = len(self.trends)
+            self.trends.append(None)
+        else:
+            index = self.rng.randrange(self.seen)
+            if index >= self.size:
+                return
+        self.trends[index] = {field: trend[field] for field in ("name", "description", "topic") if field in trend}
+
+
+class StreamingRadarPipeline:
+    def __init__(self, updater, batch_size: int = 256, heap_size: int = 64, topic_sample_size: int = 4096):
+        self.updater = updater
+        self.batch_size = batch_size
+        # The radar skips repeated names and busy topics, so keep headroom over the trends it shows
+        self.heap_size = max(heap_size, updater.RADAR_CANDIDATES)
+        self.topic_sample_size = topic_sample_size
+        self.stats = Counter()
+
+    def trends(self) -> Iterator[Dict]:
+        """Unscored trends, page by page as the fetch progresses"""
+        builders = {
+            "github": self.updater.build_github_trends,
+            "stackoverflow": self.updater.build_stackoverflow_trends,
+        }
+        fetcher = self.updater.get_fetcher()
+        repo_pages = 0
+        if fetcher.source_config("github").get("enabled", True):
+            repo_pages = len(fetcher.page_plan("github")[1])
+        # Tags are held back until every repo page is through, so a repo stays canonical for its name
+        tag_pages = []
+        for source, items in fetcher.iter_pages():
+            self.stats["fetched"] += len(items)
+            if source == "stackoverflow" and repo_pages > 0:
+                tag_pages.append(items)
+                continue
+            yield from builders[source](items)
+            if source == "github":
+                repo_pages -= 1
+                if repo_pages == 0:
+                    for held in tag_pages:
+                        yield from builders["stackoverflow"](held)
+                    tag_pages = []
+        for items in tag_pages:
+            yield from builders["stackoverflow"](items)
+
+    def deduped(self, trends: Iterable[Dict]) -> Iterator[Dict]:
+        """Drop near-duplicates of trends already passed downstream"""
+        dedupe_config = self.updater.config.get('dedupe', {})
+        if not dedupe_config.get('enabled', True):
+            seen_names = set()
+            for trend in trends:
+                if trend["name"] not in seen_names:
+                    seen_names.add(trend["name"])
+                    yield trend
+            return
+
+        deduplicator = StreamingDeduplicator(TrendDeduplicator(
+            num_perm=dedupe_config.get('num_perm', 64),
+            bands=dedupe_config.get('bands', 16),
+            threshold=dedupe_config.get('threshold', 0.7)
+        ))
+        for trend in trends:
+            if deduplicator.accept(trend):
+                yield trend
+        self.stats.update(deduplicator.stats())
+
+    def batches(self, trends: Iterable[Dict]) -> Iterator[List[Dict]]:
+        batch = []
+        for trend in trends:
+            batch.append(trend)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def spool(self, trends: Iterable[Dict], path) -> Set[str]:
+        """Write unscored trends to a spool file, recording history per batch; returns their names"""
+        updater = self.updater
+        names = set()
+        with open(path, "w", encoding="utf-8") as f:
+            for batch in self.batches(trends):
+                if updater.history is not None:
+                    self.stats["history"] += updater.history.append(
+                        {updater.trend_key(trend): trend for trend in batch}, save=False
+                    )
+                for trend in batch:
+                    f.write(json.dumps(trend, default=str) + "\n")
+                    names.add(trend['name'])
+                self.stats["spooled"] += len(batch)
+        return names
+
+    def scored(self, batches: Iterable[List[Dict]]) -> Iterator[List[Dict]]:
+        """Score each batch against the previous snapshot's reusable scores"""
+        updater = self.updater
+        previous = updater.load_reusable_scores()
+        for batch in batches:
+            enhanced = updater.enhance_trends_with_ai(batch, previous=previous)
+            updater.attach_history_features(enhanced)
+            self.stats.update(updater.scoring_stats)
+            yield enhanced
+
+    def run(self) -> bool:
+        """Stream one update end to end; returns whether the radar was refreshed"""
+        updater = self.updater
+        old_data = updater.load_previous_snapshot()
+        if old_data and updater.recently_updated(old_data):
+            return False
+        # Names only: the previous trends themselves are never held
+        old_names = {trend['name'] for trend in old_data.get('trends', [])}
+
+        # Unscored trends wait on disk, so nothing is scored before the change check decides
+        spool_path = updater.tech_jsonl_path.with_name(f".{updater.tech_jsonl_path.name}.unscored.tmp")
+        spool_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            return self.update(old_data, old_names, spool_path)
+        finally:
+            spool_path.unlink(missing_ok=True)
+
+    def update(self, old_data: Dict, old_names: Set[str], spool_path) -> bool:
+        """Spool the fetch, run the change check on names, then score the spool only if it passes"""
+        updater = self.updater
+        with updater.metrics.stage("stream") as record:
+            new_names = self.spool(self.deduped(self.trends()), spool_path)
+            record["items"] = self.stats["spooled"]
+        for source, stats in updater.get_fetcher().source_stats.items():
+            updater.metrics.record(f"fetch:{source}", stats["seconds"],
+                                   items=stats["items"], http_bytes=stats["http_bytes"])
+
+        print(f"🌊 Streamed {self.stats['fetched']} items -> {self.stats['spooled']} unique trends "
+              f"({self.stats['dropped']} duplicates dropped)")
+        if updater.history is not None:
+            updater.save_history(self.stats["history"])
+
+        if old_data and not updater.changes_warrant_update(old_names, new_names):
+            return False
+
+        accumulator = RadarAccumulator(updater.ranking_score, self.heap_size)
+        topic_sample = TopicSample(self.topic_sample_size)
+        writer = JsonlSnapshotWriter(updater.tech_jsonl_path)
+        first_record = len(updater.metrics.records)
+        try:
+            with updater.metrics.stage("stream_score") as record:
+                for batch in self.scored(self.batches(JsonlTrends(spool_path))):
+                    for trend in batch:
+                        writer.write(trend)
+                        accumulator.push(trend)
+                    # Reused trends keep their topics and leave the centroids where they are
+                    for trend in updater.rescored_trends:
+                        topic_sample.add(trend)
+                record["items"] = writer.count
+        except BaseException:
+            writer.abort()
+            raise
+        # One record per stage instead of one per micro-batch
+        updater.metrics.collapse(first_record)
+
+        updater.scoring_stats = {"reused": self.stats["reused"], "recomputed": self.stats["recomputed"]}
+        print(f"♻️  Incremental scoring: {self.stats['reused']} reused, {self.stats['recomputed']} recomputed")
+
+        with updater.metrics.stage("radar", accumulator.seen):
+            radar_content = updater.generate_enhanced_radar(accumulator.candidates())
+        with updater.metrics.stage("readme"):
+            updater.update_readme_tech_radar(radar_content)
+        # Streamed topics came from the centroids as they were, so the snapshot is signed before they move
+        metadata = updater.snapshot_metadata()
+        with updater.metrics.stage("cluster_fit", len(topic_sample.trends)):
+            updater.fit_topics(topic_sample.trends)
+        with updater.metrics.stage("snapshot", writer.count):
+            writer.commit(metadata)
+        print(f"📊 Saved {writer.count} enhanced tech trends")
+        return True
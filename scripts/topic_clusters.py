@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Incremental topic clustering for the tech radar
+Mini-batch KMeans over trend embeddings, resumed from the previous run's centroids
+"""
+
+import pathlib
+import uuid
+from typing import Optional
+
+import numpy as np
+
+
+class TopicClusterer:
+    def __init__(self, n_clusters: int = 12, batch_size: int = 1024, iterations: int = 20,
+                 decay: float = 0.5, seed: int = 0):
+        self.n_clusters = n_clusters
+        self.batch_size = batch_size
+        self.iterations = iterations
+        # Weight kept by past points at each run, so centroids keep following new trends
+        self.decay = decay
+        self.rng = np.random.RandomState(seed)
+
+        self.centroids: Optional[np.ndarray] = None
+        self.counts: Optional[np.ndarray] = None
+        # Changes whenever centroids are re-initialized, so stale topic ids are never reused
+        self.model_id: Optional[str] = None
+
+    def load(self, path: pathlib.Path, model_name: str):
+        """Resume from saved centroids built on the same embedding model"""
+        if not path.exists():
+            return
+        try:
+            data = np.load(path)
+            if str(data["model_name"]) != model_name or len(data["centroids"]) != self.n_clusters:
+                return
+            self.centroids = data["centroids"].astype(np.float32)
+            self.counts = data["counts"].astype(np.float64)
+            self.model_id = str(data["model_id"])
+        except Exception as e:
+            print(f"⚠️  Topic centroids unreadable, starting fresh: {e}")
+
+    def save(self, path: pathlib.Path, model_name: str):
+        if self.centroids is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.stem + ".tmp.npz")
+        np.savez(tmp_path, centroids=self.centroids, counts=self.counts,
+                 model_id=self.model_id, model_name=model_name)
+        tmp_path.replace(path)
+
+    @staticmethod
+    def squared_distances(X: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Squared Euclidean distances, shape (points, centroids)"""
+        return (
+            np.einsum("ij,ij->i", X, X)[:, None]
+            - 2 * X @ centroids.T
+            + np.einsum("ij,ij->i", centroids, centroids)[None, :]
+        )
+
+    def init_centroids(self, X: np.ndarray):
+        """k-means++ seeding on a sample of the first batch"""
+        sample = X[self.rng.choice(len(X), min(len(X), 20 * self.n_clusters), replace=False)]
+        centroids = [sample[self.rng.randint(len(sample))]]
+        for _ in range(1, self.n_clusters):
+            distances = self.squared_distances(sample, np.array(centroids)).min(axis=1).clip(min=0)
+            total = distances.sum()
+            probabilities = distances / total if total > 0 else None
+            centroids.append(sample[self.rng.choice(len(sample), p=probabilities)])
+        self.centroids = np.array(centroids, dtype=np.float32)
+        self.counts = np.zeros(self.n_clusters)
+        self.model_id = uuid.uuid4().hex[:12]
+
+    def partial_fit(self, X: np.ndarray):
+        """Move the centroids towards a run's new embeddings"""
+        if len(X) == 0:
+            return
+        X = np.asarray(X, dtype=np.float32)
+        if self.centroids is None:
+            if len(X) < self.n_clusters:
+                return
+            self.init_centroids(X)
+        else:
+            self.counts *= self.decay
+
+        for _ in range(self.iterations):
+            batch = X if len(X) <= self.batch_size else X[self.rng.choice(len(X), self.batch_size, replace=False)]
+            labels = self.squared_distances(batch, self.centroids).argmin(axis=1)
+            batch_counts = np.bincount(labels, minlength=self.n_clusters)
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, labels, batch)
+
+            # Per-centroid learning rate: each centroid is the running mean of the points it has seen
+            updated = batch_counts > 0
+            totals = self.counts[updated] + batch_counts[updated]
+            self.centroids[updated] = (
+                self.centroids[updated] * (self.counts[updated] / totals)[:, None]
+                + sums[updated] / totals[:, None]
+            )
+            self.counts[updated] = totals
+
+    def assign(self, X: np.ndarray) -> np.ndarray:
+        """Nearest-centroid topic per embedding, or -1 before any centroids exist"""
+        if self.centroids is None or len(X) == 0:
+            return np.full(len(X), -1, dtype=np.int64)
+        labels = np.empty(len(X), dtype=np.int64)
+        # Chunked so 100k embeddings never materialize one huge distance matrix
+        for start in range(0, len(X), 8192):
+            chunk = np.asarray(X[start:start + 8192], dtype=np.float32)
+            labels[start:start + 8192] = self.squared_distances(chunk, self.centroids).argmin(axis=1)
+        return labels
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate trend detection for the tech radar
+Groups trends by normalized name and by MinHash/LSH over descriptions and topics, then merges each group
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Mersenne prime for the universal hash family
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.-]*")
+
+
+def normalize_name(name: str) -> str:
+    """Case- and punctuation-insensitive name, so "Next.js", "nextjs" and "next-js" match"""
+    return re.sub(r"[^a-z0-9+#]", "", name.lower())
+
+
+class UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # The lower index stays the root so groups keep fetch order
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+class TrendDeduplicator:
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.7, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, MAX_HASH, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, MAX_HASH, size=num_perm, dtype=np.uint64)
+
+    @staticmethod
+    def shingles(trend: Dict) -> set:
+        """Word unigrams and bigrams of the description, plus topics"""
+        words = TOKEN_PATTERN.findall((trend.get("description") or "").lower())
+        shingles = set(words)
+        shingles.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+        shingles.update(f"topic:{topic}" for topic in trend.get("topics", []))
+        return shingles
+
+    def signature(self, shingles: set) -> np.ndarray:
+        """MinHash signature of one shingle set"""
+        if not shingles:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        hashes = np.array([zlib.crc32(shingle.encode("utf-8")) for shingle in shingles], dtype=np.uint64)
+        # (a * h + b) mod p for every permutation and shingle at once; values stay below 2^64
+        permuted = (np.outer(hashes, self.a) + self.b) % np.uint64(MERSENNE_PRIME)
+        return (permuted & np.uint64(MAX_HASH)).min(axis=0)
+
+    def similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.mean(first == second))
+
+    def clusters(self, trends: List[Dict]) -> List[List[int]]:
+        """Indexes of near-duplicate trends, grouped, in fetch order"""
+        groups = UnionFind(len(trends))
+
+        # Same normalized name: one tech across sources, or a fork or mirror of a repo
+        by_name = defaultdict(list)
+        for index, trend in enumerate(trends):
+            by_name[normalize_name(trend["name"])].append(index)
+
+        # Stack Overflow descriptions are templated, so only repo text goes through LSH
+        text_indexes = [index for index, trend in enumerate(trends) if trend.get("source") != "stackoverflow"]
+        signatures = {index: self.signature(self.shingles(trends[index])) for index in text_indexes}
+
+        for indexes in by_name.values():
+            repos = [index for index in indexes if index in signatures]
+            tags = [index for index in indexes if index not in signatures]
+            # A tag joins the first repo with its name; same-named repos must also share content
+            for index in tags:
+                groups.union(indexes[0], index)
+            for index in repos[1:]:
+                if self.similarity(signatures[repos[0]], signatures[index]) >= self.threshold:
+                    groups.union(repos[0], index)
+
+        # Banded LSH: each member of a bucket is checked against the bucket's first member only
+        for band in range(self.bands):
+            buckets = {}
+            start = band * self.rows
+            for index in text_indexes:
+                signature = signatures[index]
+                if signature[0] == MAX_HASH:
+                    continue
+                key = signature[start:start + self.rows].tobytes()
+                first = buckets.setdefault(key, index)
+                if first != index and self.similarity(signatures[first], signature) >= self.threshold:
+                    groups.union(first, index)
+
+        clustered = defaultdict(list)
+        for index in range(len(trends)):
+            clustered[groups.find(index)].append(index)
+        return [clustered[root] for root in sorted(clustered)]
+
+    @staticmethod
+    def merge(members: List[Dict]) -> Dict:
+        """One canonical trend for a group, carrying every source's signals"""
+        repos = [trend for trend in members if trend.get("source") != "stackoverflow"]
+        # The most-starred repo is canonical; a tag only group keeps its first tag
+        canonical = max(repos, key=lambda trend: trend.get("stars", 0)) if repos else members[0]
+        merged = dict(canonical)
+        if len(members) == 1:
+            return merged
+
+        sources = set()
+        for trend in members:
+            sources.update(trend.get("sources", [trend.get("source", "github")]))
+        merged["sources"] = sorted(sources)
+
+        aliases = {trend.get("full_name", trend["name"]) for trend in members if trend is not canonical}
+        aliases.update(canonical.get("aliases", []))
+        aliases.discard(canonical.get("full_name", canonical["name"]))
+        merged["aliases"] = sorted(aliases)
+
+        topics = list(canonical.get("topics", []))
+        for trend in members:
+            topics.extend(topic for topic in trend.get("topics", []) if topic not in topics)
+        if topics:
+            merged["topics"] = topics
+
+        tag_counts = [trend["count"] for trend in members if "count" in trend]
+        if tag_counts:
+            merged["count"] = max(tag_counts)
+        return merged
+
+    def dedupe(self, trends: List[Dict]) -> Tuple[List[Dict], Dict[str, int]]:
+        """Merge near-duplicates, returning the unique trends and merge stats"""
+        clusters = self.clusters(trends)
+        unique = [self.merge([trends[index] for index in cluster]) for cluster in clusters]
+        stats = {
+            "input": len(trends),
+            "output": len(unique),
+            "merged_groups": sum(1 for cluster in clusters if len(cluster) > 1),
+        }
+        return unique, stats
+
+
+class StreamingDeduplicator:
+    """Incremental form of TrendDeduplicator.clusters for trends arriving one at a time
+
+    Groups cannot be merged after their first member has been emitted, so the first trend seen wins and later
+    near-duplicates are dropped. Callers should feed repos before tags so a repo stays canonical for its name.
+    """
+
+    def __init__(self, deduplicator: TrendDeduplicator):
+        self.deduplicator = deduplicator
+        # Normalized name -> signature of its first repo (None for a tag), and first signature per LSH bucket
+        self.names: Dict[str, Optional[np.ndarray]] = {}
+        self.buckets: List[Dict[bytes, np.ndarray]] = [{} for _ in range(deduplicator.bands)]
+        self.seen = 0
+        self.dropped = 0
+
+    def is_duplicate(self, trend: Dict) -> bool:
+        name = normalize_name(trend["name"])
+        if trend.get("source") == "stackoverflow":
+            return name in self.names
+        dedupe = self.deduplicator
+        # Every 32-bit hash fits in uint32, halving what is kept per repo
+        signature = dedupe.signature(dedupe.shingles(trend)).astype(np.uint32)
+
+        if self.names.get(name) is not None and dedupe.similarity(self.names[name], signature) >= dedupe.threshold:
+            return True
+        if signature[0] != MAX_HASH:
+            keys = [signature[band * dedupe.rows:(band + 1) * dedupe.rows].tobytes() for band in range(dedupe.bands)]
+            for band, key in enumerate(keys):
+                first = self.buckets[band].get(key)
+                if first is not None and dedupe.similarity(first, signature) >= dedupe.threshold:
+                    return True
+            for band, key in enumerate(keys):
+                self.buckets[band].setdefault(key, signature)
+        self.names.setdefault(name, signature)
+        return False
+
+    def accept(self, trend: Dict) -> bool:
+        """Whether a trend is new; duplicates are counted and should be skipped"""
+        self.seen += 1
+        if self.is_duplicate(trend):
+            self.dropped += 1
+            return False
+        if trend.get("source") == "stackoverflow":
+            self.names.setdefault(normalize_name(trend["name"]), None)
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        return {"input": self.seen, "output": self.seen - self.dropped, "dropped": self.dropped}
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Concurrent trend fetching for the tech radar
+Queries every enabled source at once over pooled keep-alive connections
+"""
+
+import asyncio
+import math
+import queue
+import threading
+import time
+from typing import Dict, Iterator, List, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+GITHUB_API_URL = "https://api.github.com"
+STACKEXCHANGE_API_URL = "https://api.stackexchange.com/2.3"
+
+# GitHub search never returns more than 1000 results for one query
+GITHUB_MAX_RESULTS = 1000
+
+
+class TrendFetcher:
+    def __init__(self, sources: Dict, fetch_config: Dict = None, http_cache=None):
+        fetch_config = fetch_config or {}
+        self.sources = sources
+        self.http_cache = http_cache
+        self.timeout = fetch_config.get('timeout_seconds', 10)
+        self.max_concurrency = fetch_config.get('max_concurrency', 4)
+
+        # source -> True when every page came back unchanged (304)
+        self.unchanged: Dict[str, bool] = {}
+        # source -> {"seconds", "items", "http_bytes"} from the last fetch
+        self.source_stats: Dict[str, Dict] = {}
+
+        # One pooled session shared by every request in the run
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def source_config(self, name: str) -> Dict:
+        """Return a source's config, treating missing sources as enabled"""
+        return self.sources.get(name, {"enabled": True})
+
+    def get_json(self, url: str, params: Dict) -> Tuple[Dict, bool, int]:
+        """Blocking GET with a timeout, returning the JSON body, whether it was unchanged and its size"""
+        if self.http_cache is not None:
+            return self.http_cache.get_json(self.session, url, params, self.timeout)
+
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json(), False, len(response.content)
+
+    async def get_page(self, semaphore: asyncio.Semaphore, url: str, params: Dict) -> Tuple[Dict, bool, int]:
+        """Fetch one page in a worker thread under the concurrency bound"""
+        async with semaphore:
+            return await asyncio.to_thread(self.get_json, url, params)
+
+    def page_plan(self, name: str) -> Tuple[str, List[Dict], int, int]:
+        """URL, per-page params, page size and item limit for a source"""
+        config = self.source_config(name)
+        if name == "github":
+            limit = min(config.get("max_repos", 100), GITHUB_MAX_RESULTS)
+            page_size = min(limit, 100)
+            url = f"{config.get('api_url', GITHUB_API_URL)}/search/repositories"
+            base_params = {
+                "q": f"created:>2024-01-01 stars:>{config.get('min_stars', 100)}",
+                "sort": "stars",
+                "order": "desc",
+                "per_page": page_size
+            }
+        else:
+            limit = config.get("max_tags", 50)
+            page_size = min(limit, 100)
+            url = f"{config.get('api_url', STACKEXCHANGE_API_URL)}/tags"
+            base_params = {
+                "order": "desc",
+                "sort": "popular",
+                "site": "stackoverflow",
+                "pagesize": page_size
+            }
+        params = [{**base_params, "page": page} for page in range(1, math.ceil(limit / page_size) + 1)]
+        return url, params, page_size, limit
+
+    async def fetch_github(self, semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Fetch search results from GitHub, paginated up to max_repos"""
+        url, page_params, _, max_repos = self.page_plan("github")
+        pages = await asyncio.gather(*[self.get_page(semaphore, url, params) for params in page_params])
+
+        self.unchanged["github"] = all(not_modified for _, not_modified, _ in pages)
+        self.source_stats["github"]["http_bytes"] = sum(size for _, _, size in pages)
+        items = []
+        for page, _, _ in pages:
+            items.extend(page.get("items", []))
+        return items[:max_repos]
+
+    async def fetch_stackoverflow(self, semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Fetch popular tags from Stack Overflow, paginated up to max_tags"""
+        url, page_params, _, max_tags = self.page_plan("stackoverflow")
+        pages = await asyncio.gather(*[self.get_page(semaphore, url, params) for params in page_params])
+
+        self.unchanged["stackoverflow"] = all(not_modified for _, not_modified, _ in pages)
+        self.source_stats["stackoverflow"]["http_bytes"] = sum(size for _, _, size in pages)
+        items = []
+        for page, _, _ in pages:
+            items.extend(page.get("items", []))
+            if not page.get("has_more", False):
+                break
+        return items[:max_tags]
+
+    async def fetch_source(self, name: str, semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Fetch one source, isolating its errors from the others"""
+        fetchers = {
+            "github": self.fetch_github,
+            "stackoverflow": self.fetch_stackoverflow,
+        }
+        self.unchanged[name] = False
+        self.source_stats[name] = {"seconds": 0.0, "items": 0, "http_bytes": 0}
+        start = time.perf_counter()
+        try:
+            items = await fetchers[name](semaphore)
+        except Exception as e:
+            label = {"github": "GitHub", "stackoverflow": "Stack Overflow"}[name]
+            print(f"Error fetching {label} trends: {e}")
+            items = []
+        self.source_stats[name]["seconds"] = time.perf_counter() - start
+        self.source_stats[name]["items"] = len(items)
+        return items
+
+    async def fetch_all(self, names: List[str] = None) -> Dict[str, List[Dict]]:
+        """Fetch all enabled sources concurrently"""
+        names = names or ["github", "stackoverflow"]
+        enabled = [name for name in names if self.source_config(name).get("enabled", True)]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        results = await asyncio.gather(*[self.fetch_source(name, semaphore) for name in enabled])
+        raw = {name: [] for name in names}
+        raw.update(dict(zip(enabled, results)))
+        return raw
+
+    def fetch(self, names: List[str] = None) -> Dict[str, List[Dict]]:
+        """Synchronous entry point returning raw items per source"""
+        return asyncio.run(self.fetch_all(names))
+
+    async def stream_source(self, name: str, semaphore: asyncio.Semaphore, pages: queue.Queue):
+        """Put each page of a source on the queue as soon as it arrives"""
+        url, page_params, page_size, limit = self.page_plan(name)
+        self.unchanged[name] = False
+        self.source_stats[name] = {"seconds": 0.0, "items": 0, "http_bytes": 0}
+        start = time.perf_counter()
+
+        async def fetch_page(params: Dict):
+            try:
+                body, not_modified, size = await self.get_page(semaphore, url, params)
+            except Exception as e:
+                print(f"Error fetching {name} page {params['page']}: {e}")
+                # Failed pages still arrive, empty, so consumers can count a source's pages
+                await asyncio.to_thread(pages.put, (name, []))
+                return
+            # Later pages may overshoot the limit; trim by the page's position, not arrival order
+            items = body.get("items", [])[:max(0, limit - (params["page"] - 1) * page_size)]
+            self.source_stats[name]["items"] += len(items)
+            self.source_stats[name]["http_bytes"] += size
+            # A full queue blocks the producer, so a slow consumer bounds memory
+            await asyncio.to_thread(pages.put, (name, items))
+
+        await asyncio.gather(*[fetch_page(params) for params in page_params])
+        self.source_stats[name]["seconds"] = time.perf_counter() - start
+
+    def iter_pages(self, names: List[str] = None) -> Iterator[Tuple[str, List[Dict]]]:
+        """Yield (source, raw items) page by page while the remaining pages are still downloading"""
+        names = names or ["github", "stackoverflow"]
+        enabled = [name for name in names if self.source_config(name).get("enabled", True)]
+        pages = queue.Queue(maxsize=self.max_concurrency * 2)
+        done = object()
+
+        async def stream_all():
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            await asyncio.gather(*[self.stream_source(name, semaphore, pages) for name in enabled])
+
+        def produce():
+            try:
+                asyncio.run(stream_all())
+            finally:
+                pages.put(done)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        while True:
+            page = pages.get()
+            if page is done:
+                break
+            yield page
+        producer.join()
+
+    def close(self):
+        self.session.close()
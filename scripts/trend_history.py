@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Append-only trend history for the tech radar
+Stores one JSONL partition per day and keeps per-trend aggregates updated from each run's new rows only
+"""
+
+import json
+import math
+import pathlib
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterator, List, Optional
+
+# Columns kept for every observation
+OBSERVATION_FIELDS = ("stars", "forks", "count")
+
+# Smoothing for the star and fork velocity averages
+VELOCITY_ALPHA = 0.5
+
+
+class TrendHistory:
+    def __init__(self, history_dir: pathlib.Path):
+        self.history_dir = history_dir
+        self.aggregates_path = history_dir / "aggregates.json"
+
+        # trend key -> running aggregate, see update_aggregate
+        self.aggregates: Dict[str, Dict] = {}
+        self.load()
+
+    def load(self):
+        """Load the per-trend aggregates"""
+        if not self.aggregates_path.exists():
+            return
+        try:
+            self.aggregates = json.loads(self.aggregates_path.read_text())
+        except Exception as e:
+            print(f"⚠️  Trend history aggregates unreadable, starting fresh: {e}")
+            self.aggregates = {}
+
+    def save(self):
+        """Write the aggregates next to the target and swap them in"""
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.aggregates_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.aggregates, sort_keys=True))
+        tmp_path.replace(self.aggregates_path)
+
+    def partition_path(self, day: date) -> pathlib.Path:
+        return self.history_dir / f"{day.isoformat()}.jsonl"
+
+    def partitions(self) -> List[pathlib.Path]:
+        """Daily (YYYY-MM-DD) and compacted monthly (YYYY-MM) partitions in date order"""
+        if not self.history_dir.exists():
+            return []
+        return sorted(self.history_dir.glob("*.jsonl"))
+
+    @staticmethod
+    def observation(key: str, trend: Dict, day: date) -> Dict:
+        row = {"key": key, "date": day.isoformat(), "source": trend.get("source")}
+        for field in OBSERVATION_FIELDS:
+            if field in trend:
+                row[field] = trend[field]
+        return row
+
+    def append(self, keyed_trends: Dict[str, Dict], day: Optional[date] = None, save: bool = True) -> int:
+        """Append one observation per trend to the day's partition and update aggregates
+
+        Streaming callers append many batches with save=False and save the aggregates once at the end.
+        """
+        day = day or date.today()
+        rows = [self.observation(key, trend, day) for key, trend in keyed_trends.items()]
+        if not rows:
+            return 0
+
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.partition_path(day), "a") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+
+        for row in rows:
+            self.update_aggregate(row)
+        if save:
+            self.save()
+        return len(rows)
+
+    def update_aggregate(self, row: Dict):
+        """Fold one observation into its trend's aggregate"""
+        last = {field: row[field] for field in OBSERVATION_FIELDS if field in row}
+        aggregate = self.aggregates.get(row["key"])
+        if aggregate is None:
+            self.aggregates[row["key"]] = {
+                "first_seen": row["date"],
+                "last_seen": row["date"],
+                "days_on_list": 1,
+                "last": last,
+                # Last observation from an earlier day, and the smoothed velocities as of that day
+                "previous": None,
+                "previous_velocity": {},
+                "star_velocity": 0.0,
+                "fork_velocity": 0.0,
+            }
+            return
+
+        if row["date"] < aggregate["last_seen"]:
+            # Late rows from an older day never rewind the running state
+            return
+
+        if row["date"] > aggregate["last_seen"]:
+            aggregate["previous"] = {"date": aggregate["last_seen"], **aggregate["last"]}
+            if aggregate["days_on_list"] > 1:
+                aggregate["previous_velocity"] = {
+                    "stars": aggregate["star_velocity"], "forks": aggregate["fork_velocity"]
+                }
+            aggregate["days_on_list"] += 1
+            aggregate["last_seen"] = row["date"]
+        aggregate["last"] = last
+
+        # Reruns on the same day recompute from the same previous observation instead of compounding
+        previous = aggregate["previous"]
+        if previous is None:
+            return
+        days = (date.fromisoformat(row["date"]) - date.fromisoformat(previous["date"])).days
+        for field in ("stars", "forks"):
+            if field not in row or field not in previous:
+                continue
+            rate = (row[field] - previous[field]) / days
+            smoothed = aggregate["previous_velocity"].get(field)
+            if smoothed is not None:
+                rate = VELOCITY_ALPHA * rate + (1 - VELOCITY_ALPHA) * smoothed
+            aggregate[f"{field[:-1]}_velocity"] = rate
+
+    def read_range(self, start: Optional[date] = None, end: Optional[date] = None) -> Iterator[Dict]:
+        """Yield observations dated within [start, end], opening only the partitions that overlap"""
+        start_key = start.isoformat() if start else ""
+        end_key = end.isoformat() if end else "9999-12-31"
+        for path in self.partitions():
+            # Monthly partitions cover every day of their month
+            if path.stem > end_key[:len(path.stem)] or path.stem < start_key[:len(path.stem)]:
+                continue
+            with open(path) as f:
+                for line in f:
+                    row = json.loads(line)
+                    if start_key <= row["date"] <= end_key:
+                        yield row
+
+    def compact(self, before: date) -> int:
+        """Merge daily partitions older than a date into monthly partitions, last row per trend per day"""
+        daily = [path for path in self.partitions() if len(path.stem) == 10 and path.stem < before.isoformat()]
+        by_month = defaultdict(list)
+        for path in daily:
+            by_month[path.stem[:7]].append(path)
+
+        for month, paths in by_month.items():
+            month_path = self.history_dir / f"{month}.jsonl"
+            rows = {}
+            for path in ([month_path] if month_path.exists() else []) + paths:
+                with open(path) as f:
+                    for line in f:
+                        row = json.loads(line)
+                        rows[(row["date"], row["key"])] = row
+
+            tmp_path = month_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                for row_key in sorted(rows):
+                    f.write(json.dumps(rows[row_key]) + "\n")
+            tmp_path.replace(month_path)
+            for path in paths:
+                path.unlink()
+        return len(daily)
+
+    def features(self, key: str) -> Dict:
+        """Ranking features for one trend: velocities, days on list and a 0-1 momentum"""
+        aggregate = self.aggregates.get(key)
+        if aggregate is None:
+            return {"star_velocity": 0.0, "fork_velocity": 0.0, "days_on_list": 0, "momentum": 0.0}
+        velocity = max(aggregate["star_velocity"], 0.0)
+        return {
+            "star_velocity": round(aggregate["star_velocity"], 2),
+            "fork_velocity": round(aggregate["fork_velocity"], 2),
+            "days_on_list": aggregate["days_on_list"],
+            # Log-scaled so a few viral repos do not swamp relevance; 1000 stars/day saturates
+            "momentum": round(min(1.0, math.log1p(velocity) / math.log1p(1000)), 4),
+        }
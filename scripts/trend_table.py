@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Columnar trend table for the tech radar
+Numeric columns live in NumPy arrays, repeated strings are interned, records are built only on demand, and a
+saved table is memory-mapped back on load; scorers write their results straight into the columns
+"""
+
+import json
+import pathlib
+import shutil
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+NUMERIC_COLUMNS = {
+    "stars": np.int64,
+    "forks": np.int64,
+    "count": np.int64,
+    "sentiment_score": np.float32,
+    "relevance_score": np.float32,
+    "category_margin": np.float32,
+    "star_velocity": np.float32,
+    "fork_velocity": np.float32,
+    "days_on_list": np.int64,
+    "momentum": np.float32,
+    "topic": np.int64,
+}
+
+# Few distinct values: stored as integer codes into a shared vocabulary
+CATEGORICAL_COLUMNS = ("language", "ai_category", "source")
+
+# Free text: stored as one UTF-8 buffer plus offsets
+STRING_COLUMNS = ("name", "full_name", "description", "url", "created_at", "updated_at", "fingerprint")
+
+# Lists: stored as JSON text in a string column
+LIST_COLUMNS = ("topics", "domains", "sources", "aliases")
+
+# Column order used when building records, matching the fetched trend layout
+RECORD_ORDER = (
+    "name", "description", "language", "stars", "forks", "count", "url", "created_at", "updated_at",
+    "topics", "full_name", "source", "sources", "aliases", "fingerprint", "ai_category", "domains",
+    "category_margin", "sentiment_score", "relevance_score", "star_velocity", "fork_velocity",
+    "days_on_list", "momentum", "topic",
+)
+
+
+class StringColumn:
+    """Variable-length strings packed into one byte buffer"""
+
+    def __init__(self, buffer: np.ndarray, offsets: np.ndarray):
+        self.buffer = buffer
+        self.offsets = offsets
+
+    @classmethod
+    def from_values(cls, values: List[str]) -> "StringColumn":
+        encoded = [value.encode("utf-8") for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(buffer, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return bytes(self.buffer[start:end]).decode("utf-8")
+
+
+class TrendRecords(Sequence):
+    """Read-only sequence view that materializes one trend dict per access"""
+
+    def __init__(self, table: "TrendTable", indices: Optional[np.ndarray] = None):
+        self.table = table
+        self.indices = np.arange(len(table)) if indices is None else indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return TrendRecords(self.table, self.indices[position])
+        return self.table.record(int(self.indices[position]))
+
+
+class TrendTable:
+    def __init__(self, size: int):
+        self.size = size
+        self.numeric: Dict[str, np.ndarray] = {}
+        # column -> bool mask of rows where the column is set
+        self.present: Dict[str, np.ndarray] = {}
+        self.codes: Dict[str, np.ndarray] = {}
+        self.vocabularies: Dict[str, List[str]] = {}
+        self.strings: Dict[str, StringColumn] = {}
+        self.embeddings: Optional[np.ndarray] = None
+        self.metadata: Dict = {}
+        # String and list cells written by fill(), packed into their columns by seal()
+        self.staged: Dict[str, Dict[int, str]] = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_records(cls, trends: List[Dict], embeddings: Optional[np.ndarray] = None,
+                     exclude: Iterable[str] = ()) -> "TrendTable":
+        """Build a table from trend dicts, leaving out the excluded columns"""
+        table = cls(len(trends))
+        exclude = set(exclude)
+
+        for column, dtype in NUMERIC_COLUMNS.items():
+            if column in exclude:
+                continue
+            present = np.array([column in trend for trend in trends], dtype=bool)
+            if present.any():
+                table.numeric[column] = np.array([trend.get(column, 0) or 0 for trend in trends], dtype=dtype)
+                table.present[column] = present
+
+        for column in CATEGORICAL_COLUMNS:
+            present = np.array([column in trend for trend in trends], dtype=bool)
+            if column in exclude or not present.any():
+                continue
+            vocabulary = {}
+            codes = np.array(
+                [vocabulary.setdefault(trend.get(column) or "", len(vocabulary)) for trend in trends],
+                dtype=np.int32
+            )
+            table.codes[column] = codes
+            table.vocabularies[column] = list(vocabulary)
+            table.present[column] = present
+
+        for column in STRING_COLUMNS + LIST_COLUMNS:
+            present = np.array([column in trend for trend in trends], dtype=bool)
+            if column in exclude or not present.any():
+                continue
+            if column in LIST_COLUMNS:
+                values = [json.dumps(trend.get(column, [])) for trend in trends]
+            else:
+                values = [str(trend.get(column, "")) for trend in trends]
+            table.strings[column] = StringColumn.from_values(values)
+            table.present[column] = present
+
+        if embeddings is not None:
+            table.embeddings = np.asarray(embeddings, dtype=np.float16)
+        return table
+
+    def fill(self, rows: Sequence[int], records: List[Dict], columns: Iterable[str]):
+        """Write the given columns of records into rows, adding columns the table does not have yet
+
+        Numeric and categorical cells are written in place; string and list cells wait for seal().
+        """
+        columns = list(columns)
+        for row, record in zip(rows, records):
+            for column in columns:
+                if column not in record:
+                    continue
+                value = record[column]
+                if column in NUMERIC_COLUMNS:
+                    if column not in self.numeric:
+                        self.numeric[column] = np.zeros(self.size, dtype=NUMERIC_COLUMNS[column])
+                        self.present[column] = np.zeros(self.size, dtype=bool)
+                    self.numeric[column][row] = value or 0
+                elif column in CATEGORICAL_COLUMNS:
+                    if column not in self.codes:
+                        self.codes[column] = np.zeros(self.size, dtype=np.int32)
+                        self.vocabularies[column] = []
+                        self.present[column] = np.zeros(self.size, dtype=bool)
+                    vocabulary = self.vocabularies[column]
+                    value = value or ""
+                    if value not in vocabulary:
+                        vocabulary.append(value)
+                    self.codes[column][row] = vocabulary.index(value)
+                elif column in STRING_COLUMNS or column in LIST_COLUMNS:
+                    text = json.dumps(value) if column in LIST_COLUMNS else str(value)
+                    self.staged.setdefault(column, {})[row] = text
+                    continue
+                else:
+                    continue
+                self.present[column][row] = True
+
+    def seal(self):
+        """Pack staged string and list cells into their columns, keeping unstaged rows' old values"""
+        for column, staged in self.staged.items():
+            old = self.strings.get(column)
+            old_present = self.present.get(column)
+            present = np.zeros(self.size, dtype=bool)
+            values = []
+            for row in range(self.size):
+                if row in staged:
+                    values.append(staged[row])
+                    present[row] = True
+                elif old is not None and old_present[row]:
+                    values.append(old[row])
+                    present[row] = True
+                else:
+                    values.append("")
+            self.strings[column] = StringColumn.from_values(values)
+            self.present[column] = present
+        self.staged = {}
+
+    def value(self, column: str, index: int):
+        """Single cell, or None when the row does not have the column"""
+        present = self.present.get(column)
+        if present is None or not present[index]:
+            return None
+        if column in self.numeric:
+            return self.numeric[column][index].item()
+        if column in self.codes:
+            return self.vocabularies[column][self.codes[column][index]]
+        text = self.strings[column][index]
+        return json.loads(text) if column in LIST_COLUMNS else text
+
+    def record(self, index: int) -> Dict:
+        """Materialize one trend dict"""
+        record = {}
+        for column in RECORD_ORDER:
+            value = self.value(column, index)
+            if value is not None:
+                record[column] = value
+        return record
+
+    def records(self, indices: Optional[np.ndarray] = None) -> TrendRecords:
+        """Lazy sequence of trend dicts"""
+        return TrendRecords(self, indices)
+
+    def category_column(self, column: str) -> np.ndarray:
+        """Decoded categorical column as an object array"""
+        vocabulary = np.array(self.vocabularies[column], dtype=object)
+        return vocabulary[self.codes[column]]
+
+    def save(self, path: pathlib.Path, metadata: Optional[Dict] = None):
+        """Write the table as .npy arrays plus a JSON manifest"""
+        # Write next to the target and swap in, so readers never see a half-written table
+        tmp_path = path.with_name(path.name + ".tmp")
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        tmp_path.mkdir(parents=True)
+        manifest = {
+            "size": self.size,
+            "numeric": list(self.numeric),
+            "categorical": {column: self.vocabularies[column] for column in self.codes},
+            "strings": list(self.strings),
+            "has_embeddings": self.embeddings is not None,
+            "metadata": metadata or {},
+        }
+
+        for column, values in self.numeric.items():
+            np.save(tmp_path / f"{column}.npy", values)
+        for column, codes in self.codes.items():
+            np.save(tmp_path / f"{column}.codes.npy", codes)
+        for column, strings in self.strings.items():
+            np.save(tmp_path / f"{column}.buffer.npy", strings.buffer)
+            np.save(tmp_path / f"{column}.offsets.npy", strings.offsets)
+        for column, present in self.present.items():
+            np.save(tmp_path / f"{column}.present.npy", present)
+        if self.embeddings is not None:
+            np.save(tmp_path / "embeddings.npy", self.embeddings)
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+
+        # Files of a table still memory-mapped by this process stay valid after removal
+        shutil.rmtree(path, ignore_errors=True)
+        tmp_path.rename(path)
+
+    @classmethod
+    def load(cls, path: pathlib.Path, mmap: bool = True) -> "TrendTable":
+        """Load a saved table, memory-mapping its arrays"""
+        manifest = json.loads((path / "manifest.json").read_text())
+        mode = "r" if mmap else None
+        table = cls(manifest["size"])
+        table.metadata = manifest.get("metadata", {})
+
+        for column in manifest["numeric"]:
+            table.numeric[column] = np.load(path / f"{column}.npy", mmap_mode=mode)
+        for column, vocabulary in manifest["categorical"].items():
+            table.codes[column] = np.load(path / f"{column}.codes.npy", mmap_mode=mode)
+            table.vocabularies[column] = vocabulary
+        for column in manifest["strings"]:
+            table.strings[column] = StringColumn(
+                np.load(path / f"{column}.buffer.npy", mmap_mode=mode),
+                np.load(path / f"{column}.offsets.npy", mmap_mode=mode)
+            )
+        columns = list(manifest["numeric"]) + list(manifest["categorical"]) + list(manifest["strings"])
+        for column in columns:
+            table.present[column] = np.load(path / f"{column}.present.npy", mmap_mode=mode)
+        if manifest.get("has_embeddings"):
+            table.embeddings = np.load(path / "embeddings.npy", mmap_mode=mode)
+        return table
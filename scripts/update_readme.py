@@ -1,16 +1,27 @@
-import json, re, pathlib
-root = pathlib.Path(__file__).resolve().parents[1]
-readme = root / "README.md"
-data = json.loads((root / "data" / "now.json").read_text())
-
-block = (
-    "- **Now:** " + data["now"] + "\n"
-    "- **Next:** " + data["next"] + "\n"
-    "- **Exploring:** " + data["exploring"]
-)
-
-txt = readme.read_text()
-pattern = r"(<!-- NOW_NEXT:START -->)(.*?)(<!-- NOW_NEXT:END -->)"
-new = re.sub(pattern, r"\1\n" + block + r"\n\3", txt, flags=re.S)
-readme.write_text(new)
-print("Updated Now/Next/Exploring.")
+import json, pathlib
+
+from readme_sections import ReadmeRenderer
+
+
+def render_now_next(data: dict) -> str:
+    return (
+        "- **Now:** " + data["now"] + "\n"
+        "- **Next:** " + data["next"] + "\n"
+        "- **Exploring:** " + data["exploring"]
+    )
+
+
+def update_now_next(root: pathlib.Path) -> dict:
+    data = json.loads((root / "data" / "now.json").read_text())
+
+    renderer = ReadmeRenderer(root / "README.md")
+    outcomes = renderer.update({"NOW_NEXT": (data, render_now_next)})
+    if renderer.written:
+        print("Updated Now/Next/Exploring.")
+    else:
+        print("Now/Next/Exploring unchanged.")
+    return outcomes
+
+
+if __name__ == "__main__":
+    update_now_next(pathlib.Path(__file__).resolve().parents[1])
@@ -4,82 +4,156 @@ AI-Enhanced Tech Radar Auto-Updater (Fixed Version)
 Uses free AI models with better compatibility handling
 """
 
+import argparse
+import hashlib
 import json
-import re
-import requests
 import pathlib
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 import numpy as np
 from collections import Counter
-import pickle
 
-# AI/ML Libraries with better error handling
-AI_AVAILABLE = False
-AI_MODELS = {}
-
-try:
-    # Try to import AI libraries with specific versions
-    import torch
-    print(f"✅ PyTorch version: {torch.__version__}")
-    
-    # Try sentence transformers with fallback
-    try:
-        from sentence_transformers import SentenceTransformer
-        AI_MODELS['sentence_transformer'] = SentenceTransformer('all-MiniLM-L6-v2')
-        print("✅ Sentence Transformer loaded successfully")
-    except Exception as e:
-        print(f"⚠️ Sentence Transformer failed: {e}")
-        # Fallback to simpler embedding method
-        AI_MODELS['simple_embeddings'] = True
-    
-    # Try sklearn
-    try:
-        from sklearn.cluster import KMeans
-        from sklearn.metrics.pairwise import cosine_similarity
-        AI_MODELS['sklearn'] = True
-        print("✅ Scikit-learn loaded successfully")
-    except Exception as e:
-        print(f"⚠️ Scikit-learn failed: {e}")
-    
-    # Try NLTK
-    try:
-        import nltk
-        nltk.download('vader_lexicon', quiet=True)
-        from nltk.sentiment import SentimentIntensityAnalyzer
-        AI_MODELS['sentiment'] = SentimentIntensityAnalyzer()
-        print("✅ NLTK sentiment analyzer loaded successfully")
-    except Exception as e:
-        print(f"⚠️ NLTK failed: {e}")
-    
-    # Try spaCy
-    try:
-        import spacy
-        AI_MODELS['spacy'] = spacy.load('en_core_web_sm')
-        print("✅ spaCy loaded successfully")
-    except Exception as e:
-        print(f"⚠️ spaCy failed: {e}")
-    
-    # If we have at least some AI capabilities, mark as available
-    if len(AI_MODELS) > 0:
-        AI_AVAILABLE = True
-        print(f"🤖 AI models available: {list(AI_MODELS.keys())}")
-    
-except ImportError as e:
-    print(f"⚠️ AI libraries not available: {e}")
+from embedding_cache import EmbeddingCache
+from hashed_embeddings import HashedEmbedder
+from http_cache import HTTPCache
+from jsonl_snapshot import JsonlSnapshotWriter, load_snapshot
+from keyword_matcher import KeywordMatcher
+from model_registry import EMBEDDING_MODEL_NAME, ModelRegistry
+from parallel_scoring import ParallelScorer, categorize_chunk, sentiment_chunk
+from quantized_similarity import QuantizedMatrix, SimilarityKernel
+from readme_sections import ReadmeRenderer, write_if_changed
+from radar_metrics import StageMetrics, profile_call
+from streaming_pipeline import StreamingRadarPipeline
+from trend_dedupe import TrendDeduplicator
+from trend_fetcher import TrendFetcher
+from trend_history import TrendHistory
+from topic_clusters import TopicClusterer
+from trend_table import TrendTable
+from vector_index import build_or_load
 
 class AITechRadarUpdaterFixed:
-    def __init__(self):
+    SCORE_FIELDS = ('ai_category', 'sentiment_score', 'relevance_score')
+    OPTIONAL_SCORE_FIELDS = ('category_margin', 'domains', 'topic')
+    HISTORY_FIELDS = ('star_velocity', 'fork_velocity', 'days_on_list', 'momentum')
+    
+    # Keyword defaults, extended by categorization_rules in config
+    CATEGORY_KEYWORDS = {
+        "adopt": [
+            "production", "stable", "mature", "enterprise", "production-ready",
+            "battle-tested", "widely-adopted", "industry-standard"
+        ],
+        "trial": [
+            "experimental", "beta", "alpha", "new", "innovative", "promising",
+            "cutting-edge", "next-generation", "revolutionary"
+        ],
+        "assess": [
+            "monitoring", "evaluating", "considering", "potential", "emerging",
+            "trending", "growing", "developing"
+        ],
+        "avoid": [
+            "deprecated", "outdated", "legacy", "security-issue", "performance-problem",
+            "abandoned", "discontinued", "vulnerable"
+        ]
+    }
+    
+    CATEGORIES = ("adopt", "trial", "assess", "avoid")
+    
+    SENTIMENT_KEYWORDS = {
+        "positive": ['fast', 'efficient', 'powerful', 'modern', 'secure', 'scalable', 'reliable'],
+        "negative": ['slow', 'buggy', 'deprecated', 'outdated', 'vulnerable', 'broken']
+    }
+    
+    # Trends per category considered for the radar
+    RADAR_CANDIDATES = 3
+    
+    # Rows scored at a time when scores are written straight into a columnar table
+    TABLE_BATCH_SIZE = 1024
+    
+    # Exemplar phrases per category, overridable via category_prototypes in config
+    DEFAULT_CATEGORY_PROTOTYPES = {
+        "adopt": ["production ready mature widely adopted stable enterprise"],
+        "trial": ["experimental promising new innovative beta"],
+        "assess": ["monitoring evaluating considering potential"],
+        "avoid": ["deprecated outdated security issues performance problems"]
+    }
+    
+    def __init__(self, config_path: pathlib.Path = None):
         self.root = pathlib.Path(__file__).resolve().parents[1]
-        self.readme_path = self.root / "README.md"
-        self.tech_data_path = self.root / "data" / "tech_trends_ai_fixed.json"
-        self.config_path = self.root / "data" / "tech_radar_config.json"
+        self.config_path = config_path or self.root / "data" / "tech_radar_config.json"
         
         # Load configuration
         self.config = self.load_config()
         
+        # Output locations, overridable per profile
+        output_config = self.config.get('output', {})
+        self.readme_path = self.root / output_config.get('readme_path', 'README.md')
+        self.tech_data_path = self.root / output_config.get('snapshot_path', 'data/tech_trends_ai_fixed.json')
+        self.radar_path = self.root / output_config['radar_path'] if 'radar_path' in output_config else None
+        
+        # Snapshots are pretty-printed JSON by default, a memory-mappable columnar table, or JSONL
+        self.snapshot_format = self.config.get('snapshot_format', 'json')
+        self.tech_table_path = self.tech_data_path.with_suffix('.table')
+        self.tech_jsonl_path = self.tech_data_path.with_suffix('.jsonl')
+        
+        # AI backends are loaded on first use, never at import time
+        self.models = ModelRegistry(self.config.get('model_backends', {}))
+        
+        # Source fetcher is created on first fetch
+        self._fetcher = None
+        
+        # Raw trends fetched by should_update_radar, reused by run
+        self.fetched_trends = None
+        
+        # Reused vs recomputed counts from the last scoring pass
+        self.scoring_stats = {}
+        
+        # Trends the last scoring pass actually scored, the only ones that move the topic centroids
+        self.rescored_trends = []
+        
+        # Per-stage timings, written as JSONL at the end of each run
+        metrics_config = self.config.get('metrics', {})
+        self.metrics = StageMetrics(
+            self.root / metrics_config.get('path', 'data/metrics/radar_metrics.jsonl'),
+            enabled=metrics_config.get('enabled', True),
+            counters=self.metric_counters
+        )
+        self.recorded_model_loads = set()
+        
         # Tech radar categories
-        self.categories = ["adopt", "trial", "assess", "avoid"]
+        self.categories = list(self.CATEGORIES)
+        
+        # Interest and category prototype embeddings are computed lazily and reused across trends
+        self._all_interests = None
+        self._interests_digest = None
+        self._interest_matrix = None
+        self._interest_index = None
+        self._interest_kernel = None
+        self._category_prototypes = None
+        self._keyword_matcher = None
+        
+        # Torch-free TF-IDF vectorizer, fitted on first use
+        self._hashed_embedder = None
+        
+        # Topic centroids, resumed from the previous run on first use
+        self._topic_clusterer = None
+        
+        # Worker processes for keyword and VADER scoring, started on the first large batch
+        self._scoring_pool = None
+        
+        # Append-only history of every fetch, with per-trend velocity aggregates
+        history_config = self.config.get('history', {})
+        self.history = None
+        if history_config.get('enabled', True):
+            self.history = TrendHistory(self.root / history_config.get('path', 'data/history'))
+        
+        # Persistent embedding store so each run only embeds unseen text
+        cache_config = self.config.get('embedding_cache', {})
+        self.embedding_cache = None
+        if cache_config.get('enabled', True):
+            self.embedding_cache = EmbeddingCache(
+                self.root / "data" / "embedding_cache",
+                max_entries=cache_config.get('max_entries', 20000)
+            )
         
     def load_config(self) -> Dict:
         """Load configuration from JSON file"""
@@ -88,217 +162,404 @@ class AITechRadarUpdaterFixed:
         return {}
     
     def simple_embedding(self, text: str) -> List[float]:
-        """Simple embedding method as fallback when transformers fail"""
-        # Create a simple bag-of-words embedding
-        words = text.lower().split()
-        # Simple frequency-based embedding (very basic but works)
-        word_freq = Counter(words)
-        # Normalize to unit vector
-        total = sum(word_freq.values())
-        if total == 0:
-            return [0.0] * 100
-        return [word_freq.get(f"word_{i}", 0) / total for i in range(100)]
-    
-    def simple_similarity(self, text1: str, text2: str) -> float:
-        """Calculate simple similarity between two texts"""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        return len(intersection) / len(union) if union else 0.0
+        """Embedding that needs no transformers: hashed TF-IDF features folded into a dense vector"""
+        return self.get_hashed_embedder().encode_dense([text])[0].tolist()
     
-    def fetch_github_trends(self) -> List[Dict]:
-        """Fetch trending repositories from GitHub with enhanced data"""
+    def ai_available(self) -> bool:
+        """Check whether the AI stack can be used, loading torch on first call"""
+        return self.models.has('torch')
+    
+    def embedding_backend(self) -> str:
+        """'minilm', 'hashed' or None; 'auto' in config uses MiniLM when it loads and hashed features otherwise"""
+        choice = self.config.get('embedding_backend', 'auto')
+        if choice == 'hashed':
+            return 'hashed'
+        if choice in ('auto', 'minilm') and self.models.has('sentence_transformer'):
+            return 'minilm'
+        return 'hashed' if choice == 'auto' else None
+    
+    def embedding_model_name(self) -> str:
+        """Identity of the active embedding space, keying caches, indexes and centroids"""
+        backend = self.embedding_backend()
+        if backend == 'hashed':
+            return self.get_hashed_embedder().model_name
+        return EMBEDDING_MODEL_NAME if backend == 'minilm' else None
+    
+    def get_hashed_embedder(self) -> HashedEmbedder:
+        """Hashed-feature vectorizer, IDF-weighted when a background corpus is configured"""
+        if self._hashed_embedder is None:
+            hashed_config = self.config.get('hashed_embeddings', {})
+            self._hashed_embedder = HashedEmbedder(
+                bits=hashed_config.get('bits', 18),
+                word_ngrams=hashed_config.get('word_ngrams', 2),
+                char_ngrams=tuple(hashed_config.get('char_ngrams', [3, 5])),
+                dense_dim=hashed_config.get('dense_dim', 256)
+            )
+            if 'idf_corpus' in hashed_config:
+                self._hashed_embedder.fit(self.idf_corpus(hashed_config['idf_corpus']))
+            else:
+                # No real-data corpus ships yet, so plain TF stays the default rather than a made-up background
+                print("ℹ️  No hashed_embeddings.idf_corpus configured, using plain term frequency")
+        return self._hashed_embedder
+    
+    def idf_corpus(self, path: str) -> List[str]:
+        """Background texts, one per line; a committed corpus keeps the IDF, and so the scores, stable"""
+        corpus_path = self.root / path
         try:
-            url = "https://api.github.com/search/repositories"
-            params = {
-                "q": "created:>2024-01-01 stars:>100",
-                "sort": "stars",
-                "order": "desc",
-                "per_page": 100
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                repos = response.json()["items"]
-                enhanced_repos = []
-                
-                for repo in repos:
-                    if repo["language"] and repo["description"]:
-                        repo_data = {
-                            "name": repo["name"],
-                            "description": repo["description"],
-                            "language": repo["language"],
-                            "stars": repo["stargazers_count"],
-                            "forks": repo["forks_count"],
-                            "url": repo["html_url"],
-                            "created_at": repo["created_at"],
-                            "updated_at": repo["updated_at"],
-                            "topics": repo.get("topics", []),
-                            "full_name": repo["full_name"]
-                        }
-                        
-                        # Enhanced categorization
-                        repo_data["ai_category"] = self.categorize_tech_enhanced(repo_data)
-                        repo_data["sentiment_score"] = self.analyze_sentiment_enhanced(repo_data["description"])
-                        repo_data["relevance_score"] = self.calculate_relevance_enhanced(repo_data)
-                        
-                        enhanced_repos.append(repo_data)
-                
-                return enhanced_repos
-                
+            return [
+                line for line in corpus_path.read_text().splitlines()
+                if line.strip() and not line.startswith('#')
+            ]
         except Exception as e:
-            print(f"Error fetching GitHub trends: {e}")
+            print(f"⚠️  Could not read IDF corpus {corpus_path}, using plain term frequency: {e}")
+            return []
+    
+    def export_idf_corpus(self, path: pathlib.Path) -> int:
+        """Freeze the current snapshot's trend texts as an IDF corpus, one unique document per line"""
+        documents = {}
+        for trend in self.load_previous_snapshot().get('trends', []):
+            text = " ".join([trend['name'], trend.get('description', '')] + trend.get('topics', [])).strip()
+            documents.setdefault(" ".join(text.split()), None)
         
-        return []
+        header = (
+            f"# Frozen IDF background exported from {self.tech_data_path.name} on {datetime.now().date()}.\n"
+            "# One document per line; lines starting with # are ignored. Editing this file changes the hashed\n"
+            "# model name, so every trend is rescored on the next run.\n"
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(header + "".join(f"{document}\n" for document in documents))
+        return len(documents)
     
-    def fetch_stackoverflow_trends(self) -> List[Dict]:
-        """Fetch trending technologies from Stack Overflow"""
+    def encode_texts(self, texts: List[str]) -> np.ndarray:
+        """Encode texts into normalized embeddings, using the persistent cache"""
+        if self.embedding_backend() == 'hashed':
+            # Cheaper to recompute than to look up
+            return self.get_hashed_embedder().encode_dense(texts)
+        
+        model = self.models.get('sentence_transformer')
+        
+        def encoder(batch: List[str]) -> np.ndarray:
+            return model.encode(batch, normalize_embeddings=True)
+        
+        if self.embedding_cache is None:
+            return encoder(texts)
+        return self.embedding_cache.encode(texts, EMBEDDING_MODEL_NAME, encoder)
+    
+    def metric_counters(self) -> Dict[str, int]:
+        """Running cache and HTTP counters, diffed by each instrumented stage"""
+        counters = {}
+        if self.embedding_cache is not None:
+            counters["cache_hits"] = self.embedding_cache.hits
+            counters["cache_misses"] = self.embedding_cache.misses
+        if self._fetcher is not None and self._fetcher.http_cache is not None:
+            counters["http_bytes"] = self._fetcher.http_cache.bytes_downloaded
+        return counters
+    
+    def get_fetcher(self) -> TrendFetcher:
+        """Return the shared, session-pooled source fetcher"""
+        if self._fetcher is None:
+            http_cache = None
+            if self.config.get('http_cache', {}).get('enabled', True):
+                http_cache = HTTPCache(self.root / "data" / "http_cache")
+            self._fetcher = TrendFetcher(
+                self.config.get('sources', {}), self.config.get('fetch', {}), http_cache
+            )
+        return self._fetcher
+    
+    def load_previous_snapshot(self) -> Dict:
+        """Load the last saved snapshot, preferring the configured format, or an empty dict
+        
+        Switching formats (e.g. turning streaming on) falls back to the snapshot the last run wrote,
+        so the first run in the new format still has names to compare and scores to reuse.
+        """
+        fallbacks = [fmt for fmt in ('json', 'jsonl', 'columnar') if fmt != self.snapshot_format]
+        for snapshot_format in [self.snapshot_format] + fallbacks:
+            snapshot = self.read_snapshot(snapshot_format)
+            if snapshot:
+                return snapshot
+        return {}
+    
+    def read_snapshot(self, snapshot_format: str) -> Dict:
+        """Load the snapshot saved in one format, or an empty dict"""
+        if snapshot_format == 'columnar':
+            if not (self.tech_table_path / "manifest.json").exists():
+                return {}
+            try:
+                table = TrendTable.load(self.tech_table_path)
+                # Trend records are materialized one at a time as callers iterate
+                return {**table.metadata, "trends": table.records()}
+            except Exception as e:
+                print(f"⚠️  Could not read previous snapshot: {e}")
+                return {}
+        
+        if snapshot_format == 'jsonl':
+            try:
+                # Trends are parsed line by line as callers iterate
+                return load_snapshot(self.tech_jsonl_path)
+            except Exception as e:
+                print(f"⚠️  Could not read previous snapshot: {e}")
+                return {}
+        
+        if not self.tech_data_path.exists():
+            return {}
         try:
-            url = "https://api.stackexchange.com/2.3/tags"
-            params = {
-                "order": "desc",
-                "sort": "popular",
-                "site": "stackoverflow",
-                "pagesize": 50
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                tags = response.json()["items"]
-                enhanced_tags = []
-                
-                for tag in tags:
-                    tag_data = {
-                        "name": tag["name"],
-                        "count": tag["count"],
-                        "description": f"Popular {tag['name']} technology with {tag['count']} questions"
-                    }
-                    
-                    # Enhanced categorization
-                    tag_data["ai_category"] = self.categorize_tech_enhanced(tag_data)
-                    tag_data["sentiment_score"] = self.analyze_sentiment_enhanced(tag_data["description"])
-                    tag_data["relevance_score"] = self.calculate_relevance_enhanced(tag_data)
-                    
-                    enhanced_tags.append(tag_data)
-                
-                return enhanced_tags
-                
+            return json.loads(self.tech_data_path.read_text())
         except Exception as e:
-            print(f"Error fetching Stack Overflow trends: {e}")
+            print(f"⚠️  Could not read previous snapshot: {e}")
+            return {}
+    
+    def build_source_trends(self, source: str, raw_items: List[Dict]) -> List[Dict]:
+        """Build a source's unscored trends from the live (or 304-served cached) payload
+        
+        An unchanged payload is still rebuilt: the HTTP cache's baseline is the last fetch, not the last
+        snapshot written, and scores are reused per trend through the fingerprint index anyway.
+        """
+        builders = {
+            "github": self.build_github_trends,
+            "stackoverflow": self.build_stackoverflow_trends,
+        }
+        if self.get_fetcher().unchanged.get(source):
+            print(f"♻️  {source} payload unchanged since the last fetch")
+        return builders[source](raw_items)
+    
+    def build_github_trends(self, repos: List[Dict]) -> List[Dict]:
+        """Turn raw GitHub search items into unscored trend records"""
+        repo_trends = []
+        
+        for repo in repos:
+            if repo["language"] and repo["description"]:
+                repo_data = {
+                    "name": repo["name"],
+                    "description": repo["description"],
+                    "language": repo["language"],
+                    "stars": repo["stargazers_count"],
+                    "forks": repo["forks_count"],
+                    "url": repo["html_url"],
+                    "created_at": repo["created_at"],
+                    "updated_at": repo["updated_at"],
+                    "topics": repo.get("topics", []),
+                    "full_name": repo["full_name"],
+                    "source": "github"
+                }
+                repo_trends.append(repo_data)
         
-        return []
+        return repo_trends
+    
+    def build_stackoverflow_trends(self, tags: List[Dict]) -> List[Dict]:
+        """Turn raw Stack Overflow tags into unscored trend records"""
+        return [
+            {
+                "name": tag["name"],
+                "count": tag["count"],
+                "description": f"Popular {tag['name']} technology with {tag['count']} questions",
+                "source": "stackoverflow"
+            }
+            for tag in tags
+        ]
+    
+    def fetch_github_trends(self) -> List[Dict]:
+        """Fetch trending repositories from GitHub with enhanced data"""
+        raw = self.get_fetcher().fetch(["github"])
+        return self.enhance_trends_with_ai(self.build_github_trends(raw["github"]))
+    
+    def fetch_stackoverflow_trends(self) -> List[Dict]:
+        """Fetch trending technologies from Stack Overflow"""
+        raw = self.get_fetcher().fetch(["stackoverflow"])
+        return self.enhance_trends_with_ai(self.build_stackoverflow_trends(raw["stackoverflow"]))
     
     def fetch_all_trends(self) -> List[Dict]:
-        """Fetch and combine trends from all sources"""
-        github_trends = self.fetch_github_trends()
-        stackoverflow_trends = self.fetch_stackoverflow_trends()
+        """Fetch and combine trends from all sources, without scoring them"""
+        # All enabled sources are queried concurrently
+        with self.metrics.stage("fetch") as record:
+            raw = self.get_fetcher().fetch()
+            record["items"] = sum(len(items) for items in raw.values())
+        for source, stats in self.get_fetcher().source_stats.items():
+            self.metrics.record(f"fetch:{source}", stats["seconds"],
+                                items=stats["items"], http_bytes=stats["http_bytes"])
+        
+        github_trends = self.build_source_trends("github", raw["github"])
+        stackoverflow_trends = self.build_source_trends("stackoverflow", raw["stackoverflow"])
+        
+        http_cache = self.get_fetcher().http_cache
+        if http_cache is not None:
+            stats = http_cache.stats()
+            print(f"🌐 HTTP: {stats['requests']} requests, {stats['not_modified']} not modified, "
+                  f"{stats['bytes_downloaded']} bytes downloaded, {stats['bytes_saved']} bytes saved")
         
         # Combine and deduplicate trends
         all_trends = github_trends + stackoverflow_trends
-        unique_trends = []
-        seen_names = set()
-        
-        for trend in all_trends:
-            if trend["name"] not in seen_names:
-                unique_trends.append(trend)
-                seen_names.add(trend["name"])
+        return self.deduplicate_trends(all_trends)
+    
+    def deduplicate_trends(self, trends: List[Dict]) -> List[Dict]:
+        """Merge the same tech across sources, forks and mirrors into one trend each"""
+        dedupe_config = self.config.get('dedupe', {})
+        if not dedupe_config.get('enabled', True):
+            unique_trends = []
+            seen_names = set()
+            for trend in trends:
+                if trend["name"] not in seen_names:
+                    unique_trends.append(trend)
+                    seen_names.add(trend["name"])
+            return unique_trends
         
+        deduplicator = TrendDeduplicator(
+            num_perm=dedupe_config.get('num_perm', 64),
+            bands=dedupe_config.get('bands', 16),
+            threshold=dedupe_config.get('threshold', 0.7)
+        )
+        with self.metrics.stage("dedupe", len(trends)):
+            unique_trends, stats = deduplicator.dedupe(trends)
+        print(f"🧬 Dedupe: {stats['input']} trends -> {stats['output']} "
+              f"({stats['merged_groups']} merged groups)")
         return unique_trends
     
-    def categorize_tech_enhanced(self, tech_data: Dict) -> str:
-        """Enhanced tech categorization with fallback methods"""
-        text = f"{tech_data['name']} {tech_data.get('description', '')} {tech_data.get('language', '')}".lower()
-        
-        # Define category keywords
-        category_keywords = {
-            "adopt": [
-                "production", "stable", "mature", "enterprise", "production-ready",
-                "battle-tested", "widely-adopted", "industry-standard"
-            ],
-            "trial": [
-                "experimental", "beta", "alpha", "new", "innovative", "promising",
-                "cutting-edge", "next-generation", "revolutionary"
-            ],
-            "assess": [
-                "monitoring", "evaluating", "considering", "potential", "emerging",
-                "trending", "growing", "developing"
-            ],
-            "avoid": [
-                "deprecated", "outdated", "legacy", "security-issue", "performance-problem",
-                "abandoned", "discontinued", "vulnerable"
-            ]
-        }
+    @classmethod
+    def build_keyword_matcher(cls, config: Dict) -> KeywordMatcher:
+        """Keyword engine from code defaults and a config's categorization_rules"""
+        groups = {category: list(keywords) for category, keywords in cls.CATEGORY_KEYWORDS.items()}
+        for polarity, keywords in cls.SENTIMENT_KEYWORDS.items():
+            groups[f"sentiment:{polarity}"] = list(keywords)
         
-        # Calculate scores for each category
-        category_scores = {}
-        for category, keywords in category_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            category_scores[category] = score
+        for rule_name, keywords in config.get('categorization_rules', {}).items():
+            name = rule_name[:-len('_keywords')] if rule_name.endswith('_keywords') else rule_name
+            if name in cls.CATEGORIES:
+                groups[name].extend(keywords)
+            else:
+                groups[f"domain:{name}"] = list(keywords)
         
-        # Return category with highest score, default to assess
-        if max(category_scores.values()) > 0:
-            return max(category_scores, key=category_scores.get)
-        else:
-            return "assess"
+        return KeywordMatcher(groups)
     
-    def ai_categorize_tech(self, tech_data: Dict) -> str:
-        """AI-powered categorization with fallback"""
-        if not AI_AVAILABLE:
-            return "assess"
+    def get_keyword_matcher(self) -> KeywordMatcher:
+        """Build the shared keyword engine once"""
+        if self._keyword_matcher is None:
+            self._keyword_matcher = self.build_keyword_matcher(self.config)
+        return self._keyword_matcher
+    
+    @staticmethod
+    def keyword_text(tech_data: Dict) -> str:
+        """Text scanned by the keyword engine for categorization"""
+        return f"{tech_data['name']} {tech_data.get('description', '')} {tech_data.get('language', '')}"
+    
+    def categorize_batch(self, trends: List[Dict]) -> List[Tuple[str, List[str]]]:
+        """Keyword-categorize a batch in one scan per text, returning (category, domains) pairs"""
+        return self.categorize_texts([self.keyword_text(trend) for trend in trends])
+    
+    def categorize_texts(self, texts: List[str]) -> List[Tuple[str, List[str]]]:
+        """Keyword-categorize texts already built by keyword_text"""
+        return self.keyword_categories(self.get_keyword_matcher(), texts)
+    
+    @classmethod
+    def keyword_categories(cls, matcher: KeywordMatcher, texts: List[str]) -> List[Tuple[str, List[str]]]:
+        """(category, domains) per text from one scan each; needs only the matcher, so pool workers share it"""
+        categories = cls.CATEGORIES
+        counts = matcher.count_matrix(texts)
+        
+        category_columns = [matcher.groups.index(category) for category in categories]
+        domain_columns = [
+            (index, group.split(':', 1)[1])
+            for index, group in enumerate(matcher.groups) if group.startswith('domain:')
+        ]
         
+        results = []
+        for row in counts:
+            category_scores = row[category_columns]
+            # Highest score wins, ties go to the earlier category, default to assess
+            category = categories[int(category_scores.argmax())] if category_scores.max() > 0 else "assess"
+            domains = [name for index, name in domain_columns if row[index] > 0]
+            results.append((category, domains))
+        return results
+    
+    def categorize_tech_enhanced(self, tech_data: Dict) -> str:
+        """Enhanced tech categorization with fallback methods"""
+        return self.categorize_batch([tech_data])[0][0]
+    
+    def category_prototype_phrases(self) -> Tuple[List[str], List[str]]:
+        """Every category exemplar with its category label"""
+        prototypes = self.config.get('category_prototypes', self.DEFAULT_CATEGORY_PROTOTYPES)
+        labels = []
+        phrases = []
+        for category in self.categories:
+            for phrase in prototypes.get(category, []):
+                labels.append(category)
+                phrases.append(phrase)
+        return labels, phrases
+    
+    def get_category_prototypes(self) -> Tuple[List[str], np.ndarray]:
+        """Embed every category exemplar once, returning row labels and a normalized matrix"""
+        if self._category_prototypes is None:
+            labels, phrases = self.category_prototype_phrases()
+            self._category_prototypes = (labels, self.encode_texts(phrases))
+        return self._category_prototypes
+    
+    def ai_categorize_batch(self, trends: List[Dict]) -> List[Tuple[str, float]]:
+        """Categorize many trends with one matrix multiply, returning (category, margin) pairs"""
+        backend = self.embedding_backend()
         try:
-            text = f"{tech_data['name']} {tech_data.get('description', '')} {tech_data.get('language', '')}"
+            if backend is None or not trends:
+                # Fallback to enhanced categorization (not recursive)
+                return [(self.categorize_tech_enhanced(trend), None) for trend in trends]
             
-            # Use sentence transformer if available
-            if 'sentence_transformer' in AI_MODELS:
-                embedding = AI_MODELS['sentence_transformer'].encode([text])
-                
-                # Define category embeddings
-                category_texts = {
-                    "adopt": "production ready mature widely adopted stable enterprise",
-                    "trial": "experimental promising new innovative beta",
-                    "assess": "monitoring evaluating considering potential",
-                    "avoid": "deprecated outdated security issues performance problems"
-                }
-                
-                similarities = {}
-                for category, cat_text in category_texts.items():
-                    cat_embedding = AI_MODELS['sentence_transformer'].encode([cat_text])
-                    if 'sklearn' in AI_MODELS:
-                        similarity = cosine_similarity(embedding, cat_embedding)[0][0]
-                        similarities[category] = similarity
-                    else:
-                        # Fallback to simple similarity
-                        similarities[category] = self.simple_similarity(text, cat_text)
-                
-                return max(similarities, key=similarities.get)
+            texts = [
+                f"{trend['name']} {trend.get('description', '')} {trend.get('language', '')}"
+                for trend in trends
+            ]
+            if backend == 'hashed':
+                # Sparse TF-IDF rows against the exemplars' rows, no dense embedding involved
+                labels, phrases = self.category_prototype_phrases()
+                similarities = self.get_hashed_embedder().similarity(texts, phrases)
+            else:
+                labels, prototype_matrix = self.get_category_prototypes()
+                similarities = self.encode_texts(texts) @ prototype_matrix.T
+            
+            # A category scores as its closest exemplar
+            categories = [category for category in self.categories if category in labels]
+            label_array = np.array(labels)
+            category_scores = np.stack([
+                similarities[:, label_array == category].max(axis=1) for category in categories
+            ], axis=1)
             
-            # Fallback to enhanced categorization (not recursive)
-            return self.categorize_tech_enhanced(tech_data)
+            best = category_scores.argmax(axis=1)
+            ordered = np.sort(category_scores, axis=1)
+            margins = ordered[:, -1] - ordered[:, -2] if len(categories) > 1 else ordered[:, -1]
+            
+            return [(categories[index], float(margin)) for index, margin in zip(best, margins)]
             
         except Exception as e:
             print(f"Error in AI categorization: {e}")
-            return "assess"
+            return [("assess", None)] * len(trends)
+    
+    def ai_categorize_tech(self, tech_data: Dict) -> str:
+        """AI-powered categorization with fallback"""
+        return self.ai_categorize_batch([tech_data])[0][0]
+    
+    def keyword_sentiment_batch(self, texts: List[str]) -> List[float]:
+        """Keyword-based sentiment for a batch of texts"""
+        return self.keyword_sentiments(self.get_keyword_matcher(), texts)
+    
+    @staticmethod
+    def keyword_sentiments(matcher: KeywordMatcher, texts: List[str]) -> List[float]:
+        """Keyword sentiment per text; needs only the matcher, so pool workers share it"""
+        counts = matcher.count_matrix(texts)
+        positive = counts[:, matcher.groups.index('sentiment:positive')]
+        negative = counts[:, matcher.groups.index('sentiment:negative')]
+        total = positive + negative
+        scores = np.divide(positive - negative, total, out=np.zeros(len(texts)), where=total > 0)
+        return [float(score) for score in scores]
+    
+    def analyze_sentiment_batch(self, texts: List[str]) -> List[float]:
+        """Sentiment for a batch of texts, using one keyword scan when VADER is unavailable"""
+        if not self.models.has('sentiment'):
+            return self.keyword_sentiment_batch(texts)
+        return [self.analyze_sentiment_enhanced(text) for text in texts]
     
     def analyze_sentiment_enhanced(self, text: str) -> float:
         """Enhanced sentiment analysis with fallback"""
-        if not AI_AVAILABLE or 'sentiment' not in AI_MODELS:
+        if not self.models.has('sentiment'):
             # Simple sentiment analysis based on keywords
-            positive_words = ['fast', 'efficient', 'powerful', 'modern', 'secure', 'scalable', 'reliable']
-            negative_words = ['slow', 'buggy', 'deprecated', 'outdated', 'vulnerable', 'broken']
-            
-            text_lower = text.lower()
-            positive_score = sum(1 for word in positive_words if word in text_lower)
-            negative_score = sum(1 for word in negative_words if word in text_lower)
-            
-            total = positive_score + negative_score
-            if total == 0:
-                return 0.0
-            return (positive_score - negative_score) / total
+            return self.keyword_sentiment_batch([text])[0]
         
         try:
-            sentiment = AI_MODELS['sentiment'].polarity_scores(text)
+            sentiment = self.models.get('sentiment').polarity_scores(text)
             return sentiment['compound']
         except Exception as e:
             print(f"Error in sentiment analysis: {e}")
@@ -306,41 +567,133 @@ class AITechRadarUpdaterFixed:
     
     def calculate_relevance_enhanced(self, tech_data: Dict) -> float:
         """Enhanced relevance calculation"""
-        if not AI_AVAILABLE:
-            return 0.5
+        return self.calculate_relevance_batch([tech_data])[0]
+    
+    def get_all_interests(self) -> List[str]:
+        """Flatten the configured interests, plus any interest documents, into a single list
+        
+        The documents are globbed and read once per updater; every later call returns the same list.
+        """
+        if self._all_interests is None:
+            self._all_interests = self.read_interests()
+            content = json.dumps(self._all_interests)
+            self._interests_digest = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        return self._all_interests
+    
+    def read_interests(self) -> List[str]:
+        """Configured interests followed by the text of every interest document"""
+        your_interests = self.config.get('your_interests', {})
+        all_interests = []
+        for category, interests in your_interests.items():
+            all_interests.extend(interests)
+        
+        # Curated descriptions such as project READMEs, one interest per file
+        for pattern in self.config.get('interest_documents', []):
+            for path in sorted(self.root.glob(pattern)):
+                text = path.read_text(errors='ignore').strip()
+                if text:
+                    # The embedding model truncates long inputs anyway
+                    all_interests.append(text[:2000])
+        return all_interests
+    
+    def interest_key(self) -> str:
+        """Hash of the embedding model and every interest text"""
+        self.get_all_interests()
+        content = json.dumps([self.embedding_model_name(), self._interests_digest])
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+    
+    def get_interest_matrix(self) -> np.ndarray:
+        """Encode all interests once into a normalized embedding matrix"""
+        if self._interest_matrix is None:
+            self._interest_matrix = self.encode_texts(self.get_all_interests())
+        return self._interest_matrix
+    
+    def get_interest_index(self, queries: np.ndarray = None):
+        """Persisted vector index over the interest embeddings, or None when brute force is cheaper
+        
+        Trend embeddings passed as queries check a rebuilt index's recall against real lookups.
+        """
+        index_config = self.config.get('vector_index', {})
+        if len(self.get_all_interests()) < index_config.get('min_size', 256):
+            return None
+        if self._interest_index is None:
+            mode = self.quantization_mode()
+            self._interest_index = build_or_load(
+                index_config.get('kind', 'exact'),
+                {**index_config.get('params', {}), "quantization": mode},
+                self.get_interest_matrix(),
+                f"{self.interest_key()}:{mode}",
+                self.root / index_config.get('path', 'data/vector_index'),
+                min_recall=index_config.get('min_recall', 0.9),
+                queries=queries
+            )
+        return self._interest_index
+    
+    def quantization_mode(self) -> str:
+        """Storage precision for reference embeddings: none, float16 or int8"""
+        return self.config.get('quantization', {}).get('mode', 'none')
+    
+    def make_similarity_kernel(self, matrix: np.ndarray) -> SimilarityKernel:
+        """Similarity kernel over a matrix stored at the configured precision"""
+        chunk_rows = self.config.get('quantization', {}).get('chunk_rows', 4096)
+        return SimilarityKernel(QuantizedMatrix.from_float(matrix, self.quantization_mode()), chunk_rows)
+    
+    def get_interest_kernel(self) -> SimilarityKernel:
+        """Kernel over the interest embeddings, kept with its buffers for later batches"""
+        if self._interest_kernel is None:
+            self._interest_kernel = self.make_similarity_kernel(self.get_interest_matrix())
+        return self._interest_kernel
+    
+    def calculate_relevance_batch(self, trends: List[Dict]) -> List[float]:
+        """Score relevance of many trends against all interests in one pass"""
+        scores = self.calculate_relevance_profiles(trends, [self.get_all_interests()])
+        return [float(score) for score in scores[:, 0]]
+    
+    def calculate_relevance_profiles(self, trends: List[Dict], interest_lists: List[List[str]]) -> np.ndarray:
+        """Relevance of each trend to each interest list, shape (trends, lists), from one stacked product"""
+        scores = np.full((len(trends), len(interest_lists)), 0.5)
+        backend = self.embedding_backend()
+        if backend is None:
+            return scores
         
         try:
-            # Get your interests from config
-            your_interests = self.config.get('your_interests', {})
-            all_interests = []
-            for category, interests in your_interests.items():
-                all_interests.extend(interests)
+            stacked = [interest for interests in interest_lists for interest in interests]
+            if not stacked or not trends:
+                return scores
             
-            if not all_interests:
-                return 0.5
+            tech_texts = [f"{trend['name']} {trend.get('description', '')}" for trend in trends]
             
-            tech_text = f"{tech_data['name']} {tech_data.get('description', '')}"
-            
-            # Calculate similarity with your interests
-            max_similarity = 0.0
-            for interest in all_interests:
-                if 'sentence_transformer' in AI_MODELS:
-                    # Use AI embeddings
-                    tech_embedding = AI_MODELS['sentence_transformer'].encode([tech_text])
-                    interest_embedding = AI_MODELS['sentence_transformer'].encode([interest])
-                    if 'sklearn' in AI_MODELS:
-                        similarity = cosine_similarity(tech_embedding, interest_embedding)[0][0]
-                        max_similarity = max(max_similarity, similarity)
+            if backend == 'minilm':
+                # One batched encode for the trends, one matrix for every list of interests
+                tech_matrix = self.encode_texts(tech_texts)
+                # The updater's own interests are the cached list itself, so no list is compared
+                if len(interest_lists) == 1 and interest_lists[0] is self.get_all_interests():
+                    index = self.get_interest_index(tech_matrix)
+                    if index is not None:
+                        # Large interest sets: the best match comes from a top-1 index query
+                        best, _ = index.query(tech_matrix, k=1)
+                        scores[:, 0] = np.maximum(best[:, 0], 0.0)
+                        return scores
+                    kernel = self.get_interest_kernel()
                 else:
-                    # Use simple similarity
-                    similarity = self.simple_similarity(tech_text, interest)
-                    max_similarity = max(max_similarity, similarity)
+                    kernel = self.make_similarity_kernel(self.encode_texts(stacked))
+                similarities = kernel.scores(tech_matrix)
+            else:
+                # Sparse TF-IDF dot products: only features a trend shares with an interest are touched
+                similarities = self.get_hashed_embedder().similarity(tech_texts, stacked)
             
-            return float(max_similarity)
+            # Max similarity within each list's block of columns
+            offset = 0
+            for column, interests in enumerate(interest_lists):
+                if interests:
+                    block = similarities[:, offset:offset + len(interests)]
+                    scores[:, column] = np.maximum(block.max(axis=1), 0.0)
+                offset += len(interests)
+            return scores
             
         except Exception as e:
             print(f"Error calculating relevance: {e}")
-            return 0.5
+            return scores
     
     def enhance_trend_with_ai(self, trend: Dict) -> Dict:
         """Enhance a single trend with AI analysis"""
@@ -358,14 +711,311 @@ class AITechRadarUpdaterFixed:
         
         return enhanced
     
-    def generate_enhanced_radar(self, trends: List[Dict]) -> Dict[str, List[str]]:
-        """Generate enhanced tech radar"""
+    def trend_key(self, trend: Dict) -> str:
+        """Identity of a trend across runs: repo full name or SO tag name"""
+        return trend.get('full_name', trend['name'])
+    
+    def trend_fingerprint(self, trend: Dict) -> str:
+        """Hash of the fields that feed the scoring models"""
+        content = json.dumps([trend['name'], trend.get('description', ''), trend.get('topics', [])])
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+    
+    def scoring_signature(self) -> str:
+        """Hash of the settings that change scores, so stale scores are never reused"""
+        settings = {
+            "model": self.embedding_model_name(),
+            "backends": self.models.enabled,
+            "interests": self.config.get('your_interests', {}),
+            "interest_documents": self.interest_key() if self.config.get('interest_documents') else None,
+            "quantization": self.quantization_mode(),
+            "categorization_method": self.config.get('categorization_method', 'keywords'),
+            "categorization_rules": self.config.get('categorization_rules', {}),
+            "category_prototypes": self.config.get('category_prototypes', self.DEFAULT_CATEGORY_PROTOTYPES),
+            "topic_model": self.topic_model_id(),
+        }
+        return hashlib.sha1(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()
+    
+    def load_reusable_scores(self) -> Dict[str, Dict]:
+        """Index the previous snapshot's scored trends by key, if scoring settings match"""
+        if not self.config.get('incremental_scoring', True):
+            return {}
         
-        # Sort by relevance and sentiment
-        trends.sort(key=lambda x: (x.get('relevance_score', 0.5), x.get('sentiment_score', 0)), reverse=True)
+        snapshot = self.load_previous_snapshot()
+        if snapshot.get('scoring_signature') != self.scoring_signature():
+            return {}
+        
+        # Only the fingerprint and scores are kept, so the index stays small for large snapshots
+        kept_fields = ('fingerprint',) + self.SCORE_FIELDS + self.OPTIONAL_SCORE_FIELDS
+        return {
+            self.trend_key(trend): {field: trend[field] for field in kept_fields if field in trend}
+            for trend in snapshot.get('trends', [])
+            if 'fingerprint' in trend and all(field in trend for field in self.SCORE_FIELDS)
+        }
+    
+    def get_scoring_pool(self) -> ParallelScorer:
+        """Process pool for CPU-bound scoring, or None when disabled"""
+        pool_config = self.config.get('parallel_scoring', {})
+        # Off unless enabled: below a machine-specific size the pool is slower than scoring in-process
+        if not pool_config.get('enabled', False):
+            return None
+        if self._scoring_pool is None:
+            self._scoring_pool = ParallelScorer(
+                self.config,
+                processes=pool_config.get('processes', 0),
+                min_batch=pool_config.get('min_batch', 2000),
+                start_method=pool_config.get('start_method', 'spawn')
+            )
+        return self._scoring_pool
+    
+    def score_in_pool(self, chunk_func, items: List, in_process, *args) -> List:
+        """Score items across the pool, or in-process when the batch is too small to pay for it"""
+        pool = self.get_scoring_pool()
+        if pool is None or not pool.worth_it(len(items)):
+            return in_process(items)
+        
+        try:
+            return pool.map(chunk_func, items, *args)
+        except Exception as e:
+            print(f"⚠️  Scoring pool failed, scoring in-process: {e}")
+            pool.close()
+            return in_process(items)
+    
+    def close_scoring_pool(self):
+        """Stop the scoring worker processes"""
+        if self._scoring_pool is not None:
+            self._scoring_pool.close()
+    
+    def score_trends(self, to_score: List[Dict]):
+        """Categorize, score and assign topics to trends in place, one batched pass per stage"""
+        use_embeddings = self.config.get('categorization_method', 'keywords') == 'embeddings'
+        
+        # Keyword categories and domains come from a single scan per text
+        with self.metrics.stage("categorize", len(to_score)):
+            # Workers get the scanned texts only, not whole trend dicts
+            keyword_texts = [self.keyword_text(trend) for trend in to_score]
+            keyword_results = self.score_in_pool(categorize_chunk, keyword_texts, self.categorize_texts)
+            for enhanced, (category, domains) in zip(to_score, keyword_results):
+                if not use_embeddings:
+                    enhanced['ai_category'] = category
+                enhanced['domains'] = domains
+            
+            if use_embeddings:
+                for enhanced, (category, margin) in zip(to_score, self.ai_categorize_batch(to_score)):
+                    enhanced['ai_category'] = category
+                    if margin is not None:
+                        enhanced['category_margin'] = margin
+        
+        with self.metrics.stage("sentiment", len(to_score)):
+            descriptions = [f"{trend.get('name', '')} {trend.get('description', '')}" for trend in to_score]
+            use_vader = bool(to_score) and self.models.has('sentiment')
+            sentiments = self.score_in_pool(sentiment_chunk, descriptions, self.analyze_sentiment_batch, use_vader)
+            for enhanced, sentiment in zip(to_score, sentiments):
+                enhanced['sentiment_score'] = sentiment
+        
+        with self.metrics.stage("relevance", len(to_score)):
+            relevance_scores = self.calculate_relevance_batch(to_score)
+            for enhanced, relevance in zip(to_score, relevance_scores):
+                enhanced['relevance_score'] = relevance
+        
+        # Only new or changed trends get a topic here; the centroids move once per run in fit_topics
+        with self.metrics.stage("cluster", len(to_score)):
+            self.assign_topics(to_score)
+    
+    def enhance_trends_with_ai(self, trends: List[Dict], incremental: bool = True,
+                               previous: Dict[str, Dict] = None) -> List[Dict]:
+        """Enhance a batch of trends, scoring only new or changed items
+        
+        Streaming callers pass the reusable scores once instead of re-reading the snapshot per batch.
+        A trend that cannot be scored is logged and kept unscored, as the per-trend loop always did.
+        """
+        report = previous is None
+        if previous is None:
+            previous = self.load_reusable_scores() if incremental else {}
+        score_fields = self.SCORE_FIELDS + self.OPTIONAL_SCORE_FIELDS
+        enhanced_trends = []
+        to_score = []
+        originals = {}
+        reused = 0
+        for trend in trends:
+            try:
+                # Scores a trend arrives with are never trusted as-is; reuse only goes through the
+                # signature-checked index, so a settings change always recomputes
+                enhanced = {field: value for field, value in trend.items() if field not in score_fields}
+                fingerprint = self.trend_fingerprint(trend)
+                enhanced['fingerprint'] = fingerprint
+                old_trend = previous.get(self.trend_key(trend))
+            except Exception as e:
+                print(f"⚠️  Error enhancing trend {trend.get('name', 'unknown')}: {e}")
+                enhanced_trends.append(trend)
+                continue
+            enhanced_trends.append(enhanced)
+            
+            if old_trend is not None and old_trend['fingerprint'] == fingerprint:
+                for field in score_fields:
+                    if field in old_trend:
+                        enhanced[field] = old_trend[field]
+                reused += 1
+                continue
+            
+            to_score.append(enhanced)
+            originals[id(enhanced)] = trend
+        
+        try:
+            self.score_trends(to_score)
+        except Exception as e:
+            # A batch stage failed: rescore trend by trend so only the malformed ones stay unscored
+            print(f"⚠️  Batch scoring failed, retrying trend by trend: {e}")
+            first_record = len(self.metrics.records)
+            failed = set()
+            for enhanced in to_score:
+                try:
+                    self.score_trends([enhanced])
+                except Exception as e:
+                    print(f"⚠️  Error enhancing trend {enhanced.get('name', 'unknown')}: {e}")
+                    failed.add(id(enhanced))
+            self.metrics.collapse(first_record)
+            enhanced_trends = [originals[id(trend)] if id(trend) in failed else trend for trend in enhanced_trends]
+            to_score = [trend for trend in to_score if id(trend) not in failed]
+        self.rescored_trends = to_score
+        
+        if incremental:
+            self.scoring_stats = {"reused": reused, "recomputed": len(trends) - reused}
+            if report:
+                print(f"♻️  Incremental scoring: {reused} reused, {len(trends) - reused} recomputed")
+        
+        return enhanced_trends
+    
+    def record_history(self, trends: List[Dict]):
+        """Append this run's fetched trends to the history and compact old partitions"""
+        if self.history is None:
+            return
+        
+        try:
+            with self.metrics.stage("history", len(trends)):
+                appended = self.history.append({self.trend_key(trend): trend for trend in trends}, save=False)
+        except Exception as e:
+            print(f"⚠️  Error recording trend history: {e}")
+            return
+        self.save_history(appended)
+    
+    def save_history(self, appended: int):
+        """Save the history aggregates and compact old partitions once appending is done"""
+        try:
+            with self.metrics.stage("history_save"):
+                self.history.save()
+                compact_after = self.config.get('history', {}).get('compact_after_days', 60)
+                self.history.compact(datetime.now().date() - timedelta(days=compact_after))
+            print(f"🗂️  Trend history: {appended} observations appended, "
+                  f"{len(self.history.aggregates)} trends tracked")
+        except Exception as e:
+            print(f"⚠️  Error saving trend history: {e}")
+    
+    def attach_history_features(self, trends: List[Dict]):
+        """Add star velocity, days on list and momentum from the history aggregates"""
+        if self.history is None:
+            return
+        for trend in trends:
+            trend.update(self.history.features(self.trend_key(trend)))
+    
+    def ranking_score(self, trend: Dict) -> float:
+        """Relevance boosted by star momentum from the history"""
+        weight = self.config.get('history', {}).get('momentum_weight', 0.1)
+        return trend.get('relevance_score', 0.5) + weight * trend.get('momentum', 0.0)
+    
+    def get_topic_clusterer(self) -> TopicClusterer:
+        """Topic clusterer resumed from saved centroids, or None without an embedding model"""
+        cluster_config = self.config.get('topic_clusters', {})
+        if not cluster_config.get('enabled', True) or self.embedding_backend() is None:
+            return None
+        if self._topic_clusterer is None:
+            self._topic_clusterer = TopicClusterer(
+                n_clusters=cluster_config.get('n_clusters', 12),
+                batch_size=cluster_config.get('batch_size', 1024),
+                iterations=cluster_config.get('iterations', 20),
+                decay=cluster_config.get('decay', 0.5)
+            )
+            self._topic_clusterer.load(self.topic_centroids_path(), self.embedding_model_name())
+        return self._topic_clusterer
+    
+    def topic_centroids_path(self) -> pathlib.Path:
+        return self.root / self.config.get('topic_clusters', {}).get('path', 'data/topic_clusters/centroids.npz')
+    
+    def topic_model_id(self) -> str:
+        """Identity of the current centroids, part of the scoring signature"""
+        clusterer = self.get_topic_clusterer()
+        return clusterer.model_id if clusterer is not None else None
+    
+    def topic_texts(self, trends: List[Dict]) -> List[str]:
+        return [f"{trend.get('name', '')} {trend.get('description', '')}" for trend in trends]
+    
+    def assign_topics(self, trends: List[Dict]):
+        """Assign each trend its nearest topic without moving the centroids"""
+        clusterer = self.get_topic_clusterer()
+        if clusterer is None or not trends:
+            return
+        
+        try:
+            embeddings = self.encode_texts(self.topic_texts(trends))
+            for trend, topic in zip(trends, clusterer.assign(embeddings)):
+                if topic >= 0:
+                    trend['topic'] = int(topic)
+        except Exception as e:
+            print(f"Error clustering topics: {e}")
+    
+    def fit_topics(self, trends: List[Dict]):
+        """Update the centroids once with a run's new or changed trends
+        
+        Unchanged trends keep their carried-over topic and scored ones keep the topic assign_topics
+        gave them; only trends still without one (the run that seeds the centroids) are assigned here.
+        Ad-hoc scoring (worker requests, streaming batches) only calls assign_topics, so the
+        centroids and their decaying counts advance exactly once per update.
+        """
+        clusterer = self.get_topic_clusterer()
+        if clusterer is None or not trends:
+            return
+        
+        try:
+            # Encoded in chunks: only the dense embeddings of the whole fit set are held at once
+            texts = self.topic_texts(trends)
+            embeddings = np.concatenate([
+                self.encode_texts(texts[start:start + self.TABLE_BATCH_SIZE])
+                for start in range(0, len(texts), self.TABLE_BATCH_SIZE)
+            ])
+            clusterer.partial_fit(embeddings)
+            unassigned = [index for index, trend in enumerate(trends) if 'topic' not in trend]
+            if unassigned:
+                topics = clusterer.assign(embeddings[unassigned])
+                for index, topic in zip(unassigned, topics):
+                    if topic >= 0:
+                        trends[index]['topic'] = int(topic)
+        except Exception as e:
+            print(f"Error clustering topics: {e}")
+    
+    def save_topic_clusters(self):
+        """Persist the centroids for the next run"""
+        if self._topic_clusterer is None:
+            return
+        try:
+            self._topic_clusterer.save(self.topic_centroids_path(), self.embedding_model_name())
+        except Exception as e:
+            print(f"⚠️  Error saving topic centroids: {e}")
+    
+    def generate_enhanced_radar(self, trends) -> Dict[str, List[str]]:
+        """Generate enhanced tech radar from a list of trends or a TrendTable"""
+        
+        # Sort by relevance (with momentum) and sentiment
+        if isinstance(trends, TrendTable):
+            trends = trends.records(self.radar_order(trends))
+        else:
+            trends.sort(key=lambda x: (self.ranking_score(x), x.get('sentiment_score', 0)), reverse=True)
         
         # Initialize categories
         categorized = {cat: [] for cat in self.categories}
+        seen_names = {cat: set() for cat in self.categories}
+        
+        # Each topic contributes its best-ranked trends only, so one busy topic cannot fill a category
+        per_topic = self.config.get('topic_clusters', {}).get('per_topic', 1)
+        topic_counts = {cat: Counter() for cat in self.categories}
         
         # Categorize technologies
         for trend in trends:
@@ -386,8 +1036,19 @@ class AITechRadarUpdaterFixed:
                 if sentiment > 0.3:
                     tech_name += " ⭐"  # Positive sentiment
                 
-                if tech_name not in [item.split("**")[1] if "**" in item else item for item in categorized[category]]:
+                topic = trend.get('topic')
+                if topic is not None and topic_counts[category][topic] >= per_topic:
+                    continue
+                
+                if trend["name"] not in seen_names[category]:
+                    seen_names[category].add(trend["name"])
                     categorized[category].append(tech_name)
+                    if topic is not None:
+                        topic_counts[category][topic] += 1
+                
+                # Only the top few per category reach the radar
+                if all(len(items) >= self.RADAR_CANDIDATES for items in categorized.values()):
+                    break
         
         # Add current tech to maintain consistency
         current_tech = {
@@ -415,7 +1076,7 @@ class AITechRadarUpdaterFixed:
         # Merge enhanced insights with current tech
         for category in self.categories:
             current_items = current_tech.get(category, [])
-            enhanced_items = categorized[category][:3]
+            enhanced_items = categorized[category][:self.RADAR_CANDIDATES]
             
             keep_count = max(1, len(current_items) // 2)
             final_items = current_items[:keep_count] + enhanced_items[:2]
@@ -424,17 +1085,8 @@ class AITechRadarUpdaterFixed:
         
         return categorized
     
-    def update_readme_tech_radar(self, tech_radar: Dict[str, List[str]]):
-        """Update the tech radar section in README.md"""
-        
-        if not self.readme_path.exists():
-            print("README.md not found!")
-            return
-        
-        # Read current README
-        content = self.readme_path.read_text()
-        
-        # Generate new tech radar content
+    def render_tech_radar(self, tech_radar: Dict[str, List[str]]) -> str:
+        """Render the tech radar section as Markdown"""
         new_radar_content = "### Tech Radar 🤖\n"
         new_radar_content += "*AI-enhanced categorization updated every 2 weeks*\n\n"
         
@@ -452,24 +1104,76 @@ class AITechRadarUpdaterFixed:
             
             new_radar_content += "</details>\n\n"
         
-        # Replace existing tech radar section
-        pattern = r"(### Tech Radar.*?\n)(.*?)(### Focus\n)"
-        replacement = rf"\1{new_radar_content}\3"
+        return new_radar_content
+    
+    def radar_order(self, table: TrendTable) -> np.ndarray:
+        """Row order by descending ranking score then sentiment, stable for ties"""
+        def column(name: str, default: float) -> np.ndarray:
+            if name not in table.numeric:
+                return np.full(len(table), default)
+            return np.where(table.present[name], table.numeric[name], default)
         
-        updated_content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+        weight = self.config.get('history', {}).get('momentum_weight', 0.1)
+        ranking = column('relevance_score', 0.5) + weight * column('momentum', 0.0)
+        return np.lexsort((-column('sentiment_score', 0.0), -ranking))
+    
+    def update_readme_tech_radar(self, tech_radar: Dict[str, List[str]]):
+        """Update the tech radar section in README.md"""
         
-        # Write updated content
-        self.readme_path.write_text(updated_content)
-        print("✅ Enhanced tech radar updated successfully!")
+        if self.radar_path is not None:
+            # Profiles without a README get a standalone radar file
+            if write_if_changed(self.radar_path, self.render_tech_radar(tech_radar)):
+                print(f"✅ Tech radar written to {self.radar_path}")
+            else:
+                print(f"⏭️  Tech radar at {self.radar_path} unchanged")
+            return
+        
+        if not self.readme_path.exists():
+            print("README.md not found!")
+            return
+        
+        # The section is re-rendered only when the radar differs from the one it was built from
+        renderer = ReadmeRenderer(self.readme_path)
+        outcomes = renderer.update(
+            {"TECH_RADAR": (tech_radar, self.render_tech_radar)},
+            # READMEs from before the markers: adopt the old section up to the next heading
+            legacy_patterns={"TECH_RADAR": r"^### Tech Radar.*?(?=^### |\Z)"}
+        )
+        if renderer.written:
+            print(f"✅ Enhanced tech radar updated successfully! ({outcomes['TECH_RADAR']})")
+        else:
+            print("⏭️  Tech radar section unchanged - README not rewritten")
+    
+    def snapshot_metadata(self) -> Dict:
+        """Run-level fields shared by every snapshot format"""
+        return {
+            "last_updated": datetime.now().isoformat(),
+            # Asks the embedding backend rather than probing torch, which the hashed backend never loads
+            "ai_enhanced": self.embedding_backend() == 'minilm',
+            "ai_models_used": self.models.loaded_models(),
+            "model_load_times": self.models.report(),
+            "scoring_signature": self.scoring_signature(),
+            "scoring_stats": self.scoring_stats,
+        }
     
-    def save_enhanced_tech_data(self, trends: List[Dict]):
-        """Save enhanced tech trends data"""
-        self.tech_data_path.parent.mkdir(exist_ok=True)
+    def save_enhanced_tech_data(self, trends):
+        """Save enhanced tech trends data as JSON, JSONL or a columnar table"""
+        self.tech_data_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if self.snapshot_format == 'columnar':
+            self.save_trend_table(trends)
+            return
+        
+        if self.snapshot_format == 'jsonl':
+            writer = JsonlSnapshotWriter(self.tech_jsonl_path)
+            for trend in trends:
+                writer.write(trend)
+            writer.commit(self.snapshot_metadata())
+            print(f"📊 Saved {writer.count} enhanced tech trends")
+            return
         
         data = {
-            "last_updated": datetime.now().isoformat(),
-            "ai_enhanced": AI_AVAILABLE,
-            "ai_models_used": list(AI_MODELS.keys()),
+            **self.snapshot_metadata(),
             "total_trends": len(trends),
             "trends": trends,
             "insights": {
@@ -482,100 +1186,272 @@ class AITechRadarUpdaterFixed:
         self.tech_data_path.write_text(json.dumps(data, indent=2, default=str))
         print(f"📊 Saved {len(trends)} enhanced tech trends")
     
-    def should_update_radar(self) -> bool:
-        """Check if radar should be updated based on changes"""
+    def save_trend_table(self, trends):
+        """Save the snapshot as a columnar table with its summary as metadata"""
+        table = trends if isinstance(trends, TrendTable) else TrendTable.from_records(trends)
+        relevance = table.numeric.get('relevance_score', np.array([0.5]))
+        sentiment = table.numeric.get('sentiment_score', np.array([0.0]))
+        categories = table.category_column('ai_category') if 'ai_category' in table.codes else []
+        
+        metadata = {
+            **self.snapshot_metadata(),
+            "total_trends": len(table),
+            "insights": {
+                "avg_sentiment": float(np.mean(sentiment)),
+                "avg_relevance": float(np.mean(relevance)),
+                "categories_distribution": dict(Counter(categories))
+            }
+        }
+        table.save(self.tech_table_path, metadata)
+        print(f"📊 Saved {len(table)} enhanced tech trends")
+    
+    def score_trend_table(self, table: TrendTable) -> TrendTable:
+        """Score a table of fetched trends batch by batch, writing scores straight into its columns
+        
+        Only one batch of trend dicts exists at a time; embeddings are stored too once the model is loaded.
+        """
+        previous = self.load_reusable_scores() if self.config.get('incremental_scoring', True) else {}
+        columns = ('fingerprint',) + self.SCORE_FIELDS + self.OPTIONAL_SCORE_FIELDS + self.HISTORY_FIELDS
+        stats = Counter()
+        fit_rows = []
+        fit_trends = []
+        first_record = len(self.metrics.records)
+        for start in range(0, len(table), self.TABLE_BATCH_SIZE):
+            rows = range(start, min(start + self.TABLE_BATCH_SIZE, len(table)))
+            enhanced = self.enhance_trends_with_ai([table.record(row) for row in rows], previous=previous)
+            self.attach_history_features(enhanced)
+            table.fill(rows, enhanced, columns)
+            stats.update(self.scoring_stats)
+            
+            # Only new or changed trends move the centroids, as in the list pipeline
+            rescored = {id(trend) for trend in self.rescored_trends}
+            for row, trend in zip(rows, enhanced):
+                if id(trend) in rescored:
+                    fit_rows.append(row)
+                    fit_trends.append({field: trend[field] for field in ('name', 'description', 'topic') if field in trend})
+            
+            if 'sentence_transformer' in self.models.models and (start == 0 or table.embeddings is not None):
+                embeddings = self.encode_texts([f"{trend['name']} {trend.get('description', '')}" for trend in enhanced])
+                if table.embeddings is None:
+                    table.embeddings = np.zeros((len(table), embeddings.shape[1]), dtype=np.float16)
+                table.embeddings[rows.start:rows.stop] = embeddings
+        # One record per stage instead of one per batch
+        self.metrics.collapse(first_record)
+        table.seal()
+        
+        self.scoring_stats = {"reused": stats["reused"], "recomputed": stats["recomputed"]}
+        print(f"♻️  Incremental scoring: {stats['reused']} reused, {stats['recomputed']} recomputed")
+        
+        with self.metrics.stage("cluster_fit", len(fit_trends)):
+            self.fit_topics(fit_trends)
+        table.fill(fit_rows, fit_trends, ('topic',))
+        return table
+    
+    def save_embedding_cache(self):
+        """Persist newly computed embeddings and report cache usage"""
+        if self.embedding_cache is None:
+            return
+        
+        try:
+            self.embedding_cache.save()
+            stats = self.embedding_cache.stats()
+            print(f"🧠 Embedding cache: {stats['hits']} hits, {stats['misses']} misses, "
+                  f"{stats['entries']} entries")
+        except Exception as e:
+            print(f"⚠️  Error saving embedding cache: {e}")
+    
+    def flush_metrics(self):
+        """Record model load times, print the stage summary and write the metrics file"""
+        for name, status in self.models.report().items():
+            if name not in self.recorded_model_loads:
+                self.metrics.record(f"model_load:{name}", status["seconds"], loaded=status["loaded"])
+                self.recorded_model_loads.add(name)
+        
+        if self.metrics.records:
+            print("⏱️  Stage timings:")
+            print(self.metrics.summary())
+        self.metrics.flush()
+    
+    def recently_updated(self, old_data: Dict) -> bool:
+        """Whether the previous snapshot is newer than update_frequency_days"""
+        last_updated = datetime.fromisoformat(old_data.get('last_updated', '2020-01-01'))
+        days_since_update = (datetime.now() - last_updated).days
+        if days_since_update < self.load_config().get('update_frequency_days', 1):
+            print(f"⏰ Last update was {days_since_update} days ago - skipping")
+            return True
+        return False
+    
+    def changes_warrant_update(self, old_names: set, new_names: set) -> bool:
+        """Compare trend names between runs against the configured change thresholds"""
         config = self.load_config()
-        data_file = self.root / "data" / "tech_trends_ai_fixed.json"
+        new_additions = len(new_names - old_names)
+        removed_items = len(old_names - new_names)
+        total_changes = new_additions + removed_items
+        
+        # Check if changes meet threshold
+        min_changes = config.get('min_changes_for_update', 3)
+        change_percentage = (total_changes / max(len(old_names), 1)) * 100
+        threshold = config.get('change_threshold_percentage', 5.0)
+        
+        print(f"📈 Change analysis:")
+        print(f"   - New additions: {new_additions}")
+        print(f"   - Removed items: {removed_items}")
+        print(f"   - Total changes: {total_changes}")
+        print(f"   - Change percentage: {change_percentage:.1f}%")
+        print(f"   - Threshold: {threshold}%")
+        
+        if total_changes >= min_changes or change_percentage >= threshold:
+            print(f"✅ Changes detected - update needed")
+            return True
+        else:
+            print(f"⏭️  Insufficient changes - skipping update")
+            return False
+    
+    def should_update_radar(self) -> bool:
+        """Check if radar should be updated based on changes in the raw fetched trends"""
+        old_data = self.load_previous_snapshot()
         
-        if not data_file.exists():
+        if not old_data:
             print("📊 No previous data found - initial update needed")
             return True
         
         try:
-            with open(data_file, 'r') as f:
-                old_data = json.load(f)
-            
-            last_updated = datetime.fromisoformat(old_data.get('last_updated', '2020-01-01'))
-            days_since_update = (datetime.now() - last_updated).days
-            
             # Check if enough time has passed
-            if days_since_update < config.get('update_frequency_days', 1):
-                print(f"⏰ Last update was {days_since_update} days ago - skipping")
+            if self.recently_updated(old_data):
                 return False
             
-            # Fetch new data to compare
+            # Fetch new data to compare; run() reuses it so nothing is fetched twice
             new_trends = self.fetch_all_trends()
-            old_trends = old_data.get('trends', [])
+            self.fetched_trends = new_trends
+            self.record_history(new_trends)
             
             # Calculate changes
             new_names = {trend['name'] for trend in new_trends}
-            old_names = {trend['name'] for trend in old_trends}
-            
-            new_additions = len(new_names - old_names)
-            removed_items = len(old_names - new_names)
-            total_changes = new_additions + removed_items
-            
-            # Check if changes meet threshold
-            min_changes = config.get('min_changes_for_update', 3)
-            change_percentage = (total_changes / max(len(old_names), 1)) * 100
-            threshold = config.get('change_threshold_percentage', 5.0)
-            
-            print(f"📈 Change analysis:")
-            print(f"   - New additions: {new_additions}")
-            print(f"   - Removed items: {removed_items}")
-            print(f"   - Total changes: {total_changes}")
-            print(f"   - Change percentage: {change_percentage:.1f}%")
-            print(f"   - Threshold: {threshold}%")
-            
-            if total_changes >= min_changes or change_percentage >= threshold:
-                print(f"✅ Changes detected - update needed")
-                return True
-            else:
-                print(f"⏭️  Insufficient changes - skipping update")
-                return False
+            old_names = {trend['name'] for trend in old_data.get('trends', [])}
+            return self.changes_warrant_update(old_names, new_names)
                 
         except Exception as e:
             print(f"⚠️  Error checking for updates: {e}")
             return True  # Update on error to be safe
     
+    def run_streaming(self):
+        """Run the update as a stream of fetch pages, with memory bounded by batch and heap sizes"""
+        print("🚀 Starting streaming AI-Enhanced Tech Radar Auto-Update...")
+        stream_config = self.config.get('streaming', {})
+        # Streaming writes its snapshot line by line; the previous one is read in whatever format it was saved
+        self.snapshot_format = 'jsonl'
+        pipeline = StreamingRadarPipeline(
+            self,
+            batch_size=stream_config.get('batch_size', 256),
+            heap_size=stream_config.get('radar_heap_size', 64),
+            topic_sample_size=stream_config.get('topic_sample_size', 4096)
+        )
+        updated = pipeline.run()
+        self.save_embedding_cache()
+        self.save_topic_clusters()
+        self.close_scoring_pool()
+        self.flush_metrics()
+        
+        if updated:
+            print("🎉 Enhanced tech radar auto-update completed!")
+        else:
+            print("🎯 No meaningful changes detected - radar is up to date!")
+    
     def run(self):
         """Run the enhanced tech radar update"""
+        if self.config.get('streaming', {}).get('enabled', False):
+            self.run_streaming()
+            return
+        
         print("🚀 Starting Smart AI-Enhanced Tech Radar Auto-Update...")
-        print(f"🤖 AI Available: {AI_AVAILABLE}")
-        print(f"🤖 AI Models: {list(AI_MODELS.keys())}")
         
         # Check if update is needed
         if not self.should_update_radar():
             print("🎯 No meaningful changes detected - radar is up to date!")
+            self.flush_metrics()
             return
         
-        # Proceed with update
-        trends = self.fetch_all_trends()
+        # Proceed with update, reusing the snapshot fetched by the change check
+        trends = self.fetched_trends
+        if trends is None:
+            trends = self.fetch_all_trends()
+            self.record_history(trends)
         print(f"📈 Found {len(trends)} unique tech trends")
         
-        # Process trends with AI enhancement
-        enhanced_trends = []
-        for trend in trends:
-            try:
-                enhanced_trend = self.enhance_trend_with_ai(trend)
-                enhanced_trends.append(enhanced_trend)
-            except Exception as e:
-                print(f"⚠️  Error enhancing trend {trend.get('name', 'unknown')}: {e}")
-                enhanced_trends.append(trend)
+        if self.snapshot_format == 'columnar':
+            # The table takes over the fetched fields, then the scorers fill its columns batch by batch
+            radar_input = TrendTable.from_records(trends, exclude=self.SCORE_FIELDS + self.OPTIONAL_SCORE_FIELDS)
+            trends = self.fetched_trends = None
+            self.score_trend_table(radar_input)
+        else:
+            # Process trends with AI enhancement
+            radar_input = self.enhance_trends_with_ai(trends)
+            self.attach_history_features(radar_input)
+            with self.metrics.stage("cluster_fit", len(self.rescored_trends)):
+                self.fit_topics(self.rescored_trends)
         
         # Generate radar content
-        radar_content = self.generate_enhanced_radar(enhanced_trends)
+        with self.metrics.stage("radar", len(radar_input)):
+            radar_content = self.generate_enhanced_radar(radar_input)
         
         # Update README
-        self.update_readme_tech_radar(radar_content)
+        with self.metrics.stage("readme"):
+            self.update_readme_tech_radar(radar_content)
         
         # Save enhanced data
-        self.save_enhanced_tech_data(enhanced_trends)
+        with self.metrics.stage("snapshot", len(radar_input)):
+            self.save_enhanced_tech_data(radar_input)
+        self.save_embedding_cache()
+        self.save_topic_clusters()
+        self.close_scoring_pool()
+        self.flush_metrics()
         
         print("✅ Enhanced tech radar updated successfully!")
-        print(f"📊 Saved {len(enhanced_trends)} enhanced tech trends")
+        print(f"📊 Saved {len(radar_input)} enhanced tech trends")
+        print(f"🤖 AI Models: {self.models.loaded_models()}")
         print("🎉 Enhanced tech radar auto-update completed!")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AI-enhanced tech radar updater")
+    parser.add_argument("--serve", action="store_true", help="run as a warm worker with a local HTTP API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--profiles", nargs="+", type=pathlib.Path, metavar="CONFIG",
+                        help="generate one radar per config file from a single shared fetch")
+    parser.add_argument("--profile", choices=["cprofile", "pyinstrument"],
+                        help="capture a profile of the run under data/metrics")
+    parser.add_argument("--stream", action="store_true",
+                        help="stream fetch pages through scoring and write a JSONL snapshot")
+    parser.add_argument("--export-idf-corpus", type=pathlib.Path, metavar="PATH",
+                        help="write the current snapshot's trend texts as the hashed backend's IDF corpus")
+    args = parser.parse_args()
+    
+    if args.profiles:
+        from multi_profile import MultiProfileRadar
+        multi = MultiProfileRadar(args.profiles)
+        if args.profile:
+            profile_call(multi.run, args.profile, multi.base.root / "data" / "metrics")
+        else:
+            multi.run()
+        raise SystemExit(0)
+    
     updater = AITechRadarUpdaterFixed()
-    updater.run()
+    if args.export_idf_corpus:
+        count = updater.export_idf_corpus(args.export_idf_corpus)
+        print(f"📚 Exported {count} documents to {args.export_idf_corpus}")
+        raise SystemExit(0)
+    if args.stream:
+        updater.config.setdefault('streaming', {})['enabled'] = True
+    if args.serve:
+        from radar_worker import RadarWorker
+        worker_config = updater.config.get('worker', {})
+        RadarWorker(
+            updater,
+            batch_window_ms=worker_config.get('batch_window_ms', 20),
+            max_batch=worker_config.get('max_batch', 256),
+            cache_flush_batches=worker_config.get('cache_flush_batches', 10)
+        ).serve(args.host, args.port)
+    elif args.profile:
+        profile_call(updater.run, args.profile, updater.root / "data" / "metrics")
+    else:
+        updater.run()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Vector indexes for interest matching in the tech radar
+Exact NumPy search, an IVF index in pure NumPy, and HNSW when hnswlib is installed
+"""
+
+import json
+import pathlib
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from quantized_similarity import QuantizedMatrix, SimilarityKernel
+from topic_clusters import TopicClusterer
+
+# Queries scored per matrix product, bounding the temporary score matrix
+QUERY_CHUNK = 4096
+
+
+def merge_top_k(scores: np.ndarray, ids: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Best k (score, id) pairs per row, sorted by descending score"""
+    k = min(k, scores.shape[1])
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    top_ids = np.take_along_axis(ids, top, axis=1)
+    order = np.argsort(-top_scores, axis=1)
+    return np.take_along_axis(top_scores, order, axis=1), np.take_along_axis(top_ids, order, axis=1)
+
+
+class ExactIndex:
+    """Brute-force inner-product search; the reference the approximate indexes are measured against"""
+    kind = "exact"
+
+    def __init__(self, quantization: str = "none", **params):
+        self.quantization = quantization
+        self.vectors: Optional[QuantizedMatrix] = None
+        self.kernel: Optional[SimilarityKernel] = None
+
+    def __len__(self) -> int:
+        return 0 if self.vectors is None else len(self.vectors)
+
+    def build(self, vectors: np.ndarray):
+        self.vectors = QuantizedMatrix.from_float(vectors, self.quantization)
+        self.kernel = SimilarityKernel(self.vectors)
+
+    def query(self, queries: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-k (scores, ids) for each query, shape (queries, k)"""
+        k = min(k, len(self))
+        scores = np.empty((len(queries), k), dtype=np.float32)
+        ids = np.empty((len(queries), k), dtype=np.int64)
+        for start in range(0, len(queries), QUERY_CHUNK):
+            chunk = self.kernel.scores(queries[start:start + QUERY_CHUNK])
+            chunk_ids = np.broadcast_to(np.arange(len(self)), chunk.shape)
+            scores[start:start + QUERY_CHUNK], ids[start:start + QUERY_CHUNK] = merge_top_k(chunk, chunk_ids, k)
+        return scores, ids
+
+    def save(self, path: pathlib.Path):
+        np.save(path / "vectors.npy", self.vectors.data)
+        if self.vectors.scales is not None:
+            np.save(path / "scales.npy", self.vectors.scales)
+
+    def load(self, path: pathlib.Path):
+        scales = np.load(path / "scales.npy") if self.quantization == "int8" else None
+        self.vectors = QuantizedMatrix(np.load(path / "vectors.npy"), scales, self.quantization)
+        self.kernel = SimilarityKernel(self.vectors)
+
+
+class IVFIndex:
+    """Inverted-file index: vectors bucketed by nearest coarse centroid, only nprobe buckets searched"""
+    kind = "ivf"
+
+    def __init__(self, nlist: int = 0, nprobe: int = 8, quantization: str = "none", **params):
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.quantization = quantization
+        self.centroids: Optional[np.ndarray] = None
+        # Vectors sorted by list, with ids mapping back to build order
+        self.vectors: Optional[QuantizedMatrix] = None
+        self.ids: Optional[np.ndarray] = None
+        self.offsets: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return 0 if self.vectors is None else len(self.vectors)
+
+    def build(self, vectors: np.ndarray):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        # About sqrt(n) lists keeps both the coarse and the fine search small
+        nlist = min(len(vectors), self.nlist or max(1, int(np.sqrt(len(vectors)))))
+        clusterer = TopicClusterer(n_clusters=nlist, iterations=25)
+        clusterer.partial_fit(vectors)
+        self.centroids = clusterer.centroids
+        labels = clusterer.assign(vectors)
+
+        order = np.argsort(labels, kind="stable")
+        self.vectors = QuantizedMatrix.from_float(vectors[order], self.quantization)
+        self.ids = order.astype(np.int64)
+        self.offsets = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=nlist), out=self.offsets[1:])
+
+    def query(self, queries: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate top-k (scores, ids); raise nprobe for recall, lower it for speed"""
+        queries = np.asarray(queries, dtype=np.float32)
+        k = min(k, len(self))
+        nprobe = min(self.nprobe, len(self.centroids))
+        probes = np.argpartition(-(queries @ self.centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+        best_scores, best_ids = self.search_lists(queries, probes, k)
+
+        # Probed lists holding fewer than k vectors leave -inf/-1 slots: scan every list for those queries
+        short = np.flatnonzero((best_ids < 0).any(axis=1))
+        if len(short):
+            all_lists = np.broadcast_to(np.arange(len(self.centroids)), (len(short), len(self.centroids)))
+            best_scores[short], best_ids[short] = self.search_lists(queries[short], all_lists, k)
+        return best_scores, best_ids
+
+    def search_lists(self, queries: np.ndarray, probes: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-k (scores, ids) per query over the lists it probes; unfilled slots stay -inf/-1"""
+        best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        best_ids = np.full((len(queries), k), -1, dtype=np.int64)
+        # One float32 buffer, sized for the longest list, receives each list's dequantized vectors
+        buffer = np.empty((int(np.diff(self.offsets).max()), self.vectors.dim), dtype=np.float32)
+        # Each list is scored once against every query that probes it
+        for list_id in range(len(self.centroids)):
+            start, end = self.offsets[list_id], self.offsets[list_id + 1]
+            if start == end:
+                continue
+            rows = np.flatnonzero((probes == list_id).any(axis=1))
+            if len(rows) == 0:
+                continue
+            scores = queries[rows] @ self.vectors.dequantize_into(start, end, buffer).T
+            ids = np.broadcast_to(self.ids[start:end], scores.shape)
+            best_scores[rows], best_ids[rows] = merge_top_k(
+                np.hstack([best_scores[rows], scores]), np.hstack([best_ids[rows], ids]), k
+            )
+        return best_scores, best_ids
+
+    def save(self, path: pathlib.Path):
+        scales = self.vectors.scales if self.vectors.scales is not None else np.zeros(0, dtype=np.float32)
+        np.savez(path / "ivf.npz", centroids=self.centroids, vectors=self.vectors.data, scales=scales,
+                 ids=self.ids, offsets=self.offsets)
+
+    def load(self, path: pathlib.Path):
+        data = np.load(path / "ivf.npz")
+        self.centroids = data["centroids"]
+        scales = data["scales"] if self.quantization == "int8" else None
+        self.vectors = QuantizedMatrix(data["vectors"], scales, self.quantization)
+        self.ids = data["ids"]
+        self.offsets = data["offsets"]
+
+
+class HNSWIndex:
+    """Graph index from the optional hnswlib package"""
+    kind = "hnsw"
+
+    def __init__(self, ef: int = 64, m: int = 16, ef_construction: int = 200, **params):
+        import hnswlib
+        self.hnswlib = hnswlib
+        self.ef = ef
+        self.m = m
+        self.ef_construction = ef_construction
+        self.index = None
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def build(self, vectors: np.ndarray):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self.size = len(vectors)
+        self.index = self.hnswlib.Index(space="ip", dim=vectors.shape[1])
+        self.index.init_index(max_elements=self.size, M=self.m, ef_construction=self.ef_construction)
+        self.index.add_items(vectors, np.arange(self.size))
+        self.index.set_ef(self.ef)
+
+    def query(self, queries: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate top-k (scores, ids); raise ef for recall, lower it for speed"""
+        labels, distances = self.index.knn_query(np.asarray(queries, dtype=np.float32), k=min(k, self.size))
+        # hnswlib's inner-product distance is 1 - dot
+        return (1 - distances).astype(np.float32), labels.astype(np.int64)
+
+    def save(self, path: pathlib.Path):
+        self.index.save_index(str(path / "hnsw.bin"))
+
+    def load(self, path: pathlib.Path):
+        manifest = json.loads((path / "manifest.json").read_text())
+        self.size = manifest["size"]
+        self.index = self.hnswlib.Index(space="ip", dim=manifest["dim"])
+        self.index.load_index(str(path / "hnsw.bin"), max_elements=self.size)
+        self.index.set_ef(self.ef)
+
+
+INDEX_TYPES = {
+    "exact": ExactIndex,
+    "ivf": IVFIndex,
+    "hnsw": HNSWIndex,
+}
+
+
+def make_index(kind: str, params: Dict):
+    """Instantiate an index type, falling back to exact search when its package is missing"""
+    try:
+        return INDEX_TYPES[kind](**params)
+    except ImportError as e:
+        print(f"⚠️  {kind} index unavailable ({e}) - using exact search")
+        return ExactIndex(quantization=params.get("quantization", "none"))
+
+
+def build_or_load(kind: str, params: Dict, vectors: np.ndarray, key: str, path: pathlib.Path,
+                  min_recall: float = 0.0, queries: Optional[np.ndarray] = None):
+    """Reuse the saved index when it was built from the same vectors and params, otherwise rebuild, check and save it
+
+    A rebuilt approximate index is compared with exact search on the given queries, topped up with perturbed
+    copies of its own vectors; below min_recall exact search answers instead, and the manifest records that
+    fallback so the same vectors and params skip the build and check next run. Search params such as nprobe
+    are part of the match too, since the recall check was only passed with them.
+    """
+    index = make_index(kind, params)
+    quantization = params.get("quantization", "none")
+    manifest_path = path / "manifest.json"
+    if manifest_path.exists():
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            if (manifest.get("key") == key and manifest.get("kind") == index.kind
+                    and manifest.get("params") == params):
+                if manifest.get("fallback") == "exact":
+                    print(f"ℹ️  {index.kind} index failed its recall check for these interests - using exact search")
+                    exact = ExactIndex(quantization=quantization)
+                    exact.build(vectors)
+                    return exact
+                index.load(path)
+                return index
+        except Exception as e:
+            print(f"⚠️  Saved {index.kind} index unreadable, rebuilding: {e}")
+
+    index.build(vectors)
+    path.mkdir(parents=True, exist_ok=True)
+    if index.kind != "exact" and min_recall > 0:
+        recall = check_recall(index, vectors, quantization, queries=queries)
+        if recall < min_recall:
+            print(f"⚠️  {index.kind} index recall@10 {recall} is below {min_recall} - using exact search")
+            manifest_path.write_text(json.dumps({
+                "key": key, "kind": index.kind, "params": params, "fallback": "exact", "recall": recall
+            }))
+            exact = ExactIndex(quantization=quantization)
+            exact.build(vectors)
+            return exact
+    index.save(path)
+    manifest_path.write_text(json.dumps({
+        "key": key, "kind": index.kind, "params": params, "size": len(vectors), "dim": int(vectors.shape[1])
+    }))
+    return index
+
+
+def recall_at_k(index, exact: ExactIndex, queries: np.ndarray, k: int = 10) -> Dict:
+    """Fraction of the exact top-k found by an index, with both query latencies"""
+    start = time.perf_counter()
+    _, found = index.query(queries, k)
+    index_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, expected = exact.query(queries, k)
+    exact_seconds = time.perf_counter() - start
+
+    hits = sum(len(set(row_found) & set(row_expected)) for row_found, row_expected in zip(found, expected))
+    return {
+        "recall": round(hits / expected.size, 4),
+        "index_seconds": round(index_seconds, 4),
+        "exact_seconds": round(exact_seconds, 4),
+    }
+
+
+def perturbed_queries(vectors: np.ndarray, sample: int = 256, seed: int = 0) -> np.ndarray:
+    """Sampled indexed vectors pushed off themselves by equal-norm noise, then renormalized
+
+    An indexed vector always finds itself through its own list, which would make recall look perfect.
+    """
+    rng = np.random.RandomState(seed)
+    rows = rng.choice(len(vectors), min(sample, len(vectors)), replace=False)
+    queries = np.asarray(vectors, dtype=np.float32)[rows]
+    noise = rng.randn(*queries.shape).astype(np.float32)
+    noise *= np.linalg.norm(queries, axis=1, keepdims=True) / np.linalg.norm(noise, axis=1, keepdims=True)
+    queries = queries + noise
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def check_recall(index, vectors: np.ndarray, quantization: str = "none", sample: int = 256, k: int = 10,
+                 seed: int = 0, queries: Optional[np.ndarray] = None) -> float:
+    """Recall@k of an index against exact search on up to `sample` queries
+
+    Real queries come first; perturbed copies of the indexed vectors fill the rest, so a run with a handful
+    of trends still measures recall over a full sample.
+    """
+    exact = ExactIndex(quantization=quantization)
+    exact.build(vectors)
+    if queries is None:
+        queries = np.empty((0, vectors.shape[1]), dtype=np.float32)
+    queries = np.asarray(queries, dtype=np.float32)[:sample]
+    if len(queries) < sample:
+        queries = np.vstack([queries, perturbed_queries(vectors, sample - len(queries), seed)])
+    return recall_at_k(index, exact, queries, k)["recall"]